@@ -13,10 +13,42 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     API_V1_PREFIX: str = "/api/v1"
     DEBUG: bool = True
+    METRICS_ENABLED: bool = True  # Prometheus /metrics (needs prometheus-client)
+    PUBLIC_BASE_URL: str  # public URL of this app, reachable by Twilio (webhooks, audio)
+    
+    # ===== Logging =====
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # "json" (one object per line) or "text"
+    LOG_SAMPLE_RATE: float = 1.0  # fraction of INFO/DEBUG lines kept (warnings/errors always)
+    LOG_QUEUE_SIZE: int = 10000  # records buffered for the writer thread before INFO/DEBUG are dropped
+    
+    # ===== Tracing (OpenTelemetry, optional) =====
+    TRACING_ENABLED: bool = False
+    TRACING_EXPORTER: str = "otlp"  # "otlp" (collector), "file" (JSON lines) or "console"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_SAMPLE_RATIO: float = 1.0  # fraction of new traces recorded
+    TRACING_SERVICE_NAME: str = "trufindai-backend"
+    
+    # ===== Admin / Profiler =====
+    ADMIN_API_KEY: Optional[str] = None  # X-Admin-Key; admin routes are off when unset
+    PROFILER_INTERVAL_MS: float = 5.0  # CPU time between stack samples (SIGPROF)
+    PROFILER_MAX_SECONDS: int = 60  # longest profiling window
+    PROFILER_KEEP: int = 20  # per-request profiles kept in memory
     
     # ===== MongoDB =====
     MONGODB_URL: str
     MONGODB_DB_NAME: str = "trufindai"
+    MONGODB_ENSURE_INDEXES: bool = True  # create/verify indexes at startup
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10  # connections opened (warmed) at startup
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 5000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGODB_SOCKET_TIMEOUT_MS: int = 30000
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = 5000  # max wait for a pooled connection
+    MONGODB_COMPRESSORS: str = ""  # e.g. "zstd,snappy" (needs zstandard / python-snappy)
+    MONGODB_READ_PREFERENCE: str = "secondaryPreferred"  # history/stats reads
     
     # ===== Twilio =====
     TWILIO_ACCOUNT_SID: str
@@ -25,9 +57,68 @@ class Settings(BaseSettings):
     
     # ===== OpenAI =====
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: Optional[str] = None  # e.g. a local fake server for testing
+    
+    # ===== OpenAI Batch API (deferred call summaries) =====
+    OPENAI_BATCH_ENABLED: bool = False
+    OPENAI_BATCH_SUBMIT_INTERVAL: int = 300  # seconds between batch submissions
+    OPENAI_BATCH_POLL_INTERVAL: int = 60  # seconds between status polls
+    OPENAI_BATCH_MAX_REQUESTS: int = 5000  # requests per batch file
+    OPENAI_BATCH_MAX_ATTEMPTS: int = 3  # submissions per request before its summary is marked failed
+    OPENAI_BATCH_CLAIM_TIMEOUT: int = 600  # seconds before a crashed submission's claim is re-queued
+    
+    # ===== Transcription =====
+    TRANSCRIPTION_BACKEND: str = "openai"  # "openai" or "local"
+    LOCAL_WHISPER_MODEL: str = "base.en"
+    LOCAL_WHISPER_DEVICE: str = "cpu"
+    LOCAL_WHISPER_COMPUTE_TYPE: str = "int8"
+    LOCAL_WHISPER_WORKERS: int = 1
+    
+    # ===== Call Summaries =====
+    SUMMARY_CACHE_SIZE: int = 512
+    SUMMARY_REUSE_SIMILARITY: float = 0.6  # live vs. recording transcript
+    
+    # ===== Listings =====
+    COUNT_CACHE_TTL: int = 60  # seconds a listing total is cached
+    STATS_REBUILD_INTERVAL: int = 3600  # seconds between stats reconciliations (0 = off)
+    STATS_REBUILD_ON_STARTUP: bool = True  # reconcile once before serving requests
+    STATS_REBUILD_LOCK_TTL: int = 600  # seconds before a crashed worker's rebuild claim can be taken over
+    
+    # ===== Twilio Status Callbacks =====
+    CALL_STATUS_FLUSH_INTERVAL: float = 1.0  # write-behind window in seconds (0 = write immediately)
+    CALL_STATUS_BUFFER_MAX: int = 500  # flush early once this many calls are buffered
+    CALL_STATUS_UNKNOWN_TTL: float = 30.0  # seconds a callback waits for its call log to get the call_sid
+    CALL_STATUS_RETRY_DELAY: float = 0.5  # retry interval for those when no flusher is running
+    
+    # ===== Webhook Deduplication =====
+    WEBHOOK_DEDUP_ENABLED: bool = True
+    WEBHOOK_DEDUP_BACKEND: str = "memory"  # "memory" (per process) or "mongo" (shared by workers)
+    WEBHOOK_DEDUP_TTL: int = 300  # seconds a webhook response is replayed to retries
+    WEBHOOK_DEDUP_WAIT: float = 15.0  # max seconds to wait for another worker's response
+    
+    # ===== Pre-synthesized Audio (TTS cache) =====
+    # Cached lines are synthesized with Amazon Polly in SARA_VOICE, so they sound like live <Say> turns
+    TTS_CACHE_ENABLED: bool = False
+    TTS_CACHE_BACKEND: str = "local"  # "local" (served by the app) or "s3"
+    TTS_CACHE_DIR: str = "audio_cache"
+    SARA_VOICE: str = "Polly.Joanna"  # Twilio <Say> voice; "Polly.<Name>" or "Polly.<Name>-Neural"
+    
+    # ===== Sara Intent Fast Path =====
+    INTENT_FAST_PATH_ENABLED: bool = True  # answer common intents without a GPT round trip
+    
+    # ===== Sara Call Pre-warm =====
+    SARA_PREWARM_ENABLED: bool = True  # load lead/prompt while the phone rings
+    SARA_PREWARM_TTL: int = 300  # seconds an unanswered call's context is kept
+    SARA_SPECULATIVE_REPLIES: bool = False  # pre-generate GPT replies to likely first answers (costs tokens)
+    
+    # ===== Sara Turn Latency =====
+    TURN_LATENCY_ENABLED: bool = True
+    TURN_LATENCY_WINDOW: int = 1000  # recent turns kept in memory for percentiles
+    TURN_LATENCY_STORED: int = 50  # turns kept per call log (call_logs.turn_latencies)
     
     # ===== PageSpeed Insights =====
     PAGESPEED_API_KEY: str
+    PAGESPEED_API_URL: str = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
     
     # ===== AWS S3 (Optional) =====
     AWS_ACCESS_KEY_ID: Optional[str] = None
@@ -42,38 +133,103 @@ class Settings(BaseSettings):
 
 
 # Initialize settings
+from app.utils import logger
+
 try:
     settings = Settings()
-    print(f"✅ Configuration loaded successfully")
-    print(f"   Environment: {settings.ENVIRONMENT}")
-    print(f"   MongoDB: {settings.MONGODB_URL}")
-    print(f"   Twilio: {settings.TWILIO_PHONE_NUMBER}")
 except Exception as e:
-    print(f"❌ Configuration error: {e}")
-    print(f"⚠️  Make sure .env file exists with all required variables")
+    logger.error("Configuration error - make sure .env file exists with all required variables", error=str(e))
+    logger.close()
     raise
 
+logger.configure(
+    level=settings.LOG_LEVEL,
+    log_format=settings.LOG_FORMAT,
+    sample_rate=settings.LOG_SAMPLE_RATE,
+    queue_size=settings.LOG_QUEUE_SIZE
+)
+logger.info(
+    "Configuration loaded",
+    environment=settings.ENVIRONMENT,
+    mongodb_db=settings.MONGODB_DB_NAME,
+    twilio_number=settings.TWILIO_PHONE_NUMBER
+)
+
 
 # MongoDB connection
+import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReadPreference
+
+from app.services.db_metrics import CommandLatencyListener, PoolCheckoutListener
+
+READ_PREFERENCES = {
+    "primary": ReadPreference.PRIMARY,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+
 
 class Database:
     """Database connection handler"""
     client: Optional[AsyncIOMotorClient] = None
+    pool_listener = PoolCheckoutListener()
+    command_listener = CommandLatencyListener()
+    
+    @classmethod
+    def client_options(cls) -> dict:
+        """Pool, timeout and compression options for AsyncIOMotorClient"""
+        options = {
+            "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+            "maxIdleTimeMS": settings.MONGODB_MAX_IDLE_TIME_MS,
+            "connectTimeoutMS": settings.MONGODB_CONNECT_TIMEOUT_MS,
+            "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "socketTimeoutMS": settings.MONGODB_SOCKET_TIMEOUT_MS,
+            "waitQueueTimeoutMS": settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+            "event_listeners": [cls.pool_listener, cls.command_listener]
+        }
+        
+        compressors = [c.strip() for c in settings.MONGODB_COMPRESSORS.split(",") if c.strip()]
+        if compressors:
+            options["compressors"] = compressors
+        
+        return options
     
     @classmethod
     def get_client(cls):
         """Get MongoDB client (singleton pattern)"""
         if cls.client is None:
-            cls.client = AsyncIOMotorClient(settings.MONGODB_URL)
+            cls.client = AsyncIOMotorClient(settings.MONGODB_URL, **cls.client_options())
         return cls.client
     
+    @classmethod
+    async def connect(cls):
+        """Create the client and warm the pool (called from the app lifespan)"""
+        client = cls.get_client()
+        
+        # Concurrent pings each check out a connection, opening minPoolSize up front
+        warm = max(1, settings.MONGODB_MIN_POOL_SIZE)
+        await asyncio.gather(*[client.admin.command("ping") for _ in range(warm)])
+    
     @classmethod
     def get_database(cls):
-        """Get database instance"""
+        """Get database instance (primary reads and writes)"""
         client = cls.get_client()
         return client[settings.MONGODB_DB_NAME]
     
+    @classmethod
+    def get_read_database(cls):
+        """Database handle for reporting reads (history, stats) - may hit secondaries"""
+        client = cls.get_client()
+        read_preference = READ_PREFERENCES.get(
+            settings.MONGODB_READ_PREFERENCE,
+            ReadPreference.SECONDARY_PREFERRED
+        )
+        return client.get_database(settings.MONGODB_DB_NAME, read_preference=read_preference)
+    
     @classmethod
     def close(cls):
         """Close database connection"""
@@ -86,3 +242,8 @@ def get_db():
     """Get database instance (FastAPI dependency)"""
     return Database.get_database()
 
+
+def get_read_db():
+    """Get database instance for reporting reads (FastAPI dependency)"""
+    return Database.get_read_database()
+
@@ -223,6 +223,7 @@ class Lead(BaseModel):
     city: Optional[str] = None
     state: Optional[str] = None
     industry: Optional[str] = None
+    industry_slug: Optional[str] = None  # normalize_industry(industry), indexed
     
     # Analysis data
     ai_visibility_score: Optional[int] = None
@@ -322,6 +323,9 @@ class CallLog(BaseModel):
     key_points: Optional[List[str]] = []
     objections: Optional[List[str]] = []
     
+    # Per-turn latency spans (see turn_timer)
+    turn_latencies: Optional[List[Dict[str, Any]]] = []
+    
     # Timestamps
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
@@ -373,6 +377,54 @@ class HistoryResponse(BaseModel):
     analyses: List[AnalysisResult]
 
 
+class LeadSummary(BaseModel):
+    """List-view projection of a lead (no analysis blobs unless requested)"""
+    id: str = Field(alias="_id")
+    user_id: Optional[str] = None
+    business_name: Optional[str] = None
+    website_url: Optional[str] = None
+    phone_number: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    industry: Optional[str] = None
+    industry_slug: Optional[str] = None
+    ai_visibility_score: Optional[int] = None
+    seo_score: Optional[int] = None
+    overall_score: Optional[int] = None
+    top_issues: Optional[List[str]] = None
+    analysis_type: Optional[str] = None
+    call_status: Optional[str] = None
+    call_attempts: Optional[int] = None
+    last_call_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        extra = "allow"
+        populate_by_name = True
+
+
+class IndustryFacet(BaseModel):
+    slug: str
+    name: Optional[str] = None
+    count: int
+
+
+class IndustryFacetResponse(BaseModel):
+    success: bool
+    industries: List[IndustryFacet]
+
+
+class HistoryListResponse(BaseModel):
+    success: bool
+    total: int
+    skip: int
+    limit: int
+    count: int
+    next_cursor: Optional[str] = None
+    analyses: List[LeadSummary]
+
+
 class RecordingResponse(BaseModel):
     success: bool
     call_id: str
@@ -1,6 +1,6 @@
 """
 API Routes Package
 """
-from . import analysis, sara, history, recordings, webhooks
+from . import analysis, sara, history, recordings, webhooks, audio, admin
 
-__all__ = ["analysis", "sara", "history", "recordings", "webhooks"]
\ No newline at end of file
+__all__ = ["analysis", "sara", "history", "recordings", "webhooks", "audio", "admin"]
\ No newline at end of file
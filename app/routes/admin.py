@@ -0,0 +1,60 @@
+"""
+Admin Routes - production profiling (requires X-Admin-Key)
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.services.profiler import get_profile, is_admin_key, profile_window, recent_profiles, sampler
+
+router = APIRouter()
+
+
+async def require_admin(x_admin_key: Optional[str] = Header(None)):
+    """Reject requests without the admin key (404 when ADMIN_API_KEY is unset)"""
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not is_admin_key(x_admin_key):
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+
+@router.post("/profile", response_class=PlainTextResponse, dependencies=[Depends(require_admin)])
+async def profile(seconds: float = Query(10, gt=0, description="Sampling window in seconds")):
+    """
+    Sample this worker for N seconds
+    
+    Returns folded stacks (flamegraph.pl / speedscope), one line per
+    "route;frame;...;frame count".
+    """
+    seconds = min(seconds, settings.PROFILER_MAX_SECONDS)
+    session = await profile_window(seconds)
+
+    return PlainTextResponse(
+        session.folded(),
+        headers={
+            "X-Profile-Samples": str(session.samples),
+            "X-Profile-Duration-Ms": str(session.duration_ms)
+        }
+    )
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin)])
+async def list_profiles():
+    """Per-request profiles kept in memory (X-Profile: 1 requests)"""
+    return {
+        "sampling": sampler.active,
+        "interval_ms": settings.PROFILER_INTERVAL_MS,
+        "profiles": recent_profiles()
+    }
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse, dependencies=[Depends(require_admin)])
+async def get_request_profile(profile_id: int):
+    """Folded stacks of one profiled request"""
+    profile = get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return PlainTextResponse(profile["folded"], headers={"X-Profile-Route": profile["route"]})
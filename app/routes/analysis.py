@@ -787,6 +787,8 @@ from typing import Optional
 from typing import Optional  # Add this if missing
 from app.models import AnalyzeRequest, AnalyzeResponse, AnalysisResult, Lead, CallStatus
 from app.config import get_db
+from app.services.stats_service import record_lead
+from app.services.tracing import correlate
 from app.services.scraper import scrape_website, scrape_website_deep
 from app.services.scoring import (
     analyze_ai_visibility,
@@ -794,7 +796,7 @@ from app.services.scoring import (
     analyze_seo,
     analyze_seo_enhanced
 )
-from app.utils import logger, calculate_overall_score, normalize_phone
+from app.utils import logger, calculate_overall_score, normalize_phone, normalize_industry
 
 router = APIRouter()
 
@@ -852,6 +854,7 @@ async def analyze_website_quick(
         # Save to database
         lead_id = await save_lead_to_db(request, analysis_result, user_id)
         
+        correlate(lead_id=lead_id)
         logger.info(f"Quick analysis completed. Lead ID: {lead_id}")
         
         return AnalyzeResponse(
@@ -954,6 +957,10 @@ async def analyze_website_deep_route(
             "analyzed_at": datetime.utcnow().isoformat()
         }
         
+        # Per-page details live in analysis_pages; the lead keeps a compact summary
+        stored_analysis = {k: v for k, v in analysis_result.items() if k != "pages_detail"}
+        stored_analysis["pages_summary"] = summarize_pages(pages_with_issues)
+        
         # Save enhanced lead data
         db = get_db()
         lead_data = {
@@ -964,11 +971,12 @@ async def analyze_website_deep_route(
             "city": request.city,
             "state": request.state,
             "industry": request.industry,
+            "industry_slug": normalize_industry(request.industry),
             "ai_visibility_score": ai_analysis.get("score", 0),
             "seo_score": seo_analysis.get("score", 0),
             "overall_score": overall_score,
             "top_issues": ai_analysis.get("critical_issues", [])[:5],
-            "analysis_data": analysis_result,
+            "analysis_data": stored_analysis,
             "analysis_type": "deep",
             "call_status": CallStatus.PENDING,
             "created_at": datetime.utcnow(),
@@ -978,6 +986,10 @@ async def analyze_website_deep_route(
         result = await db.leads.insert_one(lead_data)
         lead_id = str(result.inserted_id)
         
+        await record_lead(lead_data)
+        await save_page_details(db, lead_id, pages_with_issues)
+        
+        correlate(lead_id=lead_id)
         logger.info(f"Deep analysis completed. Lead ID: {lead_id}")
         
         return {
@@ -1202,6 +1214,45 @@ def generate_page_level_issues(pages):
     return enhanced_pages
 
 
+def summarize_pages(pages_detail):
+    """Lightweight per-page summary stored on the lead document"""
+    total_pages = len(pages_detail)
+    
+    return {
+        "total_pages": total_pages,
+        "total_critical_issues": sum(p.get("issue_summary", {}).get("critical_count", 0) for p in pages_detail),
+        "total_warnings": sum(p.get("issue_summary", {}).get("warning_count", 0) for p in pages_detail),
+        "total_suggestions": sum(p.get("issue_summary", {}).get("suggestion_count", 0) for p in pages_detail),
+        "average_page_score": sum(p.get("page_score", 0) for p in pages_detail) / total_pages if total_pages else 0,
+        "pages": [
+            {
+                "url": p.get("url"),
+                "title": p.get("title"),
+                "page_score": p.get("page_score", 0),
+                "issue_summary": p.get("issue_summary", {})
+            }
+            for p in pages_detail
+        ]
+    }
+
+
+async def save_page_details(db, lead_id: str, pages_detail):
+    """Store full per-page analysis in the analysis_pages collection"""
+    if not pages_detail:
+        return
+    
+    created_at = datetime.utcnow()
+    await db.analysis_pages.insert_many([
+        {
+            **page,
+            "lead_id": lead_id,
+            "page_index": index,
+            "created_at": created_at
+        }
+        for index, page in enumerate(pages_detail)
+    ])
+
+
 @router.get("/{lead_id}")
 async def get_analysis(lead_id: str):
     """Get analysis results for a specific lead"""
@@ -1236,40 +1287,67 @@ async def get_analysis(lead_id: str):
 
 
 @router.get("/{lead_id}/pages")
-async def get_page_breakdown(lead_id: str):
-    """Get page-by-page analysis breakdown with detailed issues"""
+async def get_page_breakdown(
+    lead_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """
+    Get page-by-page analysis breakdown with detailed issues
+    
+    Query Parameters:
+    - skip: Number of pages to skip (pagination)
+    - limit: Maximum pages to return
+    """
     try:
         db = get_db()
-        lead = await db.leads.find_one({"_id": ObjectId(lead_id)})
+        lead = await db.leads.find_one(
+            {"_id": ObjectId(lead_id)},
+            {
+                "analysis_data.total_pages_analyzed": 1,
+                "analysis_data.page_scores": 1,
+                "analysis_data.pages_summary": 1,
+                "analysis_data.pages_detail": 1
+            }
+        )
         
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
         
         analysis_data = lead.get("analysis_data", {})
-        pages_detail = analysis_data.get("pages_detail", [])
-        
-        total_critical = sum(p.get("issue_summary", {}).get("critical_count", 0) for p in pages_detail)
-        total_warnings = sum(p.get("issue_summary", {}).get("warning_count", 0) for p in pages_detail)
-        total_suggestions = sum(p.get("issue_summary", {}).get("suggestion_count", 0) for p in pages_detail)
-        
-        avg_score = 0
-        if len(pages_detail) > 0:
-            avg_score = sum(p.get("page_score", 0) for p in pages_detail) / len(pages_detail)
+        pages_summary = analysis_data.get("pages_summary")
+        
+        if pages_summary is not None:
+            cursor = db.analysis_pages.find(
+                {"lead_id": lead_id},
+                {"_id": 0, "lead_id": 0}
+            ).sort("page_index", 1).skip(skip).limit(limit)
+            pages_detail = await cursor.to_list(length=limit)
+        else:
+            # Leads saved before analysis_pages existed embed every page
+            legacy_pages = analysis_data.get("pages_detail", [])
+            pages_summary = summarize_pages(legacy_pages)
+            pages_detail = legacy_pages[skip:skip + limit]
         
         return {
             "success": True,
             "lead_id": lead_id,
             "total_pages": analysis_data.get("total_pages_analyzed", 1),
+            "skip": skip,
+            "limit": limit,
+            "count": len(pages_detail),
             "summary": {
-                "total_critical_issues": total_critical,
-                "total_warnings": total_warnings,
-                "total_suggestions": total_suggestions,
-                "average_page_score": avg_score
+                "total_critical_issues": pages_summary["total_critical_issues"],
+                "total_warnings": pages_summary["total_warnings"],
+                "total_suggestions": pages_summary["total_suggestions"],
+                "average_page_score": pages_summary["average_page_score"]
             },
             "page_scores": analysis_data.get("page_scores", []),
             "pages_detail": pages_detail
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get page breakdown: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1286,6 +1364,7 @@ async def save_lead_to_db(request: AnalyzeRequest, analysis_result: AnalysisResu
         city=request.city,
         state=request.state,
         industry=request.industry,
+        industry_slug=normalize_industry(request.industry),
         ai_visibility_score=analysis_result.ai_visibility_score,
         seo_score=analysis_result.seo_score,
         top_issues=analysis_result.critical_issues[:5],
@@ -1310,4 +1389,5 @@ async def save_lead_to_db(request: AnalyzeRequest, analysis_result: AnalysisResu
     lead_dict = convert_urls(lead_dict)
     
     result = await db.leads.insert_one(lead_dict)
+    await record_lead(lead_dict)
     return str(result.inserted_id)
\ No newline at end of file
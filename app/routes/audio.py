@@ -0,0 +1,37 @@
+"""
+Pre-synthesized Audio Routes (fetched by Twilio <Play>)
+"""
+import os
+import re
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, RedirectResponse
+
+from app.config import settings
+from app.services.audio_cache import CACHE_CONTROL, get_presigned_url, local_path
+from app.utils import logger
+
+router = APIRouter()
+
+AUDIO_KEY_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+@router.get("/{key}.mp3")
+async def get_audio(key: str):
+    """Serve a cached phrase (local file or redirect to S3)"""
+    # Keys are hashes; anything else could be a path traversal attempt
+    if not AUDIO_KEY_PATTERN.match(key):
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    if settings.TTS_CACHE_BACKEND == "s3":
+        url = get_presigned_url(key)
+        if not url:
+            logger.error("Audio requested but S3 is not configured")
+            raise HTTPException(status_code=404, detail="Audio not found")
+        return RedirectResponse(url, status_code=302)
+
+    path = local_path(key)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    return FileResponse(path, media_type="audio/mpeg", headers={"Cache-Control": CACHE_CONTROL})
@@ -2,48 +2,101 @@
 Analysis History API Routes
 """
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
+import re
 
-from app.config import get_db
-from app.utils import logger
+from app.config import get_read_db
+from app.models import HistoryListResponse, IndustryFacetResponse
+from app.services.pagination import fetch_page, cached_count
+from app.services.stats_service import get_stats
+from app.utils import logger, normalize_industry
 
 router = APIRouter()
 
+# Fields returned by the history list view (everything except the analysis blobs)
+HISTORY_LIST_FIELDS = [
+    "user_id", "business_name", "website_url", "phone_number",
+    "city", "state", "industry", "industry_slug",
+    "ai_visibility_score", "seo_score", "overall_score", "top_issues",
+    "analysis_type", "call_status", "call_attempts", "last_call_date",
+    "created_at", "updated_at"
+]
 
-@router.get("/")
+# Fields a client may request explicitly via ?fields=
+HISTORY_ALLOWED_FIELDS = set(HISTORY_LIST_FIELDS) | {"analysis_data"}
+
+
+def build_projection(fields: Optional[str]) -> dict:
+    """Mongo projection for the history list (raises 400 on unknown fields)"""
+    if not fields:
+        return {field: 1 for field in HISTORY_LIST_FIELDS}
+    
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in HISTORY_ALLOWED_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    
+    return {field: 1 for field in requested}
+
+
+@router.get(
+    "/",
+    response_model=HistoryListResponse,
+    response_model_exclude_unset=True,
+    response_class=ORJSONResponse
+)
 async def get_analysis_history(
+    cursor: Optional[str] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     industry: Optional[str] = None,
-    min_score: Optional[int] = None
+    min_score: Optional[int] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return")
 ):
     """
     Get analysis history with pagination and filters
     
     Query Parameters:
-    - skip: Number of records to skip (pagination)
+    - cursor: next_cursor from the previous page (omit for the first page)
+    - skip: Number of records to skip (legacy offset paging, ignored with cursor)
     - limit: Maximum records to return
-    - industry: Filter by industry
+    - industry: Filter by industry (case-insensitive prefix, e.g. "real est")
     - min_score: Minimum AI visibility score
+    - fields: Comma-separated subset of fields (default: list-view summary fields;
+      add analysis_data to include the full analysis)
     """
     try:
-        db = get_db()
+        projection = build_projection(fields)
+        
+        db = get_read_db()
         
         # Build query filter
         query_filter = {}
         
         if industry:
-            query_filter["industry"] = {"$regex": industry, "$options": "i"}
+            # Anchored regex on the normalized slug is an index range scan
+            slug = normalize_industry(industry)
+            if slug:
+                query_filter["industry_slug"] = {"$regex": f"^{re.escape(slug)}"}
         
         if min_score is not None:
             query_filter["ai_visibility_score"] = {"$gte": min_score}
         
-        # Get total count
-        total = await db.leads.count_documents(query_filter)
+        # Get total count (cached, estimated when unfiltered)
+        total = await cached_count(db.leads, query_filter)
         
         # Get paginated results
-        cursor = db.leads.find(query_filter).sort("created_at", -1).skip(skip).limit(limit)
-        leads = await cursor.to_list(length=limit)
+        try:
+            leads, next_cursor = await fetch_page(
+                db.leads, query_filter, limit,
+                cursor=cursor, projection=projection, skip=skip
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         # Convert ObjectId to string
         for lead in leads:
@@ -57,65 +110,75 @@ async def get_analysis_history(
             "skip": skip,
             "limit": limit,
             "count": len(leads),
+            "next_cursor": next_cursor,
             "analyses": leads
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get history: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stats")
-async def get_statistics():
-    """Get overall statistics"""
+@router.get("/industries", response_model=IndustryFacetResponse)
+async def get_industry_facets(
+    prefix: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    """
+    Industry facets with lead counts (served from the stats industry buckets)
+    
+    Query Parameters:
+    - prefix: Only industries whose name starts with this (case-insensitive)
+    - limit: Maximum industries to return
+    """
     try:
-        db = get_db()
-        
-        # Total leads
-        total_leads = await db.leads.count_documents({})
-        
-        # Average scores
-        pipeline = [
-            {
-                "$group": {
-                    "_id": None,
-                    "avg_ai_score": {"$avg": "$ai_visibility_score"},
-                    "avg_seo_score": {"$avg": "$seo_score"}
-                }
-            }
-        ]
+        db = get_read_db()
         
-        cursor = db.leads.aggregate(pipeline)
-        stats = await cursor.to_list(length=1)
+        query_filter = {"kind": "industry"}
         
-        avg_scores = stats[0] if stats else {
-            "avg_ai_score": 0,
-            "avg_seo_score": 0
-        }
+        if prefix:
+            slug = normalize_industry(prefix)
+            if slug:
+                query_filter["industry_slug"] = {"$regex": f"^{re.escape(slug)}"}
         
-        # Calls statistics
-        total_calls = await db.call_logs.count_documents({})
-        completed_calls = await db.call_logs.count_documents({"status": "completed"})
+        buckets = await db.stats.find(
+            query_filter,
+            {"industry_slug": 1, "industry": 1, "leads": 1}
+        ).sort("leads", -1).limit(limit).to_list(length=limit)
         
-        # Top industries
-        industry_pipeline = [
-            {"$match": {"industry": {"$ne": None}}},
-            {"$group": {"_id": "$industry", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 5}
-        ]
+        return {
+            "success": True,
+            "industries": [
+                {
+                    "slug": bucket["industry_slug"],
+                    "name": bucket.get("industry"),
+                    "count": bucket.get("leads", 0)
+                }
+                for bucket in buckets
+            ]
+        }
         
-        cursor = db.leads.aggregate(industry_pipeline)
-        top_industries = await cursor.to_list(length=5)
+    except Exception as e:
+        logger.error(f"Failed to get industry facets: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stats")
+async def get_statistics(days: int = Query(7, ge=0, le=90)):
+    """
+    Get overall statistics (served from materialized stats buckets)
+    
+    Query Parameters:
+    - days: Number of daily rollups to include
+    """
+    try:
+        stats = await get_stats(days=days)
         
         return {
             "success": True,
-            "total_leads": total_leads,
-            "total_calls": total_calls,
-            "completed_calls": completed_calls,
-            "average_ai_score": round(avg_scores.get("avg_ai_score", 0), 2),
-            "average_seo_score": round(avg_scores.get("avg_seo_score", 0), 2),
-            "top_industries": top_industries
+            **stats
         }
         
     except Exception as e:
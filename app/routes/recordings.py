@@ -140,12 +140,13 @@
 """
 Call Recordings API Routes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from bson import ObjectId
 from typing import Optional
 from app.config import get_db
 from app.models import RecordingResponse
 from app.services.storage_service import get_recording_url
+from app.services.pagination import fetch_page, cached_count
 from app.utils import logger
 
 router = APIRouter()
@@ -237,11 +238,19 @@ async def get_transcript(call_log_id: str):
 
 
 @router.get("/lead/{lead_id}/recordings")
-async def get_lead_recordings(lead_id: str):
+async def get_lead_recordings(
+    lead_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100)
+):
     """
-    Get all recordings for a specific lead
+    Get recordings for a specific lead (newest first)
     
     Use this when you have lead_id instead of call_log_id
+    
+    Query Parameters:
+    - cursor: next_cursor from the previous page (omit for the first page)
+    - limit: Maximum recordings to return
     """
     try:
         if not ObjectId.is_valid(lead_id):
@@ -250,22 +259,31 @@ async def get_lead_recordings(lead_id: str):
         db = get_db()
         
         # Verify lead exists
-        lead = await db.leads.find_one({"_id": ObjectId(lead_id)})
+        lead = await db.leads.find_one({"_id": ObjectId(lead_id)}, {"business_name": 1})
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
         
-        # Get all call logs with recordings
-        cursor = db.call_logs.find(
-            {
-                "lead_id": lead_id,
-                "$or": [
-                    {"recording_url": {"$exists": True, "$ne": None}},
-                    {"recording_s3_url": {"$exists": True, "$ne": None}}
-                ]
-            }
-        ).sort("created_at", -1)
-        
-        recordings = await cursor.to_list(length=100)
+        # Get one page of call logs with recordings
+        query_filter = {
+            "lead_id": lead_id,
+            "$or": [
+                {"recording_url": {"$exists": True, "$ne": None}},
+                {"recording_s3_url": {"$exists": True, "$ne": None}}
+            ]
+        }
+        try:
+            recordings, next_cursor = await fetch_page(
+                db.call_logs, query_filter, limit,
+                cursor=cursor,
+                projection={
+                    "call_sid": 1, "recording_url": 1, "recording_s3_url": 1,
+                    "duration": 1, "transcript": 1, "status": 1, "outcome": 1
+                }
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        total = await cached_count(db.call_logs, query_filter)
         
         # Convert ObjectId and prepare response
         result = []
@@ -294,7 +312,9 @@ async def get_lead_recordings(lead_id: str):
             "success": True,
             "lead_id": lead_id,
             "business_name": lead.get("business_name"),
-            "total": len(result),
+            "total": total,
+            "count": len(result),
+            "next_cursor": next_cursor,
             "recordings": result
         }
         
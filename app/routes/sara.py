@@ -294,13 +294,15 @@
 """
 Sara AI Agent API Routes
 """
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from bson import ObjectId
 from datetime import datetime
 from typing import Optional  # Add this if missing
 from app.models import SaraCallRequest, SaraCallResponse, CallStatus
 from app.config import get_db
 from app.services.sara_agent import initiate_sara_call
+from app.services.pagination import fetch_page, cached_count
+from app.services.turn_timer import latency_summary, recent_summary
 from app.utils import logger, normalize_phone
 
 router = APIRouter()
@@ -425,8 +427,18 @@ async def get_call_status(lead_id: str):
 
 
 @router.get("/calls/{lead_id}")
-async def get_call_history(lead_id: str):
-    """Get all call logs for a lead"""
+async def get_call_history(
+    lead_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100)
+):
+    """
+    Get call logs for a lead (newest first)
+    
+    Query Parameters:
+    - cursor: next_cursor from the previous page (omit for the first page)
+    - limit: Maximum calls to return
+    """
     try:
         if not ObjectId.is_valid(lead_id):
             raise HTTPException(status_code=400, detail="Invalid lead_id format")
@@ -434,13 +446,18 @@ async def get_call_history(lead_id: str):
         db = get_db()
         
         # Verify lead exists
-        lead = await db.leads.find_one({"_id": ObjectId(lead_id)})
+        lead = await db.leads.find_one({"_id": ObjectId(lead_id)}, {"business_name": 1})
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
         
-        # Get all call logs
-        cursor = db.call_logs.find({"lead_id": lead_id}).sort("created_at", -1)
-        calls = await cursor.to_list(length=100)
+        # Get one page of call logs
+        query_filter = {"lead_id": lead_id}
+        try:
+            calls, next_cursor = await fetch_page(db.call_logs, query_filter, limit, cursor=cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        total_calls = await cached_count(db.call_logs, query_filter)
         
         # Convert ObjectId to string
         for call in calls:
@@ -450,7 +467,9 @@ async def get_call_history(lead_id: str):
             "success": True,
             "lead_id": lead_id,
             "business_name": lead.get("business_name"),
-            "total_calls": len(calls),
+            "total_calls": total_calls,
+            "count": len(calls),
+            "next_cursor": next_cursor,
             "calls": calls
         }
         
@@ -458,4 +477,68 @@ async def get_call_history(lead_id: str):
         raise
     except Exception as e:
         logger.error(f"Failed to get call history: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/latency")
+async def get_turn_latency():
+    """
+    p50/p95/p99 turn latency (total and per stage) over recent turns
+
+    Computed from this process's rolling window (TURN_LATENCY_WINDOW).
+    """
+    return {
+        "success": True,
+        "window": recent_summary()
+    }
+
+
+@router.get("/calls/{lead_id}/latency")
+async def get_call_latency(
+    lead_id: str,
+    limit: int = Query(10, ge=1, le=50)
+):
+    """
+    Per-turn latency breakdown of a lead's most recent calls
+
+    Query Parameters:
+    - limit: Number of calls to include
+    """
+    try:
+        if not ObjectId.is_valid(lead_id):
+            raise HTTPException(status_code=400, detail="Invalid lead_id format")
+        
+        db = get_db()
+        
+        calls = await db.call_logs.find(
+            {"lead_id": lead_id},
+            {"call_sid": 1, "status": 1, "created_at": 1, "turn_latencies": 1}
+        ).sort("created_at", -1).limit(limit).to_list(length=limit)
+        
+        all_turns = []
+        breakdown = []
+        for call in calls:
+            turns = call.get("turn_latencies", [])
+            all_turns.extend(turns)
+            breakdown.append({
+                "call_id": str(call["_id"]),
+                "call_sid": call.get("call_sid"),
+                "status": call.get("status"),
+                "created_at": call.get("created_at"),
+                "summary": latency_summary(turns),
+                "turns": turns
+            })
+        
+        return {
+            "success": True,
+            "lead_id": lead_id,
+            "count": len(breakdown),
+            "summary": latency_summary(all_turns),
+            "calls": breakdown
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get call latency: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
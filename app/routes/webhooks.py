@@ -300,6 +300,9 @@ Twilio Webhook Handlers
 from fastapi import APIRouter, Request, Response
 from twilio.twiml.voice_response import VoiceResponse
 from app.services.sara_agent import handle_voice_input, start_conversation
+from app.services.webhook_dedup import idempotent_webhook
+from app.services.turn_timer import timed_turn
+from app.services.tracing import traced_webhook
 from app.utils import logger
 from datetime import datetime
 
@@ -307,13 +310,19 @@ router = APIRouter()
 
 
 @router.post("/twilio/voice")
+@traced_webhook("twilio.webhook.voice")
+@timed_turn("voice")
+@idempotent_webhook("CallSid")
 async def twilio_voice_webhook(request: Request):
     try:
         form_data = await request.form()
-        logger.info(f"Twilio voice webhook received: {dict(form_data)}")
 
         call_sid = form_data.get("CallSid")
-        twiml_response = await start_conversation(call_sid, form_data)
+        logger.info("Twilio voice webhook received", call_sid=call_sid, call_status=form_data.get("CallStatus"))
+
+        # lead_id / call_log_id are in the webhook URL's query string, not the form
+        call_data = {**request.query_params, **form_data}
+        twiml_response = await start_conversation(call_sid, call_data)
 
         return Response(content=str(twiml_response), media_type="application/xml")
 
@@ -325,12 +334,15 @@ async def twilio_voice_webhook(request: Request):
 
 
 @router.post("/twilio/gather")
+@traced_webhook("twilio.webhook.gather")
+@timed_turn("gather")
+@idempotent_webhook(require_token=True)  # no per-turn id in the form, so a form hash would merge repeated answers
 async def twilio_gather_webhook(request: Request):
     try:
         form_data = await request.form()
-        logger.info("Twilio gather webhook received")
 
         call_sid = form_data.get("CallSid")
+        logger.info("Twilio gather webhook received", call_sid=call_sid)
         speech_result = form_data.get("SpeechResult", "")
 
         twiml_response = await handle_voice_input(call_sid, speech_result)
@@ -346,31 +358,31 @@ async def twilio_gather_webhook(request: Request):
 
 
 @router.post("/twilio/status")
+@traced_webhook("twilio.webhook.status")
+@idempotent_webhook("CallSid", "SequenceNumber")
 async def twilio_status_webhook(request: Request):
     try:
         form_data = await request.form()
-        logger.info(f"Twilio status webhook: {dict(form_data)}")
 
         call_sid = form_data.get("CallSid")
         call_status = form_data.get("CallStatus")
         call_duration = form_data.get("CallDuration")
-
-        from app.config import get_db
-        db = get_db()
-
-        await db.call_logs.update_one(
-            {"call_sid": call_sid},
-            {
-                "$set": {
-                    "status": call_status,
-                    "call_duration": int(call_duration) if call_duration else None,
-                    "ended_at": datetime.utcnow() if call_status == "completed" else None
-                }
-            },
-            upsert=True
+        sequence_number = form_data.get("SequenceNumber")
+
+        # Coalesced per call and written in bulk (see call_status_buffer)
+        from app.services.call_status_buffer import call_status_buffer
+        await call_status_buffer.add(
+            call_sid,
+            call_status,
+            sequence=int(sequence_number) if sequence_number else None,
+            duration=int(call_duration) if call_duration else None
         )
 
-        logger.info(f"Call {call_sid} status updated to {call_status}")
+        if call_status == "completed":
+            from app.services.call_context import release
+            release(call_sid)
+
+        logger.info("Call status buffered", call_sid=call_sid, status=call_status, sequence=sequence_number)
         return {"success": True}
 
     except Exception as e:
@@ -379,6 +391,8 @@ async def twilio_status_webhook(request: Request):
 
 
 @router.post("/twilio/recording")
+@traced_webhook("twilio.webhook.recording")
+@idempotent_webhook("CallSid", "RecordingSid")
 async def twilio_recording_webhook(request: Request):
     """
     Twilio recording webhook - handles recording completion
@@ -419,7 +433,12 @@ async def twilio_recording_webhook(request: Request):
         if audio_data:
             logger.info(f"Processing transcription for call {call_sid}...")
             try:
-                transcription_result = await process_recording(call_sid, audio_data)
+                # Live summary from save_call_outcome, if the call already has one
+                existing_call = await db.call_logs.find_one(
+                    {"call_sid": call_sid},
+                    {"transcript": 1, "conversation_summary": 1, "key_points": 1, "objections": 1}
+                )
+                transcription_result = await process_recording(call_sid, audio_data, existing_call)
                 logger.info(f"Transcription completed for call {call_sid}")
             except Exception as transcribe_error:
                 logger.error(f"Transcription failed for call {call_sid}: {str(transcribe_error)}")
@@ -433,10 +452,21 @@ async def twilio_recording_webhook(request: Request):
             "recording_sid": recording_sid,
             "recording_duration": int(recording_duration) if recording_duration else None,
             "transcript": transcription_result.get("transcript"),
+            "transcript_hash": transcription_result.get("transcript_hash"),
             "conversation_summary": transcription_result.get("summary"),
             "key_points": transcription_result.get("key_points", []),
-            "objections": transcription_result.get("objections", [])
+            "objections": transcription_result.get("objections", []),
+            "summary_source": transcription_result.get("summary_source")
         }
+        for optional_field in ("interest_level", "next_steps"):
+            if transcription_result.get(optional_field):
+                update_data[optional_field] = transcription_result[optional_field]
+        
+        # Batch mode: summary arrives later, keep whatever the call log has until then
+        if transcription_result.get("summary_status") == "pending":
+            for summary_field in ("conversation_summary", "key_points", "objections"):
+                update_data.pop(summary_field)
+            update_data["summary_status"] = "pending"
         
         await db.call_logs.update_one(
             {"call_sid": call_sid},
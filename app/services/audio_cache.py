@@ -0,0 +1,254 @@
+"""
+Audio Cache - pre-synthesized audio for Sara's fixed utterances
+
+Sara's opening line and closing lines are the same on every call (or
+per lead), yet <Say> makes Twilio synthesize them again each time,
+right when the caller picks up or is about to hang up. These phrases
+are synthesized ahead of time and played with <Play>.
+
+Synthesis uses Amazon Polly with the voice Twilio uses for <Say>
+(SARA_VOICE, e.g. "Polly.Joanna"), so cached lines and live GPT turns
+sound like the same person. Non-Polly voices disable the cache.
+
+Files are content-addressed: the key is a hash of the voice, engine
+and text. Editing the script (or SARA_VOICE) produces new keys, so stale
+audio is never played and needs no explicit invalidation; old objects can
+be expired with an S3 lifecycle rule or by clearing TTS_CACHE_DIR.
+
+Storage (TTS_CACHE_BACKEND):
+- local: files in TTS_CACHE_DIR, served by GET /api/v1/audio/{key}.mp3
+- s3:    objects under tts/ in AWS_BUCKET_NAME; the same route redirects
+         Twilio to a presigned URL
+
+Lookups at render time never synthesize: a phrase that isn't cached
+yet falls back to <Say>.
+"""
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from app.config import settings
+from app.utils import logger
+from app.services.metrics import record_cache
+
+POLLY_PREFIX = "Polly."
+NEURAL_SUFFIX = "-Neural"
+
+polly_client = None
+
+# Keys known to be stored (bounded: per-lead openings accumulate)
+INDEX_MAX_ENTRIES = 10000
+
+# Content-addressed objects never change, so Twilio may cache them for good
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_available: "OrderedDict[str, None]" = OrderedDict()
+
+
+def polly_voice() -> Optional[Tuple[str, str]]:
+    """
+    Amazon Polly voice and engine for SARA_VOICE
+
+    Returns:
+        (VoiceId, Engine), e.g. ("Joanna", "standard") - or None if
+        SARA_VOICE is not a Polly voice
+    """
+    voice = settings.SARA_VOICE
+    if not voice.startswith(POLLY_PREFIX):
+        return None
+
+    voice_id = voice[len(POLLY_PREFIX):]
+    if voice_id.endswith(NEURAL_SUFFIX):
+        return voice_id[:-len(NEURAL_SUFFIX)], "neural"
+    return voice_id, "standard"
+
+
+def get_polly_client():
+    """Get or create the Amazon Polly client (same credentials as S3)"""
+    global polly_client
+
+    if polly_client is None and settings.AWS_ACCESS_KEY_ID:
+        import boto3
+
+        polly_client = boto3.client(
+            "polly",
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION
+        )
+
+    return polly_client
+
+
+def synthesize_speech(text: str) -> Optional[bytes]:
+    """MP3 of text in SARA_VOICE (blocking; run in a thread)"""
+    voice = polly_voice()
+    client = get_polly_client()
+    if not voice or not client:
+        return None
+
+    voice_id, engine = voice
+    response = client.synthesize_speech(Text=text, VoiceId=voice_id, Engine=engine, OutputFormat="mp3")
+    return response["AudioStream"].read()
+
+
+def audio_key(text: str) -> str:
+    """Content address of a phrase"""
+    digest = hashlib.sha256(f"polly\x00{settings.SARA_VOICE}\x00{text}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def audio_url(key: str) -> str:
+    """Public URL Twilio fetches the audio from"""
+    return f"{settings.PUBLIC_BASE_URL.rstrip('/')}{settings.API_V1_PREFIX}/audio/{key}.mp3"
+
+
+def local_path(key: str) -> str:
+    return os.path.join(settings.TTS_CACHE_DIR, f"{key}.mp3")
+
+
+def s3_key(key: str) -> str:
+    return f"tts/{key}.mp3"
+
+
+def _remember(key: str):
+    _available[key] = None
+    _available.move_to_end(key)
+    while len(_available) > INDEX_MAX_ENTRIES:
+        _available.popitem(last=False)
+
+
+def _is_stored_locally(key: str) -> bool:
+    return os.path.isfile(local_path(key))
+
+
+def _is_stored_in_s3(key: str) -> bool:
+    from app.services.storage_service import get_s3_client
+
+    client = get_s3_client()
+    if not client:
+        return False
+
+    try:
+        client.head_object(Bucket=settings.AWS_BUCKET_NAME, Key=s3_key(key))
+        return True
+    except Exception:
+        return False
+
+
+def _store(key: str, audio: bytes):
+    if settings.TTS_CACHE_BACKEND == "s3":
+        from app.services.storage_service import get_s3_client
+
+        client = get_s3_client()
+        if not client:
+            raise RuntimeError("S3 not configured")
+
+        client.put_object(
+            Bucket=settings.AWS_BUCKET_NAME,
+            Key=s3_key(key),
+            Body=audio,
+            ContentType="audio/mpeg",
+            CacheControl=CACHE_CONTROL
+        )
+        return
+
+    os.makedirs(settings.TTS_CACHE_DIR, exist_ok=True)
+    path = local_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    # Write then rename, so a concurrent request never serves a partial file
+    with open(tmp_path, "wb") as f:
+        f.write(audio)
+    os.replace(tmp_path, path)
+
+
+def cached_audio_url(text: str) -> Optional[str]:
+    """
+    URL of pre-synthesized audio for text (None if not cached)
+
+    Cheap enough to call on every turn: a hash plus a dict lookup
+    (and a stat() for local files synthesized by another worker).
+    """
+    if not settings.TTS_CACHE_ENABLED or not text:
+        return None
+
+    key = audio_key(text)
+    if key in _available:
+        record_cache("tts_audio", True)
+        return audio_url(key)
+
+    if settings.TTS_CACHE_BACKEND == "local" and _is_stored_locally(key):
+        _remember(key)
+        record_cache("tts_audio", True)
+        return audio_url(key)
+
+    record_cache("tts_audio", False)
+    return None
+
+
+async def synthesize(text: str) -> Optional[str]:
+    """
+    Make sure text is pre-synthesized
+
+    Args:
+        text: Exact phrase Sara will speak
+
+    Returns:
+        Audio URL, or None if synthesis/storage failed
+    """
+    if not settings.TTS_CACHE_ENABLED or not text:
+        return None
+
+    if not polly_voice():
+        logger.warning(f"TTS cache needs a Polly voice, SARA_VOICE is {settings.SARA_VOICE}")
+        return None
+
+    key = audio_key(text)
+    if key in _available:
+        return audio_url(key)
+
+    try:
+        exists = _is_stored_in_s3 if settings.TTS_CACHE_BACKEND == "s3" else _is_stored_locally
+        if not await asyncio.to_thread(exists, key):
+            audio = await asyncio.to_thread(synthesize_speech, text)
+            if not audio:
+                return None
+
+            await asyncio.to_thread(_store, key, audio)
+            logger.info(f"Pre-synthesized audio {key} ({len(audio)} bytes): {text[:50]}")
+
+        _remember(key)
+        return audio_url(key)
+
+    except Exception as e:
+        logger.error(f"Audio pre-synthesis failed: {str(e)}")
+        return None
+
+
+async def synthesize_all(phrases: Iterable[str]) -> int:
+    """
+    Pre-synthesize several phrases (e.g. at startup)
+
+    Returns:
+        Number of phrases available afterwards
+    """
+    results = await asyncio.gather(*(synthesize(text) for text in phrases))
+    return sum(1 for url in results if url)
+
+
+def get_presigned_url(key: str, expiration: int = 3600) -> Optional[str]:
+    """Short-lived S3 URL for the route to redirect Twilio to"""
+    from app.services.storage_service import get_s3_client
+
+    client = get_s3_client()
+    if not client:
+        return None
+
+    return client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": settings.AWS_BUCKET_NAME, "Key": s3_key(key)},
+        ExpiresIn=expiration
+    )
@@ -0,0 +1,375 @@
+"""
+OpenAI Batch API Service - deferred call summaries
+
+Queued requests are submitted periodically as Batch API files (half price,
+separate quota from live calls) and results are written back to MongoDB.
+
+A request that fails (error line, handler error, failed or expired batch)
+is re-queued up to OPENAI_BATCH_MAX_ATTEMPTS times; after that its
+FAILURE_HANDLERS entry marks the target (e.g. summary_status "failed").
+Claims left by a worker that died mid-submission are re-queued after
+OPENAI_BATCH_CLAIM_TIMEOUT.
+"""
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from app.config import get_db, settings
+from app.services.openai_service import client
+from app.services.summary_service import build_summary_request, parse_summary
+from app.utils import logger
+
+CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+
+# Batch statuses that still need polling
+ACTIVE_BATCH_STATUSES = ["validating", "in_progress", "finalizing", "cancelling"]
+
+# Requests in these batches are re-queued and retried
+RETRY_BATCH_STATUSES = ["expired", "cancelled"]
+
+
+# ------------------------------------------------------------------
+# ENQUEUE
+# ------------------------------------------------------------------
+
+async def enqueue_request(kind: str, target: Dict[str, Any], body: Dict[str, Any]) -> str:
+    """
+    Queue a chat completion request for the next batch
+
+    Args:
+        kind: Result handler name (key of RESULT_HANDLERS)
+        target: Where the result is written back (call_sid, lead_id, ...)
+        body: Chat completion request body
+
+    Returns:
+        custom_id of the queued request
+    """
+    db = get_db()
+    custom_id = f"{kind}-{uuid.uuid4().hex}"
+
+    await db.openai_batch_requests.insert_one({
+        "custom_id": custom_id,
+        "kind": kind,
+        "target": target,
+        "body": body,
+        "status": "queued",
+        "batch_id": None,
+        "attempts": 0,
+        "created_at": datetime.utcnow()
+    })
+
+    return custom_id
+
+
+async def enqueue_call_summary(call_sid: str, transcript: str) -> str:
+    """Queue a transcript summary for a call"""
+    logger.info(f"Queued batch summary for call {call_sid}")
+    return await enqueue_request(
+        "call_summary",
+        {"call_sid": call_sid},
+        build_summary_request(transcript)
+    )
+
+
+# ------------------------------------------------------------------
+# RESULT HANDLERS
+# ------------------------------------------------------------------
+
+async def apply_call_summary(db, target: Dict[str, Any], content: str):
+    """Write a batch summary back to the call log"""
+    summary = parse_summary(content)
+
+    await db.call_logs.update_one(
+        {"call_sid": target["call_sid"]},
+        {
+            "$set": {
+                "conversation_summary": summary.get("summary"),
+                "key_points": summary.get("key_points", []),
+                "objections": summary.get("objections", []),
+                "interest_level": summary.get("interest_level"),
+                "next_steps": summary.get("next_steps"),
+                "summary_source": "batch",
+                "summary_status": "completed"
+            }
+        }
+    )
+
+
+async def fail_call_summary(db, target: Dict[str, Any]):
+    """Record on the call log that its batch summary will not arrive"""
+    await db.call_logs.update_one(
+        {"call_sid": target["call_sid"], "summary_status": "pending"},
+        {"$set": {"summary_status": "failed"}}
+    )
+
+
+RESULT_HANDLERS = {
+    "call_summary": apply_call_summary,
+}
+
+# Called once a request has failed for good
+FAILURE_HANDLERS = {
+    "call_summary": fail_call_summary,
+}
+
+
+async def retry_or_fail(db, request: Dict[str, Any], reason: str) -> str:
+    """
+    Re-queue a failed request, or give up after OPENAI_BATCH_MAX_ATTEMPTS
+
+    Returns:
+        The request's new status ("queued" or "failed")
+    """
+    attempts = request.get("attempts", 0) + 1
+
+    if attempts < settings.OPENAI_BATCH_MAX_ATTEMPTS:
+        await db.openai_batch_requests.update_one(
+            {"_id": request["_id"]},
+            {"$set": {"status": "queued", "batch_id": None, "attempts": attempts, "last_error": reason}}
+        )
+        logger.warning(f"Batch request {request['custom_id']} re-queued (attempt {attempts}): {reason}")
+        return "queued"
+
+    await db.openai_batch_requests.update_one(
+        {"_id": request["_id"]},
+        {"$set": {"status": "failed", "attempts": attempts, "last_error": reason, "completed_at": datetime.utcnow()}}
+    )
+    logger.error(f"Batch request {request['custom_id']} failed after {attempts} attempts: {reason}")
+
+    handler = FAILURE_HANDLERS.get(request["kind"])
+    if handler:
+        try:
+            await handler(db, request["target"])
+        except Exception as e:
+            logger.error(f"Recording batch failure for {request['custom_id']} failed: {str(e)}")
+
+    return "failed"
+
+
+# ------------------------------------------------------------------
+# SUBMIT / POLL
+# ------------------------------------------------------------------
+
+def build_batch_file(requests: List[Dict[str, Any]]) -> bytes:
+    """Serialize queued requests as Batch API JSONL"""
+    lines = [
+        json.dumps({
+            "custom_id": request["custom_id"],
+            "method": "POST",
+            "url": CHAT_COMPLETIONS_ENDPOINT,
+            "body": request["body"]
+        })
+        for request in requests
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def submit_pending_batches() -> Optional[str]:
+    """
+    Submit all queued requests as one Batch API job
+
+    Returns:
+        OpenAI batch id, or None if nothing was queued
+    """
+    db = get_db()
+
+    # A worker that died between claiming and submitting never released its claim
+    stale = await db.openai_batch_requests.update_many(
+        {
+            "status": "submitting",
+            "$or": [
+                {"claimed_at": {"$lt": datetime.utcnow() - timedelta(seconds=settings.OPENAI_BATCH_CLAIM_TIMEOUT)}},
+                {"claimed_at": {"$exists": False}}
+            ]
+        },
+        {"$set": {"status": "queued"}, "$unset": {"claim": "", "claimed_at": ""}}
+    )
+    if stale.modified_count:
+        logger.warning(f"Re-queued {stale.modified_count} batch requests from a stale claim")
+
+    # Claim queued requests so concurrent workers don't submit them twice
+    claim = uuid.uuid4().hex
+    # Only kinds this version can apply (requests of retired kinds are never sent)
+    queued = await db.openai_batch_requests.find(
+        {"status": "queued", "kind": {"$in": list(RESULT_HANDLERS)}},
+        {"_id": 1}
+    ).limit(settings.OPENAI_BATCH_MAX_REQUESTS).to_list(length=settings.OPENAI_BATCH_MAX_REQUESTS)
+
+    if not queued:
+        return None
+
+    await db.openai_batch_requests.update_many(
+        {"_id": {"$in": [doc["_id"] for doc in queued]}, "status": "queued"},
+        {"$set": {"status": "submitting", "claim": claim, "claimed_at": datetime.utcnow()}}
+    )
+    requests = await db.openai_batch_requests.find({"claim": claim}).to_list(length=None)
+
+    if not requests:
+        return None
+
+    try:
+        input_file = await client.files.create(
+            file=("batch.jsonl", build_batch_file(requests)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=CHAT_COMPLETIONS_ENDPOINT,
+            completion_window="24h"
+        )
+    except Exception as e:
+        logger.error(f"Batch submission failed: {str(e)}")
+        await db.openai_batch_requests.update_many(
+            {"claim": claim},
+            {"$set": {"status": "queued"}, "$unset": {"claim": "", "claimed_at": ""}}
+        )
+        return None
+
+    await db.openai_batches.insert_one({
+        "batch_id": batch.id,
+        "input_file_id": input_file.id,
+        "status": batch.status,
+        "request_count": len(requests),
+        "created_at": datetime.utcnow()
+    })
+    await db.openai_batch_requests.update_many(
+        {"claim": claim},
+        {
+            "$set": {"status": "submitted", "batch_id": batch.id, "submitted_at": datetime.utcnow()},
+            "$unset": {"claim": "", "claimed_at": ""}
+        }
+    )
+
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+    return batch.id
+
+
+async def process_batch_output(db, output_text: str) -> Dict[str, int]:
+    """Dispatch each line of a batch output file to its result handler"""
+    counts = {"completed": 0, "retried": 0, "failed": 0}
+
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+
+        result = json.loads(line)
+        custom_id = result.get("custom_id")
+        request = await db.openai_batch_requests.find_one({"custom_id": custom_id})
+
+        if not request:
+            logger.warning(f"Unknown batch request: {custom_id}")
+            continue
+
+        if request.get("status") != "submitted":
+            # Already applied or re-queued (e.g. the output was processed before)
+            continue
+
+        response = result.get("response") or {}
+        error = None
+
+        try:
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"]
+                await RESULT_HANDLERS[request["kind"]](db, request["target"], content)
+            else:
+                error = f"status {response.get('status_code')}: {result.get('error')}"
+        except Exception as e:
+            logger.error(f"Applying batch result {custom_id} failed: {str(e)}")
+            error = str(e)
+
+        if error is None:
+            counts["completed"] += 1
+            await db.openai_batch_requests.update_one(
+                {"_id": request["_id"]},
+                {"$set": {"status": "completed", "completed_at": datetime.utcnow()}}
+            )
+        elif await retry_or_fail(db, request, error) == "queued":
+            counts["retried"] += 1
+        else:
+            counts["failed"] += 1
+
+    return counts
+
+
+async def retry_or_fail_batch(db, batch_id: str, reason: str) -> Dict[str, int]:
+    """Apply retry_or_fail to every request of a batch still waiting for a result"""
+    counts = {"retried": 0, "failed": 0}
+    requests = await db.openai_batch_requests.find(
+        {"batch_id": batch_id, "status": "submitted"}
+    ).to_list(length=None)
+
+    for request in requests:
+        status = await retry_or_fail(db, request, reason)
+        counts["retried" if status == "queued" else "failed"] += 1
+
+    return counts
+
+
+async def poll_batches():
+    """Check active batches and write back results of finished ones"""
+    db = get_db()
+
+    active = await db.openai_batches.find(
+        {"status": {"$in": ACTIVE_BATCH_STATUSES}}
+    ).to_list(length=100)
+
+    for batch_doc in active:
+        try:
+            batch = await client.batches.retrieve(batch_doc["batch_id"])
+        except Exception as e:
+            logger.error(f"Batch status check failed for {batch_doc['batch_id']}: {str(e)}")
+            continue
+
+        update = {"status": batch.status}
+
+        if batch.status == "completed":
+            counts = {"completed": 0, "retried": 0, "failed": 0}
+
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    output = await client.files.content(file_id)
+                    file_counts = await process_batch_output(db, output.text)
+                    for key, value in file_counts.items():
+                        counts[key] += value
+
+            # Requests missing from both files
+            for key, value in (await retry_or_fail_batch(db, batch.id, "missing from batch output")).items():
+                counts[key] += value
+
+            update.update({
+                "output_file_id": batch.output_file_id,
+                "completed_at": datetime.utcnow(),
+                "results": counts
+            })
+            logger.info(f"Batch {batch.id} completed: {counts}")
+
+        elif batch.status in RETRY_BATCH_STATUSES or batch.status == "failed":
+            counts = await retry_or_fail_batch(db, batch.id, f"batch {batch.status}: {batch.errors}")
+            update["results"] = counts
+            logger.warning(f"Batch {batch.id} {batch.status}: {counts}")
+
+        await db.openai_batches.update_one({"_id": batch_doc["_id"]}, {"$set": update})
+
+
+async def batch_worker():
+    """Background loop: submit queued work periodically, poll for results"""
+    logger.info("OpenAI batch worker started")
+    loop = asyncio.get_running_loop()
+    last_submit = loop.time()
+
+    while True:
+        try:
+            if loop.time() - last_submit >= settings.OPENAI_BATCH_SUBMIT_INTERVAL:
+                await submit_pending_batches()
+                last_submit = loop.time()
+
+            await poll_batches()
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Batch worker iteration failed: {str(e)}")
+
+        await asyncio.sleep(settings.OPENAI_BATCH_POLL_INTERVAL)
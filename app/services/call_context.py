@@ -0,0 +1,157 @@
+"""
+Call Context - per-call state pre-warmed while the phone rings
+
+initiate_sara_call knows the lead several seconds before Twilio calls
+/twilio/voice. In that window the context for the call is prepared:
+- lead document (no lookup when the call connects)
+- rendered system prompt (not rebuilt on every GPT turn)
+- conversation state seeded with the opening line
+- opening line audio (when TTS_CACHE_ENABLED)
+- optional speculative GPT replies to likely first answers
+
+Contexts are created under the call_log_id (the CallSid isn't known
+yet), moved to the CallSid by start_conversation and dropped when the
+call ends or after SARA_PREWARM_TTL if it's never answered.
+
+State is per process: if the webhook lands on another worker, Sara
+falls back to the database lookups.
+"""
+import asyncio
+import time
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+from app.services.intent_service import normalize_utterance
+from app.utils import logger
+
+# Likely answers to the opening question that the intent fast path
+# doesn't cover (normalized, see intent_service.normalize_utterance)
+SPECULATIVE_UTTERANCES = [
+    "what is this about",
+    "tell me more",
+    "what issues",
+    "what do you mean",
+    "no",
+]
+
+# Upper bound for an answered call (release() normally drops it sooner)
+ANSWERED_CALL_MAX_AGE = 3600
+
+_contexts: Dict[str, Dict[str, Any]] = {}
+
+
+def _prune():
+    now = time.monotonic()
+    expired = [key for key, context in _contexts.items() if context["expires_at"] <= now]
+    for key in expired:
+        _contexts.pop(key, None)
+
+
+def create_context(call_log_id: str, lead: Dict[str, Any], opening: str) -> Dict[str, Any]:
+    """
+    Build and register the warm context of a call
+
+    Args:
+        call_log_id: Call log _id (key until the CallSid is known)
+        lead: Lead document
+        opening: Sara's opening line
+    """
+    from app.services.openai_service import build_sara_system_prompt
+
+    _prune()
+
+    context = {
+        "lead": lead,
+        "system_prompt": build_sara_system_prompt(lead),
+        "opening": opening,
+        "conversation": [{"role": "assistant", "content": opening}],
+        "speculative": {},
+        "expires_at": time.monotonic() + settings.SARA_PREWARM_TTL
+    }
+    _contexts[call_log_id] = context
+    return context
+
+
+async def _speculate(context: Dict[str, Any], utterance: str):
+    from app.services.openai_service import generate_sara_response
+
+    reply = await generate_sara_response(
+        user_message=utterance,
+        lead_data=context["lead"],
+        conversation_history=[{"role": "assistant", "content": context["opening"]}],
+        system_prompt=context["system_prompt"]
+    )
+    context["speculative"][utterance] = reply
+
+    if settings.TTS_CACHE_ENABLED:
+        from app.services.audio_cache import synthesize
+        await synthesize(reply)
+
+
+async def warm_up(context: Dict[str, Any]):
+    """
+    Slow part of the pre-warm, run in the background while ringing
+
+    Synthesizes the opening line and, with SARA_SPECULATIVE_REPLIES,
+    generates replies to SPECULATIVE_UTTERANCES.
+    """
+    tasks = []
+
+    if settings.TTS_CACHE_ENABLED:
+        from app.services.audio_cache import synthesize
+        tasks.append(synthesize(context["opening"]))
+
+    if settings.SARA_SPECULATIVE_REPLIES:
+        tasks.extend(_speculate(context, utterance) for utterance in SPECULATIVE_UTTERANCES)
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Call pre-warm step failed: {str(result)}")
+
+
+def attach_call_sid(call_log_id: Optional[str], call_sid: str) -> Optional[Dict[str, Any]]:
+    """Move a warm context from its call_log_id to the CallSid (None if missing/expired)"""
+    context = _contexts.pop(call_log_id, None) if call_log_id else None
+
+    if context is None:
+        context = _contexts.get(call_sid)
+
+    if context is None or context["expires_at"] <= time.monotonic():
+        return None
+
+    # Lives for the rest of the call; dropped by release()
+    context["expires_at"] = time.monotonic() + ANSWERED_CALL_MAX_AGE
+    _contexts[call_sid] = context
+    return context
+
+
+def get_context(call_sid: str) -> Optional[Dict[str, Any]]:
+    return _contexts.get(call_sid)
+
+
+def take_speculative_reply(
+    context: Dict[str, Any],
+    user_speech: str,
+    conversation: List[Dict[str, str]]
+) -> Optional[str]:
+    """
+    Pre-generated reply for the caller's first answer, if one matches
+
+    Args:
+        context: Warm context of the call
+        user_speech: Caller's utterance
+        conversation: Conversation so far, including this utterance
+    """
+    # Only valid right after the opening line
+    if not context["speculative"] or len(conversation) != 2:
+        return None
+
+    reply = context["speculative"].get(normalize_utterance(user_speech))
+    context["speculative"] = {}
+    return reply
+
+
+def release(call_sid: str):
+    """Drop the context when the call ends"""
+    _contexts.pop(call_sid, None)
@@ -0,0 +1,222 @@
+"""
+Call Status Buffer - write-behind coalescing of Twilio status callbacks
+
+Twilio posts several status callbacks per call (initiated, ringing,
+answered, completed). Instead of one upsert per callback, updates are
+buffered per call_sid, merged (the highest SequenceNumber wins) and
+flushed periodically with a single ordered bulk_write.
+
+Ordering:
+- Within a window, an older callback never overwrites a newer one.
+- Across windows (or workers), each $set is guarded by status_sequence,
+  so a late, out-of-order callback is ignored by MongoDB.
+- Flushes are serialized, so two bulk writes never race each other.
+
+Callbacks never create call logs. Twilio's "initiated" callback can
+arrive before initiate_sara_call has stored the call_sid; such updates
+stay buffered until the call log has it (CALL_STATUS_UNKNOWN_TTL), so
+no stub log ever takes the call_sid from the real one.
+
+Buffered updates are flushed on shutdown. A hard crash loses at most
+CALL_STATUS_FLUSH_INTERVAL seconds of status updates.
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from pymongo import UpdateOne
+
+from app.config import get_db, settings
+from app.utils import logger
+
+
+class CallStatusBuffer:
+    """Per-call_sid write-behind buffer for call_logs status fields"""
+
+    def __init__(self):
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._retry_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _merge(self, call_sid: str, update: Dict[str, Any]):
+        current = self._pending.get(call_sid)
+
+        if current is None:
+            self._pending[call_sid] = update
+            return
+
+        # Age of the oldest buffered callback bounds how long an unknown call_sid waits
+        update = {**update, "first_seen": min(update["first_seen"], current["first_seen"])}
+
+        if update["sequence"] >= current["sequence"]:
+            # Newer callback: its fields win, keep older fields it doesn't carry
+            self._pending[call_sid] = {
+                **current,
+                **update,
+                "fields": {**current["fields"], **update["fields"]}
+            }
+        else:
+            # Older callback arriving late: only fill fields not set yet
+            current["fields"] = {**update["fields"], **current["fields"]}
+
+    async def add(
+        self,
+        call_sid: str,
+        status: str,
+        sequence: Optional[int] = None,
+        duration: Optional[int] = None
+    ):
+        """
+        Buffer a status callback
+
+        Args:
+            call_sid: Twilio call SID
+            status: Twilio CallStatus
+            sequence: Twilio SequenceNumber (callback order within the call)
+            duration: CallDuration in seconds, if reported
+        """
+        now = datetime.utcnow()
+        fields = {"status": status, "status_updated_at": now}
+
+        if duration is not None:
+            fields["call_duration"] = duration
+        if status == "completed":
+            fields["ended_at"] = now
+
+        self._merge(call_sid, {
+            # Without SequenceNumber fall back to arrival time
+            "sequence": sequence if sequence is not None else now.timestamp(),
+            "fields": fields,
+            "first_seen": time.monotonic()
+        })
+
+        # No flusher running (buffering disabled or outside the app lifespan): write through
+        if self._task is None or len(self._pending) >= settings.CALL_STATUS_BUFFER_MAX:
+            await self.flush()
+
+    def _operations(self, pending: Dict[str, Dict[str, Any]]):
+        operations = []
+
+        for call_sid, update in pending.items():
+            sequence = update["sequence"]
+
+            # Only apply if no newer callback has been written already
+            operations.append(UpdateOne(
+                {
+                    "call_sid": call_sid,
+                    "$or": [
+                        {"status_sequence": {"$exists": False}},
+                        {"status_sequence": {"$lt": sequence}}
+                    ]
+                },
+                {"$set": {**update["fields"], "status_sequence": sequence}}
+            ))
+
+        return operations
+
+    def _hold_unknown(self, unknown: Dict[str, Dict[str, Any]]):
+        """Re-buffer updates whose call log has no call_sid yet (until CALL_STATUS_UNKNOWN_TTL)"""
+        now = time.monotonic()
+
+        for call_sid, update in unknown.items():
+            if now - update["first_seen"] < settings.CALL_STATUS_UNKNOWN_TTL:
+                self._merge(call_sid, update)
+            else:
+                logger.warning(
+                    "Dropping status callback for unknown call",
+                    call_sid=call_sid,
+                    status=update["fields"].get("status")
+                )
+
+        # Write-through mode has no flusher to pick them up again
+        if self._pending and self._task is None and (self._retry_task is None or self._retry_task.done()):
+            self._retry_task = asyncio.create_task(self._retry_later())
+
+    async def _retry_later(self):
+        await asyncio.sleep(settings.CALL_STATUS_RETRY_DELAY)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Call status retry failed: {str(e)}")
+
+    async def flush(self) -> int:
+        """
+        Write buffered updates for known calls with one ordered bulk_write
+
+        Updates for call_sids no call log has yet stay buffered.
+
+        Returns:
+            Number of calls flushed
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+
+            try:
+                db = get_db()
+                known = set(await db.call_logs.distinct("call_sid", {"call_sid": {"$in": list(batch)}}))
+
+                pending = {call_sid: update for call_sid, update in batch.items() if call_sid in known}
+                unknown = {call_sid: update for call_sid, update in batch.items() if call_sid not in known}
+
+                if pending:
+                    await db.call_logs.bulk_write(self._operations(pending), ordered=True)
+            except Exception as e:
+                logger.error(f"Call status flush failed: {str(e)}")
+                # Put the updates back, merging with anything buffered meanwhile
+                for call_sid, update in batch.items():
+                    self._merge(call_sid, update)
+                return 0
+
+            self._hold_unknown(unknown)
+
+            completed = [
+                call_sid for call_sid, update in pending.items()
+                if update["fields"].get("status") == "completed"
+            ]
+            if completed:
+                from app.services.stats_service import record_call_completed
+                for call_sid in completed:
+                    await record_call_completed(call_sid)
+
+            return len(pending)
+
+    async def _run(self):
+        # Woken by stop() instead of cancelled, so a flush is never interrupted mid-write
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), settings.CALL_STATUS_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Call status flusher iteration failed: {str(e)}")
+
+    def start(self):
+        """Start the periodic flusher (called from the app lifespan)"""
+        if settings.CALL_STATUS_FLUSH_INTERVAL and self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flusher and write whatever is still buffered"""
+        self._stopping.set()
+
+        if self._task:
+            await self._task
+            self._task = None
+
+        await self.flush()
+
+
+call_status_buffer = CallStatusBuffer()
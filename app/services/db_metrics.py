@@ -0,0 +1,110 @@
+"""
+MongoDB Driver Metrics - pool checkout waits and command latency
+
+Registered on the Motor client as pymongo event listeners:
+- PoolCheckoutListener: checkouts run on Motor's executor threads, so
+  the start time of each checkout is tracked per thread
+- CommandLatencyListener: per-command latency for /metrics
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+from pymongo import monitoring
+
+from app.services.metrics import MONGO_COMMAND_SECONDS, MONGO_POOL_WAIT_SECONDS
+
+# Recent checkout waits kept for percentiles
+WAIT_SAMPLE_SIZE = 1024
+
+
+class PoolCheckoutListener(monitoring.ConnectionPoolListener):
+    """Measures how long operations wait to check out a pooled connection"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLE_SIZE)
+        self.checkouts = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.connections_created = 0
+        self.connections_closed = 0
+
+    def _elapsed(self) -> float:
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        return time.perf_counter() - started if started is not None else 0.0
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        wait = self._elapsed()
+        MONGO_POOL_WAIT_SECONDS.observe(wait)
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._waits.append(wait)
+
+    def connection_check_out_failed(self, event):
+        self._elapsed()
+        with self._lock:
+            self.failed += 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_checked_in(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Checkout wait statistics in milliseconds"""
+        with self._lock:
+            waits = sorted(self._waits)
+            checkouts = self.checkouts
+
+            return {
+                "checkouts": checkouts,
+                "checkout_failures": self.failed,
+                "connections_open": self.connections_created - self.connections_closed,
+                "avg_wait_ms": round(self.total_wait / checkouts * 1000, 3) if checkouts else 0,
+                "p95_wait_ms": round(waits[int(len(waits) * 0.95) - 1] * 1000, 3) if waits else 0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+
+class CommandLatencyListener(monitoring.CommandListener):
+    """Observes every command's server round trip (from the driver's own timing)"""
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        MONGO_COMMAND_SECONDS.labels(command=event.command_name, status="ok").observe(event.duration_micros / 1e6)
+
+    def failed(self, event):
+        MONGO_COMMAND_SECONDS.labels(command=event.command_name, status="error").observe(event.duration_micros / 1e6)
@@ -0,0 +1,282 @@
+"""
+Index Manager - declarative MongoDB indexes, applied and verified at startup
+
+INDEXES lists every index the app relies on. ensure_indexes() creates
+missing ones (create_index is a no-op for existing identical indexes) and
+index_report() explains the hot queries below, warning about any that
+would fall back to a collection scan.
+"""
+from typing import Dict, Any, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+
+from app.config import get_db, settings
+from app.utils import logger, normalize_industry
+
+# Seconds finished batch work is kept before MongoDB expires it
+BATCH_REQUEST_TTL = 7 * 24 * 3600
+BATCH_TTL = 30 * 24 * 3600
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "call_logs": [
+        # Every voice turn, status callback and recording webhook
+        IndexModel([("call_sid", ASCENDING)], name="call_sid_unique", unique=True, sparse=True),
+        # Call history / recordings per lead (keyset pagination)
+        IndexModel(
+            [("lead_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="lead_id_created_at"
+        ),
+        # Calls created while a stats rebuild ran (stats_service.rebuild_stats)
+        IndexModel([("created_at", DESCENDING)], name="created_at"),
+    ],
+    "leads": [
+        # /history/ listing (keyset pagination). The score key lets
+        # min_score filter on index keys while walking created_at order.
+        IndexModel(
+            [("created_at", DESCENDING), ("_id", DESCENDING), ("ai_visibility_score", ASCENDING)],
+            name="created_at_score"
+        ),
+        # Industry filter: anchored prefix on the normalized slug
+        IndexModel(
+            [("industry_slug", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="industry_slug_created_at"
+        ),
+    ],
+    "analysis_pages": [
+        IndexModel(
+            [("lead_id", ASCENDING), ("page_index", ASCENDING)],
+            name="lead_id_page_index",
+            unique=True
+        ),
+    ],
+    "stats": [
+        # Top industries for /history/stats, industry facets
+        IndexModel([("kind", ASCENDING), ("leads", DESCENDING)], name="kind_leads"),
+        IndexModel([("kind", ASCENDING), ("industry_slug", ASCENDING)], name="kind_industry_slug"),
+    ],
+    "webhook_responses": [
+        # Transient: replayed Twilio webhook responses (webhook_dedup)
+        IndexModel(
+            [("created_at", ASCENDING)],
+            name="created_at_ttl",
+            expireAfterSeconds=settings.WEBHOOK_DEDUP_TTL
+        ),
+    ],
+    "openai_batch_requests": [
+        IndexModel([("custom_id", ASCENDING)], name="custom_id_unique", unique=True),
+        IndexModel([("status", ASCENDING)], name="status"),
+        IndexModel([("claim", ASCENDING)], name="claim", sparse=True),
+        IndexModel([("batch_id", ASCENDING), ("status", ASCENDING)], name="batch_id_status"),
+        # Transient: drop finished requests after a week
+        IndexModel(
+            [("completed_at", ASCENDING)],
+            name="completed_at_ttl",
+            expireAfterSeconds=BATCH_REQUEST_TTL
+        ),
+    ],
+    "openai_batches": [
+        IndexModel([("batch_id", ASCENDING)], name="batch_id_unique", unique=True),
+        IndexModel([("status", ASCENDING)], name="status"),
+        IndexModel(
+            [("completed_at", ASCENDING)],
+            name="completed_at_ttl",
+            expireAfterSeconds=BATCH_TTL
+        ),
+    ],
+}
+
+# Representative shapes of the queries on the request path
+HOT_QUERIES: List[Dict[str, Any]] = [
+    {
+        "name": "call by call_sid",
+        "collection": "call_logs",
+        "filter": {"call_sid": "CA00000000000000000000000000000000"},
+    },
+    {
+        "name": "call history for lead",
+        "collection": "call_logs",
+        "filter": {"lead_id": "000000000000000000000000"},
+        "sort": [("created_at", DESCENDING), ("_id", DESCENDING)],
+    },
+    {
+        "name": "history list",
+        "collection": "leads",
+        "filter": {},
+        "sort": [("created_at", DESCENDING), ("_id", DESCENDING)],
+    },
+    {
+        "name": "history by industry",
+        "collection": "leads",
+        "filter": {"industry_slug": {"$regex": "^dental"}},
+        "sort": [("created_at", DESCENDING), ("_id", DESCENDING)],
+    },
+    {
+        "name": "history by min score",
+        "collection": "leads",
+        "filter": {"ai_visibility_score": {"$gte": 50}},
+        "sort": [("created_at", DESCENDING), ("_id", DESCENDING)],
+    },
+    {
+        "name": "analysis pages for lead",
+        "collection": "analysis_pages",
+        "filter": {"lead_id": "000000000000000000000000"},
+        "sort": [("page_index", ASCENDING)],
+    },
+    {
+        "name": "queued batch requests",
+        "collection": "openai_batch_requests",
+        "filter": {"status": "queued"},
+    },
+    {
+        "name": "batch request by custom_id",
+        "collection": "openai_batch_requests",
+        "filter": {"custom_id": "call_summary-0"},
+    },
+]
+
+
+async def prepare_collections(db):
+    """
+    Data fixes an index needs before it can be built (or be useful)
+
+    Call logs used to be inserted with call_sid: null before Twilio
+    returned a SID. Sparse indexes still index explicit nulls, so those
+    would collide in the unique call_sid index. Older leads have no
+    industry_slug, so industry filters would miss them.
+    """
+    result = await db.call_logs.update_many(
+        {"call_sid": None},
+        {"$unset": {"call_sid": ""}}
+    )
+    if result.modified_count:
+        logger.info(f"Removed null call_sid from {result.modified_count} call logs")
+
+    await backfill_industry_slugs(db)
+
+
+async def backfill_industry_slugs(db, chunk_size: int = 1000):
+    """Set industry_slug on leads written before it existed"""
+    cursor = db.leads.find(
+        {"industry": {"$nin": [None, ""]}, "industry_slug": {"$exists": False}},
+        {"industry": 1}
+    )
+
+    updated = 0
+    updates = []
+    async for lead in cursor:
+        updates.append(UpdateOne(
+            {"_id": lead["_id"]},
+            {"$set": {"industry_slug": normalize_industry(lead["industry"])}}
+        ))
+        if len(updates) >= chunk_size:
+            await db.leads.bulk_write(updates, ordered=False)
+            updated += len(updates)
+            updates = []
+
+    if updates:
+        await db.leads.bulk_write(updates, ordered=False)
+        updated += len(updates)
+
+    if updated:
+        logger.info(f"Backfilled industry_slug on {updated} leads")
+
+
+async def ensure_indexes() -> Dict[str, Any]:
+    """
+    Create missing indexes and verify every registered index exists
+
+    Returns:
+        Dict with applied, failed and missing "collection.index" names
+    """
+    db = get_db()
+    report = {"applied": [], "failed": [], "missing": []}
+
+    try:
+        await prepare_collections(db)
+    except Exception as e:
+        logger.error(f"Index preparation failed: {str(e)}")
+
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+
+        for model in models:
+            name = model.document["name"]
+            try:
+                await collection.create_indexes([model])
+                report["applied"].append(f"{collection_name}.{name}")
+            except Exception as e:
+                logger.error(f"Index {collection_name}.{name} failed: {str(e)}")
+                report["failed"].append(f"{collection_name}.{name}")
+
+        try:
+            existing = await collection.index_information()
+        except Exception as e:
+            logger.error(f"Listing indexes on {collection_name} failed: {str(e)}")
+            continue
+
+        for model in models:
+            name = model.document["name"]
+            if name not in existing:
+                report["missing"].append(f"{collection_name}.{name}")
+
+    if report["missing"]:
+        logger.warning(f"Missing MongoDB indexes: {', '.join(report['missing'])}")
+    else:
+        logger.info(f"MongoDB indexes verified ({len(report['applied'])} registered)")
+
+    return report
+
+
+def plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """Flatten the stage names of an explain() plan tree"""
+    stages = [plan["stage"]] if "stage" in plan else []
+
+    if "inputStage" in plan:
+        stages += plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+
+    # Slot-based engine wraps the classic plan in queryPlan
+    if "queryPlan" in plan:
+        stages += plan_stages(plan["queryPlan"])
+
+    return stages
+
+
+async def index_report() -> List[Dict[str, Any]]:
+    """
+    Explain every hot query and warn about collection scans
+
+    Returns:
+        One entry per hot query with its winning plan stages
+    """
+    db = get_db()
+    results = []
+
+    for query in HOT_QUERIES:
+        cursor = db[query["collection"]].find(query["filter"])
+        if query.get("sort"):
+            cursor = cursor.sort(query["sort"])
+
+        try:
+            explain = await cursor.limit(1).explain()
+            stages = plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        except Exception as e:
+            logger.error(f"Explain failed for '{query['name']}': {str(e)}")
+            continue
+
+        entry = {
+            "name": query["name"],
+            "collection": query["collection"],
+            "stages": stages,
+            "collscan": "COLLSCAN" in stages,
+            "blocking_sort": "SORT" in stages
+        }
+        results.append(entry)
+
+        if entry["collscan"]:
+            logger.warning(f"Hot query '{query['name']}' on {query['collection']} does a collection scan: {stages}")
+        elif entry["blocking_sort"]:
+            logger.warning(f"Hot query '{query['name']}' on {query['collection']} sorts in memory: {stages}")
+
+    return results
@@ -0,0 +1,169 @@
+"""
+Intent Service - canned-response fast path for Sara
+
+Short, high-frequency utterances ("who is this?", "how much is it?",
+"call me back later") are matched with keyword patterns and answered
+from pre-approved responses, skipping the GPT round trip. Anything
+ambiguous (long utterances, several intents, an intent already answered
+in this call, negations or objections) returns None so the caller falls
+back to GPT.
+
+Patterns match question/request forms only: "how much is it?" is a
+pricing question, "how much longer is this going to take?" is not.
+"""
+import re
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+from app.models import CallOutcome
+
+# Intent options:
+#   patterns         - regexes searched in the normalized utterance
+#   response         - pre-approved reply (lead fields via str.format)
+#   max_words        - longer utterances are left to GPT (default 10)
+#   first_turn_only  - only right after the opening question
+#   end_call         - hang up after the reply, saving `outcome`
+#   allow_negation   - match even if the utterance has a negation/objection
+#                      word (only for patterns anchored to the whole utterance)
+INTENTS: List[Dict[str, Any]] = [
+    {
+        "name": "identity",
+        "patterns": [
+            r"\bwho(?: is|'s| are) (?:this|you|calling)\b",
+            r"\bwhat company\b",
+            r"\bwhere (?:are you|is this) calling from\b",
+            r"\bare you (?:a )?(?:real|robot|human|person|ai|bot)\b",
+        ],
+        "response": (
+            "This is Sara from TruFindAI. We help businesses like {business_name} "
+            "show up when people ask AI assistants like ChatGPT for recommendations. "
+            "Do you have a minute to hear what we found on your website?"
+        ),
+    },
+    {
+        "name": "pricing",
+        "patterns": [
+            r"\bhow much (?:is|does|do|would|will|are|for)\b",
+            r"\bwhat(?:'s| is| are| does| do| would) (?:the |your |it |this |that )?(?:price|prices|pricing|cost|costs|fee|fees)\b",
+            r"\bwhat do you charge\b",
+            r"^(?:and |so )?(?:the |your )?(?:price|pricing|cost|fees?)$",
+        ],
+        "response": (
+            "It's a one-time $199 setup, then $39 a month for ongoing optimization, "
+            "with no long-term contract. Would you like to hear what that would fix "
+            "for {business_name}?"
+        ),
+    },
+    {
+        "name": "callback",
+        "patterns": [
+            r"^(?:(?:can|could) you |please |just )?call (?:me |us )?(?:back|later|tomorrow|another time)"
+            r"(?: (?:later|tomorrow|please|another time|next week|in an hour))*$",
+            r"^(?:sorry )?(?:it's |this is )?(?:not a good|a bad|bad) time(?: (?:right now|now|for me|for us))*$",
+            r"^(?:sorry )?(?:i'm|i am|we're|we are) (?:busy|in a meeting|driving)(?: (?:right now|now|at the moment))*$",
+        ],
+        "response": "No problem at all. I'll follow up at a better time. Thanks, and have a great day!",
+        "max_words": 14,
+        "allow_negation": True,
+        "end_call": True,
+        "outcome": CallOutcome.CALLBACK_NEEDED,
+    },
+    {
+        "name": "affirmative",
+        "patterns": [
+            r"^(?:yes|yeah|yep|yup|sure|ok|okay|speaking|go ahead|this is (?:he|she|him|her|me))"
+            r"(?: (?:sure|yes|it is|i do|go ahead|speaking|that's me))?$",
+        ],
+        "response": (
+            "Great, thanks! We ran an analysis of your website and {business_name} "
+            "scored {ai_visibility_score} out of 100 for AI visibility.{top_issue} "
+            "Would you like to hear how we can fix that?"
+        ),
+        "max_words": 5,
+        "first_turn_only": True,
+    },
+]
+
+_COMPILED = [
+    (intent, [re.compile(pattern) for pattern in intent["patterns"]])
+    for intent in INTENTS
+]
+
+
+# Objections and negations change what a keyword means ("I don't care about the price")
+NEGATION_PATTERN = re.compile(
+    r"\b(?:not|no|never|don't|dont|doesn't|didn't|won't|can't|cannot|isn't|aren't|"
+    r"care|already|without|instead)\b"
+)
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, straighten quotes and strip punctuation/extra spaces"""
+    text = (text or "").lower().replace("’", "'")
+    text = re.sub(r"[^a-z0-9'$ ]+", " ", text)
+    return " ".join(text.split())
+
+
+def render_response(intent: Dict[str, Any], lead: Optional[Dict[str, Any]]) -> str:
+    """Fill a response template with lead data"""
+    lead = lead or {}
+    top_issues = lead.get("top_issues") or []
+
+    return intent["response"].format(
+        business_name=lead.get("business_name") or "your business",
+        ai_visibility_score=lead.get("ai_visibility_score", 0),
+        top_issue=f" The biggest issue we found: {top_issues[0].rstrip('.')}." if top_issues else ""
+    )
+
+
+def classify_intent(
+    user_speech: str,
+    conversation: List[Dict[str, str]],
+    lead: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Match an utterance against the canned intents
+
+    Args:
+        user_speech: Caller's utterance (Twilio SpeechResult)
+        conversation: Conversation so far, including this utterance
+        lead: Lead document used to fill the response
+
+    Returns:
+        Dict with intent, response, end_call and outcome - or None to fall back to GPT
+    """
+    if not settings.INTENT_FAST_PATH_ENABLED:
+        return None
+
+    text = normalize_utterance(user_speech)
+    if not text:
+        return None
+
+    words = len(text.split())
+    user_turns = sum(1 for message in conversation if message["role"] == "user")
+    negated = bool(NEGATION_PATTERN.search(text))
+
+    matches = [
+        intent for intent, patterns in _COMPILED
+        if words <= intent.get("max_words", 10)
+        and (user_turns <= 1 or not intent.get("first_turn_only"))
+        and (not negated or intent.get("allow_negation"))
+        and any(pattern.search(text) for pattern in patterns)
+    ]
+
+    # Several intents at once ("who is this and how much is it?") needs GPT
+    if len(matches) != 1:
+        return None
+
+    response = render_response(matches[0], lead)
+
+    # Asked again: a repeated canned answer sounds robotic, let GPT rephrase
+    if any(message["role"] == "assistant" and message["content"] == response for message in conversation):
+        return None
+
+    return {
+        "intent": matches[0]["name"],
+        "response": response,
+        "end_call": matches[0].get("end_call", False),
+        "outcome": matches[0].get("outcome")
+    }
@@ -0,0 +1,180 @@
+"""
+Metrics - Prometheus instrumentation for the hot paths
+
+Histograms and counters are module-level and exposed on GET /metrics
+(OpenMetrics/Prometheus text format). Functions are instrumented with
+the `timed` decorator; cache and fallback counters are bumped inline
+with record_cache / record_fallback.
+
+prometheus_client is optional: without it every metric is a no-op and
+/metrics is not mounted. With several uvicorn workers, set
+PROMETHEUS_MULTIPROC_DIR so all workers report into one scrape.
+
+This module must not import app.config (config imports db_metrics,
+which imports this module) or app.utils (which imports this module).
+"""
+import asyncio
+import functools
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        generate_latest,
+        multiprocess,
+        REGISTRY
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _NoopMetric:
+    """Stand-in when prometheus_client is not installed"""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value: float):
+        pass
+
+    def inc(self, value: float = 1):
+        pass
+
+
+def _histogram(name: str, documentation: str, labels: Tuple[str, ...] = (), buckets: Optional[Tuple[float, ...]] = None):
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    if buckets:
+        return Histogram(name, documentation, labels, buckets=buckets)
+    return Histogram(name, documentation, labels)
+
+
+def _counter(name: str, documentation: str, labels: Tuple[str, ...] = ()):
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    return Counter(name, documentation, labels)
+
+
+# Remote calls that routinely take seconds (GPT, PageSpeed, page loads)
+SLOW_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+# In-process work and database round trips
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+PAGE_FETCH_SECONDS = _histogram(
+    "trufind_page_fetch_seconds", "Website page download time", ("source",), SLOW_BUCKETS
+)
+PAGE_PARSE_SECONDS = _histogram(
+    "trufind_page_parse_seconds", "HTML parse and extraction time", (), FAST_BUCKETS
+)
+OPENAI_REQUEST_SECONDS = _histogram(
+    "trufind_openai_request_seconds", "OpenAI API call latency", ("operation",), SLOW_BUCKETS
+)
+OPENAI_TOKENS = _counter(
+    "trufind_openai_tokens", "OpenAI tokens used", ("operation", "model", "kind")
+)
+PAGESPEED_SECONDS = _histogram(
+    "trufind_pagespeed_request_seconds", "PageSpeed Insights API latency", (), SLOW_BUCKETS
+)
+TWILIO_REQUEST_SECONDS = _histogram(
+    "trufind_twilio_request_seconds", "Twilio REST API latency", ("operation",), SLOW_BUCKETS
+)
+MONGO_COMMAND_SECONDS = _histogram(
+    "trufind_mongo_command_seconds", "MongoDB command latency", ("command", "status"), FAST_BUCKETS
+)
+MONGO_POOL_WAIT_SECONDS = _histogram(
+    "trufind_mongo_pool_wait_seconds", "Wait to check out a pooled MongoDB connection", (), FAST_BUCKETS
+)
+S3_UPLOAD_SECONDS = _histogram(
+    "trufind_s3_upload_seconds", "S3 upload time", (), SLOW_BUCKETS
+)
+S3_UPLOAD_BYTES = _counter(
+    "trufind_s3_upload_bytes", "Bytes uploaded to S3 (rate / upload seconds = throughput)"
+)
+CACHE_REQUESTS = _counter(
+    "trufind_cache_requests", "Cache lookups", ("cache", "result")
+)
+LOG_RECORDS_DROPPED = _counter(
+    "trufind_log_records_dropped", "Log records dropped because the log queue was full", ("level",)
+)
+FALLBACKS = _counter(
+    "trufind_fallbacks", "Failures answered with a fallback/default result", ("subsystem", "reason")
+)
+
+
+def timed(metric, **labels: str):
+    """
+    Decorator observing a function's wall time in a histogram
+
+    Works for sync and async functions. Label values are bound once at
+    decoration time, so the per-call cost is two perf_counter() calls.
+
+    Args:
+        metric: Histogram to observe into
+        labels: Label values for the histogram
+    """
+    child = metric.labels(**labels) if labels else metric
+
+    def decorator(func: Callable):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    child.observe(time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def record_cache(cache: str, hit: bool):
+    """Count a cache lookup"""
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def record_fallback(subsystem: str, reason: str):
+    """Count a failure that was answered with a default/fallback result"""
+    FALLBACKS.labels(subsystem=subsystem, reason=reason).inc()
+
+
+def record_tokens(operation: str, response: Any):
+    """Count prompt/completion tokens from an OpenAI response's usage"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+
+    model = getattr(response, "model", None) or "unknown"
+    OPENAI_TOKENS.labels(operation=operation, model=model, kind="prompt").inc(usage.prompt_tokens or 0)
+    OPENAI_TOKENS.labels(operation=operation, model=model, kind="completion").inc(usage.completion_tokens or 0)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Exposition body and content type for GET /metrics"""
+    if not PROMETHEUS_AVAILABLE:
+        return b"", CONTENT_TYPE_LATEST
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -2,16 +2,18 @@
 OpenAI Service - GPT, Whisper, TTS Integration
 """
 from openai import AsyncOpenAI
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import base64
 
 from app.config import settings
 from app.utils import logger
+from app.services.metrics import OPENAI_REQUEST_SECONDS, record_fallback, record_tokens, timed
 
 # Initialize OpenAI client
-client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
 
 
+@timed(OPENAI_REQUEST_SECONDS, operation="chat")
 async def generate_chat_response(
     messages: List[Dict[str, str]],
     system_prompt: str = None,
@@ -50,6 +52,7 @@ async def generate_chat_response(
             max_tokens=500
         )
         
+        record_tokens("chat", response)
         ai_response = response.choices[0].message.content
         logger.info(f"Generated response: {ai_response[:100]}...")
         
@@ -57,9 +60,11 @@ async def generate_chat_response(
         
     except Exception as e:
         logger.error(f"GPT-4 generation failed: {str(e)}")
+        record_fallback("openai_chat", "error")
         return "I apologize, but I'm having trouble processing that right now."
 
 
+@timed(OPENAI_REQUEST_SECONDS, operation="transcription")
 async def transcribe_audio(audio_data: bytes, language: str = "en") -> str:
     """
     Transcribe audio using Whisper
@@ -74,32 +79,23 @@ async def transcribe_audio(audio_data: bytes, language: str = "en") -> str:
     try:
         logger.info("Transcribing audio with Whisper...")
         
-        # Save audio temporarily
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-            temp_audio.write(audio_data)
-            temp_audio_path = temp_audio.name
-        
-        # Transcribe
-        with open(temp_audio_path, "rb") as audio_file:
-            transcript = await client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=language
-            )
-        
-        # Cleanup
-        import os
-        os.unlink(temp_audio_path)
+        # Transcribe from memory (no temp file) - filename sets the audio format
+        transcript = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=("audio.wav", audio_data),
+            language=language
+        )
         
         logger.info(f"Transcription: {transcript.text[:100]}...")
         return transcript.text
         
     except Exception as e:
         logger.error(f"Whisper transcription failed: {str(e)}")
+        record_fallback("openai_transcription", "error")
         return ""
 
 
+@timed(OPENAI_REQUEST_SECONDS, operation="tts")
 async def text_to_speech(text: str, voice: str = "nova") -> bytes:
     """
     Convert text to speech using OpenAI TTS
@@ -128,28 +124,13 @@ async def text_to_speech(text: str, voice: str = "nova") -> bytes:
         
     except Exception as e:
         logger.error(f"TTS generation failed: {str(e)}")
+        record_fallback("openai_tts", "error")
         return b""
 
 
-async def generate_sara_response(
-    user_message: str,
-    lead_data: Dict[str, Any],
-    conversation_history: List[Dict[str, str]]
-) -> str:
-    """
-    Generate Sara's response based on lead context
-    
-    Args:
-        user_message: What the user said
-        lead_data: Lead information from database
-        conversation_history: Previous conversation
-    
-    Returns:
-        Sara's response
-    """
-    try:
-        # Build Sara's context
-        system_prompt = f"""
+def build_sara_system_prompt(lead_data: Dict[str, Any]) -> str:
+    """Sara's system prompt for a lead (rendered once per call when pre-warmed)"""
+    return f"""
 You are Sara, an AI sales agent for TruFindAI. You're calling to help businesses improve their AI visibility.
 
 LEAD CONTEXT:
@@ -177,6 +158,30 @@ IMPORTANT:
 - Handle objections with empathy
 """
 
+
+async def generate_sara_response(
+    user_message: str,
+    lead_data: Dict[str, Any],
+    conversation_history: List[Dict[str, str]],
+    system_prompt: Optional[str] = None
+) -> str:
+    """
+    Generate Sara's response based on lead context
+    
+    Args:
+        user_message: What the user said
+        lead_data: Lead information from database
+        conversation_history: Previous conversation
+        system_prompt: Pre-rendered build_sara_system_prompt(lead_data)
+    
+    Returns:
+        Sara's response
+    """
+    try:
+        # Build Sara's context
+        if system_prompt is None:
+            system_prompt = build_sara_system_prompt(lead_data)
+
         # Add user message to history
         messages = conversation_history + [
             {"role": "user", "content": user_message}
@@ -199,6 +204,8 @@ IMPORTANT:
 async def summarize_conversation(transcript: str) -> Dict[str, Any]:
     """
     Summarize call conversation and extract key points
+
+    Kept for backward compatibility - see summary_service.summarize_call
     
     Returns:
         - summary: Brief conversation summary
@@ -207,52 +214,5 @@ async def summarize_conversation(transcript: str) -> Dict[str, Any]:
         - objections: Customer objections raised
         - next_steps: Recommended follow-up
     """
-    try:
-        logger.info("Summarizing conversation...")
-        
-        prompt = f"""
-Analyze this sales call transcript and provide a JSON summary.
-
-Transcript:
-{transcript}
-
-Provide a JSON response with:
-{{
-  "summary": "Brief 2-3 sentence summary",
-  "outcome": "success|callback_needed|not_interested|no_answer",
-  "interest_level": "high|medium|low|none",
-  "key_points": ["list of key discussion points"],
-  "objections": ["list of objections raised"],
-  "next_steps": "recommended follow-up action"
-}}
-"""
-
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a sales call analyst. Analyze conversations and extract actionable insights. Return only valid JSON."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
-        )
-        
-        import json
-        summary = json.loads(response.choices[0].message.content)
-        
-        return summary
-        
-    except Exception as e:
-        logger.error(f"Conversation summarization failed: {str(e)}")
-        return {
-            "summary": "Summary unavailable",
-            "outcome": "unknown",
-            "key_points": [],
-            "objections": []
-        }
\ No newline at end of file
+    from app.services.summary_service import summarize_call
+    return await summarize_call(transcript)
@@ -0,0 +1,142 @@
+"""
+Pagination Helpers - keyset cursors and cached counts
+
+Listings are sorted by (created_at, _id) descending. A cursor encodes the
+last document of a page, so the next page is an index range scan instead
+of skipping over every earlier document.
+"""
+import base64
+import json
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+from bson import ObjectId
+
+from app.config import settings
+from app.services.metrics import record_cache
+
+KEYSET_SORT = [("created_at", -1), ("_id", -1)]
+
+# Expired entries are purged once the cache grows past this size
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+# "collection:query" -> (expires_at, count)
+_count_cache: Dict[str, Tuple[float, int]] = {}
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just after this document"""
+    created_at = doc.get("created_at")
+    raw = f"{created_at.isoformat() if created_at else ''}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], ObjectId]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, _id = raw.split("|", 1)
+        return (
+            datetime.fromisoformat(created_at) if created_at else None,
+            ObjectId(_id)
+        )
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def keyset_filter(query: Dict[str, Any], cursor: Optional[str]) -> Dict[str, Any]:
+    """Add the "after cursor" condition to a query"""
+    if not cursor:
+        return query
+
+    created_at, last_id = decode_cursor(cursor)
+
+    if created_at is None:
+        # Documents without created_at sort last; page through them by _id
+        after = {"created_at": None, "_id": {"$lt": last_id}}
+    else:
+        after = {
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": last_id}},
+                {"created_at": None}
+            ]
+        }
+
+    return {"$and": [query, after]} if query else after
+
+
+async def fetch_page(
+    collection,
+    query: Dict[str, Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    skip: int = 0
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page of a (created_at, _id) descending listing
+
+    Args:
+        collection: Motor collection
+        query: Base filter
+        limit: Page size
+        cursor: Cursor from the previous page (None for the first page)
+        projection: Optional Mongo projection
+        skip: Legacy offset, only applied to the first page (no cursor)
+
+    Returns:
+        (documents, next_cursor) - next_cursor is None on the last page
+    """
+    if projection is not None:
+        projection = {**projection, "created_at": 1}
+
+    find = collection.find(keyset_filter(query, cursor), projection).sort(KEYSET_SORT)
+    if skip and not cursor:
+        find = find.skip(skip)
+
+    docs = await find.limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1])
+
+    return docs, next_cursor
+
+
+async def cached_count(collection, query: Dict[str, Any]) -> int:
+    """
+    Document count, cached for COUNT_CACHE_TTL seconds
+
+    Unfiltered counts use collection metadata (estimated_document_count)
+    instead of scanning.
+    """
+    key = f"{collection.name}:{json.dumps(query, sort_keys=True, default=str)}"
+    now = time.monotonic()
+
+    cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        record_cache("count", True)
+        return cached[1]
+
+    record_cache("count", False)
+
+    if query:
+        count = await collection.count_documents(query)
+    else:
+        count = await collection.estimated_document_count()
+
+    if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+        for stale in [k for k, (expires, _) in _count_cache.items() if expires <= now]:
+            del _count_cache[stale]
+
+    _count_cache[key] = (now + settings.COUNT_CACHE_TTL, count)
+    return count
@@ -0,0 +1,292 @@
+"""
+Profiler - sampling profiler for production hot spots (admin only)
+
+A SIGPROF timer samples the event-loop thread's stack after every
+PROFILER_INTERVAL_MS of CPU time (nothing is hooked into function
+calls, so the overhead is the sampling itself and only while a profile
+is being taken). Waiting on I/O uses no CPU and takes no samples, so
+the profile shows where CPU goes; time spent blocked shows up in the
+request's duration, not its stacks.
+
+Two ways to profile:
+- a window: POST /api/v1/admin/profile?seconds=N samples everything
+- a single request: send X-Profile: 1 with X-Admin-Key; the profile is
+  kept in memory and its id returned in the X-Profile-Id header
+
+Samples are attributed to the request whose task (or a task it
+spawned, e.g. the page fetches of a deep analysis) was running, and
+tagged by route group (analysis, webhooks, sara, ...). Output is
+folded stacks ("tag;frame;frame count" per line), which flamegraph.pl,
+speedscope and inferno read directly.
+
+Work pushed to threads (asyncio.to_thread) is not attributed: its CPU
+time fires the timer too, but the sample shows the loop waiting in
+select() ("idle"). Signals are handled on the main thread, so the
+event loop must run there (as under uvicorn).
+"""
+import asyncio
+import hmac
+import itertools
+import signal
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils import logger
+
+# First path segment after the API prefix -> tag
+ROUTE_GROUPS = ("analysis", "webhooks", "sara", "history", "recordings", "audio", "admin")
+
+MAX_STACK_DEPTH = 128
+
+_profile_ids = itertools.count(1)
+_recent_profiles: deque = deque(maxlen=settings.PROFILER_KEEP)
+
+
+def route_tag(path: str) -> str:
+    """Route group of a request path ("other" outside the API routers)"""
+    prefix = settings.API_V1_PREFIX.rstrip("/") + "/"
+    if path.startswith(prefix):
+        group = path[len(prefix):].split("/", 1)[0]
+        if group in ROUTE_GROUPS:
+            return group
+    return "other"
+
+
+def is_admin_key(key: Optional[str]) -> bool:
+    """Constant-time check against ADMIN_API_KEY (always False when unset)"""
+    if not settings.ADMIN_API_KEY or not key:
+        return False
+    return hmac.compare_digest(key.encode(), settings.ADMIN_API_KEY.encode())
+
+
+def fold_stack(frame) -> str:
+    """Root-to-leaf "module.function" frames joined with ';'"""
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}.{getattr(code, 'co_qualname', code.co_name)}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+class ProfileSession:
+    """Folded-stack counts of one profile (a window or a single request)"""
+
+    def __init__(self, request_id: Optional[int] = None):
+        self.request_id = request_id
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self.started_at = datetime.utcnow()
+        self._start = time.perf_counter()
+        self.duration_ms = 0.0
+
+    def add(self, stack: str, tag: Optional[Tuple[str, Optional[int]]]):
+        if self.request_id is not None and (tag is None or tag[1] != self.request_id):
+            return
+        label = tag[0] if tag else "idle"
+        self.counts[f"{label};{stack}"] += 1
+        self.samples += 1
+
+    def finish(self):
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 2)
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.counts.most_common())
+
+
+class StackSampler:
+    """
+    Samples the event-loop thread while at least one session is active
+
+    ITIMER_PROF delivers SIGPROF after every PROFILER_INTERVAL_MS of
+    CPU time; the handler runs on the loop thread, between bytecodes
+    of whatever it was executing, and records that frame and the
+    current task. While running, a loop task factory makes new tasks
+    inherit the request tag of the task that created them.
+    """
+
+    def __init__(self):
+        self._sessions: List[ProfileSession] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+        self._previous_factory = None
+        self._previous_handler = None
+        self._task_tags: "weakref.WeakKeyDictionary[asyncio.Task, Tuple[str, Optional[int]]]" = weakref.WeakKeyDictionary()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._sessions)
+
+    @staticmethod
+    def available() -> bool:
+        """SIGPROF exists and this is the main thread (where Python runs signal handlers)"""
+        return hasattr(signal, "SIGPROF") and threading.current_thread() is threading.main_thread()
+
+    def _task_factory(self, loop, coro, context=None):
+        if self._previous_factory is not None:
+            task = self._previous_factory(loop, coro) if context is None else self._previous_factory(loop, coro, context=context)
+        else:
+            task = asyncio.Task(coro, loop=loop) if context is None else asyncio.Task(coro, loop=loop, context=context)
+
+        parent = asyncio.current_task(loop)
+        if parent is not None and parent in self._task_tags:
+            self._task_tags[task] = self._task_tags[parent]
+        return task
+
+    def tag_current_task(self, tag: str, request_id: Optional[int] = None):
+        task = asyncio.current_task()
+        if task is not None:
+            self._task_tags[task] = (tag, request_id)
+
+    def add(self, session: ProfileSession):
+        """Start sampling for a session (call from the event loop)"""
+        self._sessions.append(session)
+        if self._running:
+            return
+
+        if not self.available():
+            logger.warning("Profiler needs SIGPROF and an event loop on the main thread, not sampling")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._previous_factory = self._loop.get_task_factory()
+        self._loop.set_task_factory(self._task_factory)
+
+        interval = settings.PROFILER_INTERVAL_MS / 1000
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        self._running = True
+
+    def remove(self, session: ProfileSession):
+        """Stop sampling for a session (call from the event loop)"""
+        session.finish()
+        if session in self._sessions:
+            self._sessions.remove(session)
+        if self._sessions or not self._running:
+            return
+
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self._previous_handler = None
+        self._running = False
+
+        self._loop.set_task_factory(self._previous_factory)
+        self._previous_factory = None
+        self._task_tags = weakref.WeakKeyDictionary()
+
+    def _sample(self, signum, frame):
+        """SIGPROF handler: attribute the interrupted frame to the running task"""
+        if frame is None:
+            return
+
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+
+        stack = fold_stack(frame)
+        tag = self._task_tags.get(task) if task is not None else None
+        if tag is None and task is not None:
+            tag = ("other", None)
+
+        for session in tuple(self._sessions):
+            session.add(stack, tag)
+
+
+sampler = StackSampler()
+
+
+async def profile_window(seconds: float) -> ProfileSession:
+    """Sample everything on this worker for `seconds`"""
+    session = ProfileSession()
+    sampler.add(session)
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.remove(session)
+
+    logger.info("Profile window finished", seconds=seconds, samples=session.samples)
+    return session
+
+
+def recent_profiles() -> List[Dict[str, Any]]:
+    """Metadata of the kept per-request profiles (newest first)"""
+    return [
+        {key: value for key, value in profile.items() if key != "folded"}
+        for profile in reversed(_recent_profiles)
+    ]
+
+
+def get_profile(profile_id: int) -> Optional[Dict[str, Any]]:
+    for profile in _recent_profiles:
+        if profile["id"] == profile_id:
+            return profile
+    return None
+
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware: tags requests while sampling, profiles on demand
+
+    X-Profile: 1 together with a valid X-Admin-Key profiles that
+    request. Otherwise requests are only tagged with their route group,
+    and only while a profile is being taken.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile_requested = False
+        admin_key = None
+        for header, value in scope.get("headers", []):
+            if header == b"x-profile":
+                profile_requested = value not in (b"", b"0", b"false")
+            elif header == b"x-admin-key":
+                admin_key = value.decode("latin-1")
+
+        tag = route_tag(scope["path"])
+
+        if not (profile_requested and is_admin_key(admin_key)):
+            if sampler.active:
+                sampler.tag_current_task(tag)
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = next(_profile_ids)
+        session = ProfileSession(request_id=profile_id)
+        sampler.add(session)
+        sampler.tag_current_task(tag, profile_id)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", str(profile_id).encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.remove(session)
+            _recent_profiles.append({
+                "id": profile_id,
+                "route": tag,
+                "method": scope["method"],
+                "path": scope["path"],
+                "started_at": session.started_at.isoformat(),
+                "duration_ms": session.duration_ms,
+                "samples": session.samples,
+                "folded": session.folded()
+            })
+            logger.info("Request profiled", profile_id=profile_id, path=scope["path"], samples=session.samples)
@@ -1,20 +1,66 @@
 """
 Sara AI Agent - Conversation Orchestration
 """
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, List, Set
 from datetime import datetime
 from bson import ObjectId
 
 from app.config import get_db, settings
 from app.models import CallLog, CallStatus, CallOutcome
 from app.services.twilio_service import make_call, create_voice_response, end_call
-from app.services.openai_service import generate_sara_response, summarize_conversation
+from app.services.audio_cache import cached_audio_url
+from app.services import call_context
+from app.services.turn_timer import turn_stage
+from app.services.tracing import correlate, current_traceparent, traced
+from app.services.openai_service import generate_sara_response
+from app.services.intent_service import INTENTS, classify_intent
+from app.services.summary_service import summarize_call
+from app.services.stats_service import record_call_created, record_call_completed
 from app.utils import logger
+from app.services.metrics import record_cache
 
 # In-memory conversation storage (for active calls)
 active_conversations: Dict[str, List[Dict[str, str]]] = {}
 
+# Fixed lines, pre-synthesized at startup when TTS_CACHE_ENABLED
+ERROR_GOODBYE = "Sorry, there was an error. Goodbye."
+MISSING_CALL_GOODBYE = "Thank you for your time. Goodbye."
+NOT_INTERESTED_GOODBYE = "I understand. Thank you for your time. Have a great day!"
+MAX_TURNS_GOODBYE = "Thank you so much for your time. I'll send you more information via email. Have a great day!"
+TECHNICAL_ISSUE_GOODBYE = "Sorry, there was a technical issue. Please visit trufindai.com for more information."
 
+STATIC_PHRASES = [
+    ERROR_GOODBYE,
+    MISSING_CALL_GOODBYE,
+    NOT_INTERESTED_GOODBYE,
+    MAX_TURNS_GOODBYE,
+    TECHNICAL_ISSUE_GOODBYE,
+    # Canned intent replies that don't depend on the lead
+    *(intent["response"] for intent in INTENTS if "{" not in intent["response"]),
+]
+
+# Keeps fire-and-forget pre-warm tasks referenced until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def opening_message(lead: Dict[str, Any]) -> str:
+    """Sara's opening line for a lead (pre-synthesized while the phone rings)"""
+    return f"""
+Hi, this is Sara from TruFindAI. 
+Am I speaking with someone from {lead.get('business_name')}? 
+I noticed your website has some AI visibility issues that are preventing 
+search engines and AI assistants like ChatGPT from properly understanding your business. 
+Do you have a moment to discuss how we can help fix this?
+""".strip()
+
+
+def say_and_end(message: str) -> str:
+    """end_call, playing pre-synthesized audio when cached"""
+    return end_call(message, audio_url=cached_audio_url(message))
+
+
+@traced("sara.initiate_call")
 async def initiate_sara_call(lead_id: str, lead_data: Dict[str, Any], phone_number: str):
     """
     Initiate Sara call to a lead
@@ -40,12 +86,32 @@ async def initiate_sara_call(lead_id: str, lead_data: Dict[str, Any], phone_numb
             started_at=datetime.utcnow()
         )
         
-        result = await db.call_logs.insert_one(call_log.model_dump())
+        # call_sid is set once Twilio accepts the call (unique sparse index)
+        call_log_doc = call_log.model_dump()
+        call_log_doc.pop("call_sid", None)
+        
+        result = await db.call_logs.insert_one(call_log_doc)
         call_log_id = str(result.inserted_id)
+        await record_call_created()
+        
+        correlate(call_log_id=call_log_id)
+        traceparent = current_traceparent()
+        
+        # Pre-warm lead, prompt and opening line while the phone rings
+        if settings.SARA_PREWARM_ENABLED and lead_data:
+            context = call_context.create_context(call_log_id, lead_data, opening_message(lead_data))
+            context["traceparent"] = traceparent
+            task = asyncio.create_task(call_context.warm_up(context))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
         
         # Prepare webhook URL (this should be your public URL)
-        webhook_url = f"https://richelle-nonfictive-derivationally.ngrok-free.dev/api/v1/webhooks/twilio/voice?lead_id={lead_id}&call_log_id={call_log_id}"
-        status_callback = f"https://richelle-nonfictive-derivationally.ngrok-free.dev/api/v1/webhooks/twilio/status"
+        base_url = settings.PUBLIC_BASE_URL.rstrip("/")
+        webhook_url = f"{base_url}{settings.API_V1_PREFIX}/webhooks/twilio/voice?lead_id={lead_id}&call_log_id={call_log_id}"
+        if traceparent:
+            # Voice and recording webhooks continue this trace
+            webhook_url += f"&traceparent={traceparent}"
+        status_callback = f"{base_url}{settings.API_V1_PREFIX}/webhooks/twilio/status"
         
         # Make call via Twilio
         call_result = await make_call(
@@ -55,6 +121,8 @@ async def initiate_sara_call(lead_id: str, lead_data: Dict[str, Any], phone_numb
         )
         
         if call_result.get("success"):
+            correlate(call_sid=call_result["call_sid"])
+            
             # Update call log with Twilio SID
             await db.call_logs.update_one(
                 {"_id": ObjectId(call_log_id)},
@@ -85,6 +153,7 @@ async def initiate_sara_call(lead_id: str, lead_data: Dict[str, Any], phone_numb
         logger.error(f"Sara call initiation failed: {str(e)}")
 
 
+@traced("sara.start_conversation")
 async def start_conversation(call_sid: str, call_data: Dict[str, Any]):
     """
     Start Sara conversation when call is answered
@@ -92,50 +161,51 @@ async def start_conversation(call_sid: str, call_data: Dict[str, Any]):
     This is called by Twilio webhook when call connects
     """
     try:
-        logger.info(f"Starting Sara conversation: {call_sid}")
-        
-        # Get lead data from database
-        lead_id = call_data.get("lead_id")
-        
-        if not lead_id:
-            logger.error("No lead_id in call data")
-            return end_call("Sorry, there was an error. Goodbye.")
+        logger.info("Starting Sara conversation", call_sid=call_sid)
         
-        db = get_db()
-        lead = await db.leads.find_one({"_id": ObjectId(lead_id)})
-        
-        if not lead:
-            logger.error(f"Lead not found: {lead_id}")
-            return end_call("Sorry, there was an error. Goodbye.")
-        
-        # Initialize conversation history
-        active_conversations[call_sid] = []
-        
-        # Generate Sara's opening message
-        opening_message = f"""
-Hi, this is Sara from TruFindAI. 
-Am I speaking with someone from {lead.get('business_name')}? 
-I noticed your website has some AI visibility issues that are preventing 
-search engines and AI assistants like ChatGPT from properly understanding your business. 
-Do you have a moment to discuss how we can help fix this?
-"""
-        
-        # Add to conversation history
-        active_conversations[call_sid].append({
-            "role": "assistant",
-            "content": opening_message.strip()
-        })
-        
-        # Create TwiML response
-        response = create_voice_response(opening_message.strip(), gather_input=True)
+        # Warm context prepared by initiate_sara_call (no lookups)
+        with turn_stage("lookup"):
+            context = call_context.attach_call_sid(call_data.get("call_log_id"), call_sid)
+            
+            if context:
+                opening = context["opening"]
+                active_conversations[call_sid] = context["conversation"]
+            else:
+                # Get lead data from database
+                lead_id = call_data.get("lead_id")
+                
+                if not lead_id:
+                    logger.error("No lead_id in call data")
+                    return say_and_end(ERROR_GOODBYE)
+                
+                db = get_db()
+                lead = await db.leads.find_one({"_id": ObjectId(lead_id)})
+                
+                if not lead:
+                    logger.error(f"Lead not found: {lead_id}")
+                    return say_and_end(ERROR_GOODBYE)
+                
+                # Generate Sara's opening message
+                opening = opening_message(lead)
+                
+                # Initialize conversation history
+                active_conversations[call_sid] = [{
+                    "role": "assistant",
+                    "content": opening
+                }]
+        
+        # Create TwiML response (<Play> if synthesized during ringing)
+        with turn_stage("twiml"):
+            response = create_voice_response(opening, gather_input=True, audio_url=cached_audio_url(opening))
         
         return response
         
     except Exception as e:
         logger.error(f"Start conversation failed: {str(e)}")
-        return end_call("Sorry, there was an error. Goodbye.")
+        return say_and_end(ERROR_GOODBYE)
 
 
+@traced("sara.handle_voice_input")
 async def handle_voice_input(call_sid: str, user_speech: str):
     """
     Handle user's voice input during call
@@ -149,7 +219,7 @@ async def handle_voice_input(call_sid: str, user_speech: str):
     4. Return TwiML response
     """
     try:
-        logger.info(f"User said: {user_speech[:100]}")
+        logger.info("User said", call_sid=call_sid, speech=user_speech[:100])
         
         # Get conversation history
         conversation = active_conversations.get(call_sid, [])
@@ -160,15 +230,21 @@ async def handle_voice_input(call_sid: str, user_speech: str):
             "content": user_speech
         })
         
-        # Get lead data
-        db = get_db()
-        call_log = await db.call_logs.find_one({"call_sid": call_sid})
-        
-        if not call_log:
-            logger.error("Call log not found")
-            return end_call("Thank you for your time. Goodbye.")
-        
-        lead = await db.leads.find_one({"_id": ObjectId(call_log["lead_id"])})
+        # Get lead data (from the warm context when this worker started the call)
+        with turn_stage("lookup"):
+            context = call_context.get_context(call_sid)
+            
+            if context:
+                lead = context["lead"]
+            else:
+                db = get_db()
+                call_log = await db.call_logs.find_one({"call_sid": call_sid})
+                
+                if not call_log:
+                    logger.error("Call log not found")
+                    return say_and_end(MISSING_CALL_GOODBYE)
+                
+                lead = await db.leads.find_one({"_id": ObjectId(call_log["lead_id"])})
         
         # Check if user wants to end call
         end_phrases = ["not interested", "no thank", "don't call", "goodbye", "bye", "hang up"]
@@ -176,20 +252,53 @@ async def handle_voice_input(call_sid: str, user_speech: str):
             logger.info("User requested to end call")
             
             # Save conversation and outcome
-            await save_call_outcome(
-                call_sid=call_sid,
-                conversation=conversation,
-                outcome=CallOutcome.NOT_INTERESTED
-            )
+            with turn_stage("save_outcome"):
+                await save_call_outcome(
+                    call_sid=call_sid,
+                    conversation=conversation,
+                    outcome=CallOutcome.NOT_INTERESTED
+                )
             
-            return end_call("I understand. Thank you for your time. Have a great day!")
+            return say_and_end(NOT_INTERESTED_GOODBYE)
         
-        # Generate Sara's response
-        sara_response = await generate_sara_response(
-            user_message=user_speech,
-            lead_data=lead,
-            conversation_history=conversation
-        )
+        # Common intents are answered from canned responses, skipping GPT
+        with turn_stage("intent"):
+            intent = classify_intent(user_speech, conversation, lead)
+        record_cache("intent_fast_path", intent is not None)
+        
+        if intent:
+            logger.info("Intent fast path", call_sid=call_sid, intent=intent["intent"])
+            sara_response = intent["response"]
+            
+            if intent["end_call"]:
+                conversation.append({
+                    "role": "assistant",
+                    "content": sara_response
+                })
+                
+                with turn_stage("save_outcome"):
+                    await save_call_outcome(
+                        call_sid=call_sid,
+                        conversation=conversation,
+                        outcome=intent["outcome"]
+                    )
+                
+                return say_and_end(sara_response)
+        else:
+            # Reply generated speculatively during ringing, if the answer was predicted
+            sara_response = call_context.take_speculative_reply(context, user_speech, conversation) if context else None
+            
+            if sara_response:
+                logger.info("Speculative reply used", call_sid=call_sid)
+            else:
+                # Generate Sara's response
+                with turn_stage("llm"):
+                    sara_response = await generate_sara_response(
+                        user_message=user_speech,
+                        lead_data=lead,
+                        conversation_history=conversation,
+                        system_prompt=context["system_prompt"] if context else None
+                    )
         
         # Add Sara's response to history
         conversation.append({
@@ -201,30 +310,34 @@ async def handle_voice_input(call_sid: str, user_speech: str):
         active_conversations[call_sid] = conversation
         
         # Save transcript to database periodically
-        await save_transcript(call_sid, conversation)
+        with turn_stage("save_transcript"):
+            await save_transcript(call_sid, conversation)
         
         # Check if conversation should end (max 10 exchanges)
         if len(conversation) >= 20:  # 10 user + 10 Sara messages
             logger.info("Max conversation length reached")
             
-            await save_call_outcome(
-                call_sid=call_sid,
-                conversation=conversation,
-                outcome=CallOutcome.CALLBACK_NEEDED
-            )
+            with turn_stage("save_outcome"):
+                await save_call_outcome(
+                    call_sid=call_sid,
+                    conversation=conversation,
+                    outcome=CallOutcome.CALLBACK_NEEDED
+                )
             
-            return end_call("Thank you so much for your time. I'll send you more information via email. Have a great day!")
+            return say_and_end(MAX_TURNS_GOODBYE)
         
         # Continue conversation
-        response = create_voice_response(sara_response, gather_input=True)
+        with turn_stage("twiml"):
+            response = create_voice_response(sara_response, gather_input=True, audio_url=cached_audio_url(sara_response))
         
         return response
         
     except Exception as e:
         logger.error(f"Handle voice input failed: {str(e)}")
-        return end_call("Sorry, there was a technical issue. Please visit trufindai.com for more information.")
+        return say_and_end(TECHNICAL_ISSUE_GOODBYE)
 
 
+@traced("sara.save_transcript")
 async def save_transcript(call_sid: str, conversation: List[Dict[str, str]]):
     """Save conversation transcript to database"""
     try:
@@ -248,6 +361,7 @@ async def save_transcript(call_sid: str, conversation: List[Dict[str, str]]):
         logger.error(f"Save transcript failed: {str(e)}")
 
 
+@traced("sara.save_call_outcome", attributes=("outcome",))
 async def save_call_outcome(
     call_sid: str,
     conversation: List[Dict[str, str]],
@@ -271,8 +385,8 @@ async def save_call_outcome(
         
         transcript_text = "\n\n".join(transcript_lines)
         
-        # Generate summary using AI
-        summary = await summarize_conversation(transcript_text)
+        # Generate summary using AI (the recording webhook reuses it)
+        summary = await summarize_call(transcript_text)
         
         # Update call log
         await db.call_logs.update_one(
@@ -282,13 +396,18 @@ async def save_call_outcome(
                     "status": CallStatus.COMPLETED,
                     "outcome": outcome,
                     "transcript": transcript_text,
+                    "transcript_hash": summary.get("transcript_hash"),
                     "conversation_summary": summary.get("summary"),
                     "key_points": summary.get("key_points", []),
                     "objections": summary.get("objections", []),
+                    "interest_level": summary.get("interest_level"),
+                    "next_steps": summary.get("next_steps"),
+                    "summary_source": "live",
                     "ended_at": datetime.utcnow()
                 }
             }
         )
+        await record_call_completed(call_sid)
         
         # Update lead status
         call_log = await db.call_logs.find_one({"call_sid": call_sid})
@@ -306,6 +425,7 @@ async def save_call_outcome(
         # Clean up in-memory conversation
         if call_sid in active_conversations:
             del active_conversations[call_sid]
+        call_context.release(call_sid)
         
         logger.info("Call outcome saved successfully")
         
@@ -209,11 +209,20 @@ import asyncio
 
 from app.config import settings
 from app.utils import logger
+from app.services.tracing import traced
+from app.services.metrics import (
+    OPENAI_REQUEST_SECONDS,
+    PAGESPEED_SECONDS,
+    record_fallback,
+    record_tokens,
+    timed
+)
 
 # Initialize OpenAI client
-openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
 
 
+@traced("scoring.analyze_ai_visibility_deep")
 async def analyze_ai_visibility_deep(scraped_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep AI visibility analysis across multiple pages
@@ -300,14 +309,14 @@ async def analyze_ai_visibility_deep(scraped_data: Dict[str, Any]) -> Dict[str,
         
     except Exception as e:
         logger.error(f"Deep AI visibility analysis failed: {str(e)}")
+        record_fallback("ai_visibility", "single_page")
         # Fallback to simple analysis
         return await analyze_single_page_ai(scraped_data)
 
 
-async def analyze_single_page_ai(page_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Detailed AI analysis for a single page using GPT-4"""
-    try:
-        prompt = f"""
+def build_page_analysis_request(page_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Chat completion request body for a detailed single-page AI analysis"""
+    prompt = f"""
 Analyze this webpage for AI visibility and structured data quality.
 
 Website Data:
@@ -345,21 +354,32 @@ Focus on:
 6. Content depth and quality
 """
 
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are an AI visibility expert. Analyze websites for how well AI assistants (ChatGPT, Google AI, voice assistants) can understand and extract information. Return only valid JSON."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "temperature": 0.3,
+        "response_format": {"type": "json_object"}
+    }
+
+
+@traced("scoring.analyze_page_ai")
+@timed(OPENAI_REQUEST_SECONDS, operation="page_analysis")
+async def analyze_single_page_ai(page_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Detailed AI analysis for a single page using GPT-4"""
+    try:
         response = await openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an AI visibility expert. Analyze websites for how well AI assistants (ChatGPT, Google AI, voice assistants) can understand and extract information. Return only valid JSON."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"}
+            **build_page_analysis_request(page_data)
         )
+        record_tokens("page_analysis", response)
         
         import json
         analysis = json.loads(response.choices[0].message.content)
@@ -368,6 +388,7 @@ Focus on:
         
     except Exception as e:
         logger.error(f"Single page AI analysis failed: {str(e)}")
+        record_fallback("page_analysis", "analysis_failed")
         return {
             "score": 0,
             "critical_issues": ["Analysis failed"],
@@ -471,6 +492,7 @@ def calculate_consistency(page_analyses: List[Dict[str, Any]]) -> str:
         return "low"
 
 
+@traced("scoring.analyze_seo_enhanced", attributes=("url",))
 async def analyze_seo_enhanced(url: str, page_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Enhanced SEO analysis with additional metrics
@@ -505,13 +527,16 @@ async def analyze_seo_enhanced(url: str, page_data: Dict[str, Any] = None) -> Di
         
     except Exception as e:
         logger.error(f"Enhanced SEO analysis failed: {str(e)}")
+        record_fallback("seo", "basic_analysis")
         return await analyze_seo(url)
 
 
+@traced("scoring.pagespeed", attributes=("url",))
+@timed(PAGESPEED_SECONDS)
 async def get_pagespeed_data(url: str) -> Dict[str, Any]:
     """Get PageSpeed Insights data"""
     try:
-        api_url = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
+        api_url = settings.PAGESPEED_API_URL
         params = {
             "url": url,
             "key": settings.PAGESPEED_API_KEY,
@@ -524,6 +549,7 @@ async def get_pagespeed_data(url: str) -> Dict[str, Any]:
             
             if response.status_code != 200:
                 logger.warning(f"PageSpeed API returned {response.status_code}")
+                record_fallback("pagespeed", "http_status")
                 return get_default_seo_scores()
             
             data = response.json()
@@ -547,6 +573,7 @@ async def get_pagespeed_data(url: str) -> Dict[str, Any]:
         
     except Exception as e:
         logger.error(f"PageSpeed fetch failed: {str(e)}")
+        record_fallback("pagespeed", "error")
         return get_default_seo_scores()
 
 
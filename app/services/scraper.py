@@ -209,8 +209,11 @@ from urllib.parse import urljoin, urlparse
 from xml.etree import ElementTree
 
 from app.utils import logger
+from app.services.metrics import PAGE_FETCH_SECONDS, PAGE_PARSE_SECONDS, record_fallback, timed
+from app.services.tracing import traced
 
 
+@traced("scraper.scrape_website_deep", attributes=("url", "max_pages"))
 async def scrape_website_deep(
     url: str,
     max_pages: int = 10,
@@ -265,6 +268,7 @@ async def scrape_website_deep(
         }
 
 
+@traced("scraper.discover_pages", attributes=("start_url",))
 async def discover_pages(
     start_url: str,
     base_domain: str,
@@ -298,6 +302,7 @@ async def discover_pages(
     return list(discovered_pages)[:max_pages]
 
 
+@traced("scraper.get_sitemap_urls", attributes=("base_domain",))
 async def get_sitemap_urls(base_domain: str) -> List[str]:
     """Extract URLs from sitemap.xml"""
     try:
@@ -341,6 +346,7 @@ def parse_sitemap_xml(xml_content: str) -> List[str]:
         return []
 
 
+@traced("scraper.crawl_internal_links", attributes=("start_url",))
 async def crawl_internal_links(
     start_url: str,
     base_domain: str,
@@ -383,46 +389,62 @@ async def crawl_internal_links(
         return set()
 
 
+@traced("scraper.fetch_page", attributes=("url",))
+@timed(PAGE_FETCH_SECONDS, source="httpx")
+async def fetch_page_html(url: str) -> httpx.Response:
+    """Download a page"""
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept-Language": "en-US,en;q=0.9"
+    }
+    
+    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        return await client.get(url, headers=headers)
+
+
+@traced("scraper.parse_page", attributes=("url",))
+@timed(PAGE_PARSE_SECONDS)
+def parse_page_html(url: str, html: str, response_time: float) -> Dict[str, Any]:
+    """Parse a downloaded page and extract everything scoring needs"""
+    soup = BeautifulSoup(html, 'lxml')
+    
+    return {
+        "success": True,
+        "url": url,
+        "title": extract_title(soup),
+        "meta_description": extract_meta_description(soup),
+        "headings": extract_headings(soup),
+        "schema_markup": extract_schema_markup(soup),
+        "meta_tags": extract_meta_tags(soup),
+        "structured_data": extract_structured_data(soup),
+        "content_text": extract_text_content(soup),
+        "images": extract_images(soup),
+        "links": extract_links(soup),
+        "mobile_viewport": check_mobile_viewport(soup),
+        "page_structure": analyze_page_structure(soup),
+        "word_count": count_words(soup),
+        "internal_links_count": count_internal_links(soup, url),
+        "external_links_count": count_external_links(soup),
+        "canonical_url": extract_canonical(soup),
+        "og_tags": extract_og_tags(soup),
+        "response_time": response_time
+    }
+
+
 async def scrape_single_page(url: str) -> Dict[str, Any]:
     """Scrape a single page (same as original scrape_website but with more data)"""
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept-Language": "en-US,en;q=0.9"
-        }
-        
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            response = await client.get(url, headers=headers)
-            
-            if response.status_code != 200:
-                return {"success": False, "url": url, "error": f"HTTP {response.status_code}"}
+        response = await fetch_page_html(url)
         
-        soup = BeautifulSoup(response.text, 'lxml')
+        if response.status_code != 200:
+            record_fallback("scraper", "http_status")
+            return {"success": False, "url": url, "error": f"HTTP {response.status_code}"}
         
-        return {
-            "success": True,
-            "url": url,
-            "title": extract_title(soup),
-            "meta_description": extract_meta_description(soup),
-            "headings": extract_headings(soup),
-            "schema_markup": extract_schema_markup(soup),
-            "meta_tags": extract_meta_tags(soup),
-            "structured_data": extract_structured_data(soup),
-            "content_text": extract_text_content(soup),
-            "images": extract_images(soup),
-            "links": extract_links(soup),
-            "mobile_viewport": check_mobile_viewport(soup),
-            "page_structure": analyze_page_structure(soup),
-            "word_count": count_words(soup),
-            "internal_links_count": count_internal_links(soup, url),
-            "external_links_count": count_external_links(soup),
-            "canonical_url": extract_canonical(soup),
-            "og_tags": extract_og_tags(soup),
-            "response_time": response.elapsed.total_seconds()
-        }
+        return parse_page_html(url, response.text, response.elapsed.total_seconds())
         
     except Exception as e:
         logger.error(f"Single page scraping failed for {url}: {str(e)}")
+        record_fallback("scraper", "error")
         return {"success": False, "url": url, "error": str(e)}
 
 
@@ -608,6 +630,7 @@ def analyze_page_structure(soup: BeautifulSoup) -> Dict[str, bool]:
 
 
 # Backward compatibility: keep original function name
+@traced("scraper.scrape_website", attributes=("url",))
 async def scrape_website(url: str) -> Dict[str, Any]:
     """Original single-page scrape for backward compatibility"""
     return await scrape_single_page(url)
\ No newline at end of file
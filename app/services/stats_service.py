@@ -0,0 +1,386 @@
+"""
+Stats Service - materialized dashboard statistics
+
+Counters live in the `stats` collection and are $inc-ed as leads are
+inserted and calls are created/completed:
+
+    global              - totals across everything
+    daily:YYYY-MM-DD    - per-day rollup (leads and calls by created_at,
+                          completed_calls by ended_at)
+    industry:<slug>     - per-industry rollup (normalize_industry)
+
+Averages are stored as sum + count so they can be maintained
+incrementally. rebuild_stats() recomputes every bucket from the source
+collections; it runs at startup, before requests are served, and then
+on a schedule to correct any drift (failed increments, manual edits).
+The rebuild writes absolute values, so an error never outlives the
+next run; a claim document keeps workers from rebuilding concurrently.
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from app.config import get_db, get_read_db, settings
+from app.utils import logger, normalize_industry
+
+GLOBAL_ID = "global"
+
+# Claim document held by the worker running rebuild_stats
+REBUILD_LOCK_ID = "rebuild_lock"
+
+BUCKET_KINDS = ("global", "daily", "industry")
+
+# Numeric bucket fields (everything else is a label)
+COUNTER_FIELDS = (
+    "leads", "ai_score_sum", "ai_score_count", "seo_score_sum", "seo_score_count",
+    "calls", "completed_calls"
+)
+
+
+def day_key(timestamp: Optional[datetime] = None) -> str:
+    return (timestamp or datetime.utcnow()).strftime("%Y-%m-%d")
+
+
+def score_increments(lead: Dict[str, Any]) -> Dict[str, int]:
+    """$inc fields contributed by one lead"""
+    increments = {"leads": 1}
+
+    for field, prefix in (("ai_visibility_score", "ai_score"), ("seo_score", "seo_score")):
+        value = lead.get(field)
+        if value is not None:
+            increments[f"{prefix}_sum"] = value
+            increments[f"{prefix}_count"] = 1
+
+    return increments
+
+
+async def record_lead(lead: Dict[str, Any]):
+    """Count a newly inserted lead in the global, daily and industry buckets"""
+    try:
+        db = get_db()
+        increments = score_increments(lead)
+        now = datetime.utcnow()
+
+        updates = [
+            UpdateOne(
+                {"_id": GLOBAL_ID},
+                {"$inc": increments, "$set": {"kind": "global", "updated_at": now}},
+                upsert=True
+            ),
+            UpdateOne(
+                {"_id": f"daily:{day_key(lead.get('created_at'))}"},
+                {
+                    "$inc": increments,
+                    "$set": {"kind": "daily", "day": day_key(lead.get("created_at")), "updated_at": now}
+                },
+                upsert=True
+            )
+        ]
+
+        slug = lead.get("industry_slug") or normalize_industry(lead.get("industry"))
+        if slug:
+            updates.append(UpdateOne(
+                {"_id": f"industry:{slug}"},
+                {
+                    "$inc": increments,
+                    "$set": {
+                        "kind": "industry",
+                        "industry_slug": slug,
+                        "industry": lead.get("industry"),
+                        "updated_at": now
+                    }
+                },
+                upsert=True
+            ))
+
+        await db.stats.bulk_write(updates, ordered=False)
+
+    except Exception as e:
+        logger.error(f"Recording lead stats failed: {str(e)}")
+
+
+async def _inc_call_counter(field: str, timestamp: Optional[datetime] = None):
+    """$inc a call counter in the global bucket and the daily bucket of timestamp (default now)"""
+    db = get_db()
+    now = datetime.utcnow()
+    day = day_key(timestamp or now)
+
+    await db.stats.bulk_write([
+        UpdateOne(
+            {"_id": GLOBAL_ID},
+            {"$inc": {field: 1}, "$set": {"kind": "global", "updated_at": now}},
+            upsert=True
+        ),
+        UpdateOne(
+            {"_id": f"daily:{day}"},
+            {"$inc": {field: 1}, "$set": {"kind": "daily", "day": day, "updated_at": now}},
+            upsert=True
+        )
+    ], ordered=False)
+
+
+async def record_call_created():
+    """Count a newly created call log"""
+    try:
+        await _inc_call_counter("calls")
+    except Exception as e:
+        logger.error(f"Recording call stats failed: {str(e)}")
+
+
+async def record_call_completed(call_sid: str):
+    """
+    Count a completed call exactly once
+
+    Both the status callback and the end of the conversation report
+    completion, so the call log is marked with stats_completed and only
+    the update that sets the marker increments the counter. The daily
+    bucket is the call's ended_at day, as in rebuild_stats.
+    """
+    try:
+        db = get_db()
+
+        call_log = await db.call_logs.find_one_and_update(
+            {"call_sid": call_sid, "status": "completed", "stats_completed": {"$ne": True}},
+            {"$set": {"stats_completed": True}},
+            projection={"ended_at": 1, "created_at": 1}
+        )
+
+        if call_log:
+            await _inc_call_counter("completed_calls", call_log.get("ended_at") or call_log.get("created_at"))
+
+    except Exception as e:
+        logger.error(f"Recording completed call stats failed: {str(e)}")
+
+
+def average(bucket: Dict[str, Any], prefix: str) -> float:
+    count = bucket.get(f"{prefix}_count", 0)
+    return round(bucket.get(f"{prefix}_sum", 0) / count, 2) if count else 0
+
+
+async def get_stats(days: int = 7) -> Dict[str, Any]:
+    """
+    Read materialized statistics (built at startup by rebuild_stats)
+
+    Args:
+        days: Number of daily buckets to include (most recent first)
+    """
+    db = get_read_db()
+
+    overall = await db.stats.find_one({"_id": GLOBAL_ID}) or {}
+
+    top_industries = await db.stats.find(
+        {"kind": "industry"}
+    ).sort("leads", -1).limit(5).to_list(length=5)
+
+    daily = []
+    if days:
+        today = datetime.utcnow()
+        day_ids = [f"daily:{day_key(today - timedelta(days=offset))}" for offset in range(days)]
+        buckets = {
+            bucket["_id"]: bucket
+            for bucket in await db.stats.find({"_id": {"$in": day_ids}}).to_list(length=days)
+        }
+        for day_id in day_ids:
+            bucket = buckets.get(day_id, {})
+            daily.append({
+                "day": day_id.split(":", 1)[1],
+                "leads": bucket.get("leads", 0),
+                "calls": bucket.get("calls", 0),
+                "completed_calls": bucket.get("completed_calls", 0),
+                "average_ai_score": average(bucket, "ai_score")
+            })
+
+    return {
+        "total_leads": overall.get("leads", 0),
+        "total_calls": overall.get("calls", 0),
+        "completed_calls": overall.get("completed_calls", 0),
+        "average_ai_score": average(overall, "ai_score"),
+        "average_seo_score": average(overall, "seo_score"),
+        "top_industries": [
+            {
+                "_id": bucket.get("industry"),
+                "slug": bucket.get("industry_slug"),
+                "count": bucket.get("leads", 0),
+                "average_ai_score": average(bucket, "ai_score")
+            }
+            for bucket in top_industries
+        ],
+        "daily": daily,
+        "updated_at": overall.get("updated_at")
+    }
+
+
+async def claim_rebuild(db) -> Optional[str]:
+    """Take the rebuild claim (None while another worker holds it)"""
+    now = datetime.utcnow()
+    token = uuid.uuid4().hex
+    claim = {"token": token, "expires_at": now + timedelta(seconds=settings.STATS_REBUILD_LOCK_TTL)}
+
+    try:
+        await db.stats.insert_one({"_id": REBUILD_LOCK_ID, **claim})
+        return token
+    except DuplicateKeyError:
+        # Taken over only once the holder's claim has expired (crashed worker)
+        taken = await db.stats.find_one_and_update(
+            {"_id": REBUILD_LOCK_ID, "expires_at": {"$lt": now}},
+            {"$set": claim}
+        )
+        return token if taken else None
+
+
+async def compute_buckets(db, created: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate stats buckets over the leads and call logs matching created
+
+    Args:
+        created: Condition on created_at selecting the documents to count
+    """
+    score_fields = {
+        "leads": {"$sum": 1},
+        "ai_score_sum": {"$sum": "$ai_visibility_score"},
+        "ai_score_count": {"$sum": {"$cond": [{"$isNumber": "$ai_visibility_score"}, 1, 0]}},
+        "seo_score_sum": {"$sum": "$seo_score"},
+        "seo_score_count": {"$sum": {"$cond": [{"$isNumber": "$seo_score"}, 1, 0]}}
+    }
+    day_expr = {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}
+    # Same day basis as record_call_completed
+    completed_day_expr = {"$dateToString": {"format": "%Y-%m-%d", "date": {"$ifNull": ["$ended_at", "$created_at"]}}}
+    dated = {"$and": [{"created_at": created}, {"created_at": {"$type": "date"}}]}
+
+    lead_totals = await db.leads.aggregate([
+        {"$match": {"created_at": created}},
+        {"$group": {"_id": None, **score_fields}}
+    ]).to_list(length=1)
+
+    lead_days = await db.leads.aggregate([
+        {"$match": dated},
+        {"$group": {"_id": day_expr, **score_fields}}
+    ]).to_list(length=None)
+
+    industries = await db.leads.aggregate([
+        {"$match": {"created_at": created, "industry_slug": {"$nin": [None, ""]}}},
+        {"$group": {"_id": "$industry_slug", "industry": {"$last": "$industry"}, **score_fields}}
+    ]).to_list(length=None)
+
+    call_days = await db.call_logs.aggregate([
+        {"$match": dated},
+        {"$group": {"_id": day_expr, "calls": {"$sum": 1}}}
+    ]).to_list(length=None)
+
+    completed_days = await db.call_logs.aggregate([
+        {"$match": {**dated, "status": "completed"}},
+        {"$group": {"_id": completed_day_expr, "completed_calls": {"$sum": 1}}}
+    ]).to_list(length=None)
+
+    total_calls = await db.call_logs.count_documents({"created_at": created})
+    completed_calls = await db.call_logs.count_documents({"created_at": created, "status": "completed"})
+
+    empty_scores = {field: 0 for field in score_fields}
+    buckets: Dict[str, Dict[str, Any]] = {
+        GLOBAL_ID: {
+            **empty_scores,
+            **{k: v for k, v in (lead_totals[0] if lead_totals else {}).items() if k != "_id"},
+            "kind": "global",
+            "calls": total_calls,
+            "completed_calls": completed_calls
+        }
+    }
+
+    for row in lead_days:
+        buckets[f"daily:{row['_id']}"] = {
+            **{k: v for k, v in row.items() if k != "_id"},
+            "kind": "daily",
+            "day": row["_id"],
+            "calls": 0,
+            "completed_calls": 0
+        }
+
+    for rows, field in ((call_days, "calls"), (completed_days, "completed_calls")):
+        for row in rows:
+            bucket = buckets.setdefault(f"daily:{row['_id']}", {
+                **empty_scores, "kind": "daily", "day": row["_id"], "calls": 0, "completed_calls": 0
+            })
+            bucket[field] = row[field]
+
+    for row in industries:
+        buckets[f"industry:{row['_id']}"] = {
+            **{k: v for k, v in row.items() if k != "_id"},
+            "kind": "industry",
+            "industry_slug": row["_id"]
+        }
+
+    return buckets
+
+
+def merge_buckets(target: Dict[str, Dict[str, Any]], extra: Dict[str, Dict[str, Any]]):
+    """Add extra's counters into target (labels from extra win)"""
+    for bucket_id, bucket in extra.items():
+        current = target.setdefault(bucket_id, {})
+        for key, value in bucket.items():
+            if key in COUNTER_FIELDS:
+                current[key] = current.get(key, 0) + value
+            else:
+                current[key] = value
+
+
+async def rebuild_stats():
+    """
+    Recompute every stats bucket from leads and call_logs
+
+    The bulk of the work aggregates documents created up to a cutoff;
+    a second, index-backed pass adds the few created while that ran,
+    and the totals are written with $set right after it. Only live
+    increments landing between that pass and the write can be lost or
+    doubled, and the next rebuild corrects them.
+    """
+    db = get_db()
+
+    token = await claim_rebuild(db)
+    if token is None:
+        logger.info("Stats rebuild already running on another worker, skipping")
+        return
+
+    try:
+        logger.info("Rebuilding materialized stats...")
+
+        # Mark already-completed calls so record_call_completed won't count them again
+        await db.call_logs.update_many(
+            {"status": "completed", "stats_completed": {"$ne": True}},
+            {"$set": {"stats_completed": True}}
+        )
+
+        cutoff = datetime.utcnow()
+        buckets = await compute_buckets(db, {"$not": {"$gt": cutoff}})
+        merge_buckets(buckets, await compute_buckets(db, {"$gt": cutoff}))
+
+        now = datetime.utcnow()
+        operations: List[UpdateOne] = [
+            UpdateOne({"_id": bucket_id}, {"$set": {**bucket, "updated_at": now}}, upsert=True)
+            for bucket_id, bucket in buckets.items()
+        ]
+        await db.stats.bulk_write(operations, ordered=False)
+
+        # Buckets that no longer have any data
+        await db.stats.delete_many({"kind": {"$in": list(BUCKET_KINDS)}, "_id": {"$nin": list(buckets)}})
+
+        logger.info(f"Materialized stats rebuilt ({len(buckets)} buckets)")
+
+    finally:
+        await db.stats.delete_one({"_id": REBUILD_LOCK_ID, "token": token})
+
+
+async def stats_worker():
+    """Background loop: periodically rebuild stats to correct drift"""
+    while True:
+        await asyncio.sleep(settings.STATS_REBUILD_INTERVAL)
+
+        try:
+            await rebuild_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Stats rebuild failed: {str(e)}")
@@ -8,6 +8,8 @@ from typing import Optional
 
 from app.config import settings
 from app.utils import logger
+from app.services.metrics import S3_UPLOAD_BYTES, S3_UPLOAD_SECONDS, record_fallback, timed
+from app.services.tracing import traced
 from app.services.twilio_service import download_recording
 
 # Initialize S3 client
@@ -28,6 +30,8 @@ def get_s3_client():
     return s3_client
 
 
+@traced("storage.upload_recording")
+@timed(S3_UPLOAD_SECONDS)
 async def upload_recording(
     audio_data: bytes,
     call_sid: str,
@@ -69,17 +73,21 @@ async def upload_recording(
             }
         )
         
+        S3_UPLOAD_BYTES.inc(len(audio_data))
         logger.info(f"Recording uploaded successfully: {s3_key}")
         return s3_key
         
     except ClientError as e:
         logger.error(f"S3 upload failed: {str(e)}")
+        record_fallback("s3_upload", "client_error")
         return None
     except Exception as e:
         logger.error(f"Upload recording failed: {str(e)}")
+        record_fallback("s3_upload", "error")
         return None
 
 
+@traced("storage.get_recording_url", attributes=("s3_key",))
 async def get_recording_url(s3_key: str, expiration: int = 3600) -> Optional[str]:
     """
     Generate signed URL for recording playback
@@ -115,6 +123,7 @@ async def get_recording_url(s3_key: str, expiration: int = 3600) -> Optional[str
         return None
 
 
+@traced("storage.delete_recording", attributes=("s3_key",))
 async def delete_recording(s3_key: str) -> bool:
     """
     Delete recording from S3
@@ -186,6 +195,7 @@ async def list_recordings(prefix: str = "recordings/", max_keys: int = 100) -> l
         return []
 
 
+@traced("storage.download_and_upload_recording")
 async def download_and_upload_recording(twilio_url: str, call_sid: str) -> Optional[str]:
     """
     Download recording from Twilio and upload to S3
@@ -0,0 +1,223 @@
+"""
+Call Summary Service - single structured-output summarization pipeline
+"""
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, Any, List, Optional
+
+from app.config import settings
+from app.services.openai_service import client
+from app.services.metrics import OPENAI_REQUEST_SECONDS, record_cache, record_fallback, record_tokens, timed
+from app.utils import logger
+
+SUMMARY_MODEL = "gpt-4o-mini"
+
+# JSON schema enforced by the API (structured outputs)
+SUMMARY_SCHEMA = {
+    "name": "call_summary",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "outcome": {
+                "type": "string",
+                "enum": ["success", "callback_needed", "not_interested", "no_answer"]
+            },
+            "interest_level": {
+                "type": "string",
+                "enum": ["high", "medium", "low", "none"]
+            },
+            "key_points": {"type": "array", "items": {"type": "string"}},
+            "objections": {"type": "array", "items": {"type": "string"}},
+            "next_steps": {"type": "string"}
+        },
+        "required": [
+            "summary", "outcome", "interest_level",
+            "key_points", "objections", "next_steps"
+        ],
+        "additionalProperties": False
+    }
+}
+
+SYSTEM_PROMPT = (
+    "You are a sales call analyst. Analyze conversations and extract actionable insights."
+)
+
+# transcript hash -> summary (LRU)
+_summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+_SPEAKER_LABEL = re.compile(r"^\s*(sara|customer)\s*:\s*", re.IGNORECASE | re.MULTILINE)
+
+
+def transcript_hash(transcript: str) -> str:
+    """Stable hash of a transcript (whitespace-insensitive)"""
+    normalized = " ".join(transcript.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def transcript_words(transcript: str) -> List[str]:
+    """Lowercase word list without speaker labels or punctuation"""
+    text = _SPEAKER_LABEL.sub("", transcript or "")
+    return re.findall(r"[a-z0-9']+", text.lower())
+
+
+def transcripts_match(first: str, second: str, threshold: Optional[float] = None) -> bool:
+    """
+    Check whether two transcripts of the same call are materially the same
+
+    The live transcript (Sara's text + Twilio speech recognition) and the
+    Whisper transcript of the recording never match exactly, so they are
+    compared word by word.
+
+    Args:
+        first: Transcript text
+        second: Transcript text
+        threshold: Minimum similarity ratio (0-1)
+
+    Returns:
+        True if the transcripts are similar enough to share one summary
+    """
+    if threshold is None:
+        threshold = settings.SUMMARY_REUSE_SIMILARITY
+
+    first_words = transcript_words(first)
+    second_words = transcript_words(second)
+
+    if not first_words or not second_words:
+        return False
+
+    matcher = SequenceMatcher(None, first_words, second_words, autojunk=False)
+    return matcher.ratio() >= threshold
+
+
+def build_summary_request(transcript: str) -> Dict[str, Any]:
+    """Chat completion request body for a transcript summary"""
+    prompt = f"""
+Analyze this sales call transcript.
+
+Transcript:
+{transcript}
+
+Provide:
+- summary: brief 2-3 sentence summary
+- outcome: call outcome
+- interest_level: prospect's interest level
+- key_points: key discussion points
+- objections: objections raised by the prospect
+- next_steps: recommended follow-up action
+"""
+
+    return {
+        "model": SUMMARY_MODEL,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,
+        "max_tokens": 500,
+        "response_format": {"type": "json_schema", "json_schema": SUMMARY_SCHEMA}
+    }
+
+
+def parse_summary(content: str) -> Dict[str, Any]:
+    """Parse structured summary output into the stored shape"""
+    data = json.loads(content)
+
+    return {
+        "summary": data.get("summary"),
+        "outcome": data.get("outcome", "unknown"),
+        "interest_level": data.get("interest_level"),
+        "key_points": data.get("key_points", []),
+        "objections": data.get("objections", []),
+        "next_steps": data.get("next_steps")
+    }
+
+
+def _cache_summary(key: str, summary: Dict[str, Any]):
+    _summary_cache[key] = summary
+    _summary_cache.move_to_end(key)
+
+    while len(_summary_cache) > settings.SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+
+
+def _skip_reason(transcript: str) -> Optional[Dict[str, Any]]:
+    """Canned summaries for transcripts that aren't worth a GPT call"""
+    if len(transcript.strip()) < 50:
+        logger.warning(f"Transcript too short ({len(transcript)} chars), skipping summary generation")
+        return {
+            "summary": "Transcript too short to generate meaningful summary",
+            "outcome": "unknown",
+            "key_points": [],
+            "objections": []
+        }
+
+    if "trial account" in transcript.lower():
+        logger.warning("Detected Twilio trial account message, skipping summary generation")
+        return {
+            "summary": "Twilio trial account message detected - not a real conversation",
+            "outcome": "unknown",
+            "key_points": ["Upgrade Twilio account to remove trial messages"],
+            "objections": []
+        }
+
+    return None
+
+
+@timed(OPENAI_REQUEST_SECONDS, operation="summary")
+async def request_summary(transcript: str) -> Dict[str, Any]:
+    """Summarize with GPT (no cache)"""
+    response = await client.chat.completions.create(**build_summary_request(transcript))
+    record_tokens("summary", response)
+    return parse_summary(response.choices[0].message.content)
+
+
+async def summarize_call(transcript: str) -> Dict[str, Any]:
+    """
+    Summarize a call transcript (cached by transcript hash)
+
+    Args:
+        transcript: Call transcript text
+
+    Returns:
+        Dict with summary, outcome, interest_level, key_points,
+        objections, next_steps and transcript_hash
+    """
+    key = transcript_hash(transcript or "")
+
+    try:
+        skipped = _skip_reason(transcript or "")
+        if skipped:
+            return {**skipped, "transcript_hash": key}
+
+        if key in _summary_cache:
+            logger.info("Summary cache hit")
+            record_cache("summary", True)
+            _summary_cache.move_to_end(key)
+            return _summary_cache[key]
+
+        record_cache("summary", False)
+        logger.info("Summarizing conversation...")
+
+        summary = await request_summary(transcript)
+        summary["transcript_hash"] = key
+
+        _cache_summary(key, summary)
+
+        logger.info("Summary and insights generated successfully")
+        return summary
+
+    except Exception as e:
+        logger.error(f"Conversation summarization failed: {str(e)}")
+        record_fallback("summary", "error")
+        return {
+            "summary": None,
+            "outcome": "unknown",
+            "key_points": [],
+            "objections": [],
+            "transcript_hash": key
+        }
@@ -0,0 +1,372 @@
+"""
+Tracing - OpenTelemetry spans across analysis, Sara and webhook flows
+
+A deep analysis fans out into sitemap fetch, crawl, page fetch/parse,
+GPT scoring and PageSpeed; a call goes from initiate_sara_call through
+the Twilio webhooks to transcription. Functions are wrapped with
+`@traced("scraper.fetch_page")` and every HTTP request gets a server
+span (TracingMiddleware), so slow stages show up end to end.
+
+Correlation:
+- arguments named lead_id / call_sid / call_log_id become span
+  attributes, and are inherited by every span started below them
+- correlate(lead_id=...) adds ids that are only known later
+- initiate_sara_call passes its trace context in the Twilio webhook URL
+  (?traceparent=...), so the voice and recording webhooks join the
+  call's trace; gather turns link to it through the warm call context
+
+Exporters (TRACING_EXPORTER):
+- otlp:    OTLP/HTTP to a collector (TRACING_OTLP_ENDPOINT)
+- file:    one JSON object per span in TRACING_FILE, for offline runs
+- console: SDK console exporter
+
+opentelemetry-api/sdk are optional: without them, or with
+TRACING_ENABLED=false, decorated functions run unwrapped apart from a
+single None check.
+"""
+import asyncio
+import functools
+import inspect
+import json
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import Link, Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+try:
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+except ImportError:
+    SpanExporter = object
+
+CORRELATION_KEYS = ("lead_id", "call_sid", "call_log_id")
+MAX_ATTRIBUTE_LENGTH = 256
+
+_correlation: ContextVar[Dict[str, str]] = ContextVar("trace_correlation", default={})
+_tracer = None
+_provider = None
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends finished spans to a file, one JSON object per line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def span_record(span) -> Dict[str, Any]:
+        context = span.get_span_context()
+        return {
+            "name": span.name,
+            "trace_id": format(context.trace_id, "032x"),
+            "span_id": format(context.span_id, "016x"),
+            "parent_id": format(span.parent.span_id, "016x") if span.parent else None,
+            "start_ns": span.start_time,
+            "duration_ms": round((span.end_time - span.start_time) / 1_000_000, 3),
+            "status": span.status.status_code.name,
+            "attributes": dict(span.attributes or {}),
+            "links": [format(link.context.span_id, "016x") for link in span.links]
+        }
+
+    def export(self, spans):
+        lines = "".join(json.dumps(self.span_record(span), default=str) + "\n" for span in spans)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+            return SpanExportResult.SUCCESS
+        except OSError:
+            return SpanExportResult.FAILURE
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+def _create_exporter(settings):
+    if settings.TRACING_EXPORTER == "file":
+        return FileSpanExporter(settings.TRACING_FILE)
+
+    if settings.TRACING_EXPORTER == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter()
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+
+
+def setup_tracing() -> bool:
+    """
+    Install the tracer provider and exporter (when TRACING_ENABLED)
+
+    Returns:
+        True if spans are being recorded
+    """
+    global _tracer, _provider
+
+    from app.config import settings
+    from app.utils import logger
+
+    if not settings.TRACING_ENABLED:
+        return False
+
+    if not OTEL_AVAILABLE:
+        logger.warning("opentelemetry not installed, tracing disabled")
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+            sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO))
+        )
+        # Exported from a background thread, never on the request path
+        provider.add_span_processor(BatchSpanProcessor(_create_exporter(settings)))
+        trace.set_tracer_provider(provider)
+
+        _provider = provider
+        _tracer = provider.get_tracer("trufindai")
+        logger.info("Tracing enabled", exporter=settings.TRACING_EXPORTER)
+        return True
+
+    except Exception as e:
+        logger.error(f"Tracing setup failed: {str(e)}")
+        return False
+
+
+def shutdown_tracing():
+    """Export buffered spans and stop the exporter thread"""
+    global _tracer, _provider
+
+    if _provider:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def _attribute_value(value: Any):
+    if isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        value = value.value
+    return str(value)[:MAX_ATTRIBUTE_LENGTH]
+
+
+@contextmanager
+def start_span(name: str, traceparent: Optional[str] = None, links: Iterable[str] = (), **attributes):
+    """
+    Run a block in a span (yields None when tracing is off)
+
+    Args:
+        name: Span name
+        traceparent: W3C traceparent of a remote parent (e.g. from a URL)
+        links: traceparents of related traces (linked, not parented)
+        attributes: Span attributes; correlation ids are inherited by child spans
+    """
+    if _tracer is None:
+        yield None
+        return
+
+    ids = {key: str(attributes[key]) for key in CORRELATION_KEYS if attributes.get(key)}
+    token = _correlation.set({**_correlation.get(), **ids}) if ids else None
+
+    context = propagate.extract({"traceparent": traceparent}) if traceparent else None
+    span_links = []
+    for link in links:
+        link_context = trace.get_current_span(propagate.extract({"traceparent": link})).get_span_context()
+        if link_context.is_valid:
+            span_links.append(Link(link_context))
+
+    span_attributes = {key: _attribute_value(value) for key, value in attributes.items() if value is not None}
+    span_attributes.update(_correlation.get())
+
+    try:
+        with _tracer.start_as_current_span(name, context=context, links=span_links, attributes=span_attributes) as span:
+            yield span
+    finally:
+        if token:
+            _correlation.reset(token)
+
+
+def traced(name: str, attributes: Iterable[str] = ()):
+    """
+    Decorator running a function (sync or async) in a span
+
+    Arguments named lead_id / call_sid / call_log_id, plus the ones
+    listed in `attributes`, are recorded on the span. Argument positions
+    are resolved once at decoration time.
+
+    Args:
+        name: Span name, "<module>.<operation>"
+        attributes: Extra argument names to record (e.g. "url")
+    """
+    def decorator(func: Callable):
+        params = list(inspect.signature(func).parameters)
+        captured = [
+            (key, params.index(key))
+            for key in (*CORRELATION_KEYS, *attributes)
+            if key in params
+        ]
+
+        def span_attributes(args, kwargs) -> Dict[str, Any]:
+            values = {}
+            for key, index in captured:
+                value = kwargs[key] if key in kwargs else (args[index] if index < len(args) else None)
+                if value is not None:
+                    values[key] = value
+            return values
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+                with start_span(name, **span_attributes(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with start_span(name, **span_attributes(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def correlate(**ids: Optional[str]):
+    """
+    Attach ids learned mid-flow (e.g. lead_id after the insert)
+
+    Sets them on the current span and on spans started later in the
+    same request/task.
+    """
+    if _tracer is None:
+        return
+
+    ids = {key: str(value) for key, value in ids.items() if value}
+    if not ids:
+        return
+
+    _correlation.set({**_correlation.get(), **ids})
+    trace.get_current_span().set_attributes(ids)
+
+
+def current_traceparent() -> Optional[str]:
+    """W3C traceparent of the current span (None when tracing is off)"""
+    if _tracer is None:
+        return None
+
+    carrier: Dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier.get("traceparent")
+
+
+def traced_webhook(name: str):
+    """
+    Decorator for Twilio webhooks: span with the call's correlation
+
+    Place it above @timed_turn / @idempotent_webhook. When the webhook
+    URL carries no traceparent (gather, status), the span links to the
+    trace of initiate_sara_call through the warm call context.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request):
+            if _tracer is None:
+                return await func(request)
+
+            form = await request.form()
+            call_sid = form.get("CallSid")
+
+            links = []
+            if "traceparent" not in request.query_params and call_sid:
+                from app.services.call_context import get_context
+
+                context = get_context(call_sid)
+                if context and context.get("traceparent"):
+                    links.append(context["traceparent"])
+
+            with start_span(
+                name,
+                links=links,
+                call_sid=call_sid,
+                lead_id=request.query_params.get("lead_id"),
+                call_log_id=request.query_params.get("call_log_id"),
+                call_status=form.get("CallStatus")
+            ):
+                return await func(request)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware: one server span per HTTP request
+
+    The parent comes from a traceparent header or, for Twilio webhooks
+    (no custom headers), a traceparent query parameter. The span is
+    renamed after the endpoint once routing has run.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or _tracer is None:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for header, value in scope.get("headers", []):
+            if header == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        if traceparent is None and b"traceparent=" in scope.get("query_string", b""):
+            from urllib.parse import parse_qs
+            query = parse_qs(scope["query_string"].decode("latin-1"))
+            traceparent = query.get("traceparent", [None])[0]
+
+        method = scope["method"]
+        with start_span(f"{method} {scope['path']}", traceparent=traceparent, **{
+            "http.method": method,
+            "http.target": scope["path"]
+        }) as span:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.status_code", status)
+                    if status >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                endpoint = scope.get("endpoint")
+                if endpoint is not None:
+                    span.update_name(f"{method} {endpoint.__name__}")
@@ -172,153 +172,246 @@
 """
 Transcription and Summarization Service
 """
-import openai
-from typing import Optional, Dict, List
+import asyncio
+import importlib.util
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from openai import AsyncOpenAI
+from typing import Optional, Dict, Any
 from app.config import settings
+from app.services.summary_service import summarize_call, transcripts_match, transcript_hash
 from app.utils import logger
+from app.services.tracing import traced
 
-# Initialize OpenAI client
-openai.api_key = settings.OPENAI_API_KEY
 
+class TranscriptionBackend(ABC):
+    """Base class for speech-to-text engines (subclasses must implement transcribe)"""
 
-async def transcribe_audio(audio_data: bytes) -> Optional[str]:
+    name = "base"
+
+    @abstractmethod
+    async def transcribe(self, audio_data: bytes, language: str = "en") -> Optional[str]:
+        """
+        Transcribe audio bytes to text
+
+        Args:
+            audio_data: Audio file bytes (mp3/wav)
+            language: Language code
+
+        Returns:
+            Transcribed text
+        """
+
+    def shutdown(self):
+        """Release any resources held by the backend"""
+        pass
+
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    """Remote OpenAI Whisper API (whisper-1)"""
+
+    name = "openai"
+
+    def __init__(self):
+        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
+
+    async def transcribe(self, audio_data: bytes, language: str = "en") -> Optional[str]:
+        # Upload straight from memory - the filename only tells Whisper the format
+        transcript = await self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=("recording.mp3", audio_data),
+            language=language
+        )
+
+        return transcript.text
+
+
+# Model instance loaded once per worker process
+_local_model = None
+
+
+def _load_local_model(model_size: str, device: str, compute_type: str):
+    """Process pool initializer - loads the faster-whisper model in the worker"""
+    global _local_model
+    from faster_whisper import WhisperModel
+    _local_model = WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def _run_local_transcription(audio_data: bytes, language: str) -> Dict[str, Any]:
+    """Runs inside a worker process"""
+    import io
+    segments, info = _local_model.transcribe(
+        io.BytesIO(audio_data),
+        language=language,
+        beam_size=1,
+        vad_filter=True
+    )
+    text = " ".join(segment.text.strip() for segment in segments)
+    return {"text": text.strip(), "duration": info.duration}
+
+
+class LocalWhisperBackend(TranscriptionBackend):
     """
-    Transcribe audio using OpenAI Whisper API
-    
+    Local CPU transcription with faster-whisper
+
+    The model is loaded once per worker in a process pool, so decoding
+    never blocks the event loop and several recordings run in parallel.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_size: str = "base.en",
+        device: str = "cpu",
+        compute_type: str = "int8",
+        workers: int = 1
+    ):
+        self.model_size = model_size
+        self.device = device
+        self.compute_type = compute_type
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check that the optional faster-whisper package is installed"""
+        return importlib.util.find_spec("faster_whisper") is not None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_load_local_model,
+                initargs=(self.model_size, self.device, self.compute_type)
+            )
+        return self._executor
+
+    async def transcribe_with_info(self, audio_data: bytes, language: str = "en") -> Dict[str, Any]:
+        """Transcribe and also return the decoded audio duration (seconds)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            _run_local_transcription,
+            audio_data,
+            language
+        )
+
+    async def transcribe(self, audio_data: bytes, language: str = "en") -> Optional[str]:
+        result = await self.transcribe_with_info(audio_data, language)
+        return result["text"]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_backend: Optional[TranscriptionBackend] = None
+
+
+def create_transcription_backend(name: str) -> TranscriptionBackend:
+    """
+    Build a transcription backend by name
+
+    Args:
+        name: "openai" or "local"
+
+    Returns:
+        Backend instance (falls back to OpenAI if the local engine is unavailable)
+    """
+    if name == "local":
+        if LocalWhisperBackend.is_available():
+            return LocalWhisperBackend(
+                model_size=settings.LOCAL_WHISPER_MODEL,
+                device=settings.LOCAL_WHISPER_DEVICE,
+                compute_type=settings.LOCAL_WHISPER_COMPUTE_TYPE,
+                workers=settings.LOCAL_WHISPER_WORKERS
+            )
+        logger.error("faster-whisper is not installed, falling back to OpenAI Whisper")
+    elif name != "openai":
+        logger.warning(f"Unknown transcription backend '{name}', using OpenAI Whisper")
+
+    return OpenAIWhisperBackend()
+
+
+def get_transcription_backend() -> TranscriptionBackend:
+    """Get configured transcription backend (singleton)"""
+    global _backend
+
+    if _backend is None:
+        _backend = create_transcription_backend(settings.TRANSCRIPTION_BACKEND)
+        logger.info(f"Transcription backend: {_backend.name}")
+
+    return _backend
+
+
+def shutdown_transcription_backend():
+    """Release the backend's resources if one was created (app shutdown)"""
+    global _backend
+
+    if _backend is not None:
+        _backend.shutdown()
+        _backend = None
+
+
+@traced("transcription.transcribe")
+async def transcribe_audio(audio_data: bytes, language: str = "en") -> Optional[str]:
+    """
+    Transcribe audio using the configured backend
+
     Args:
         audio_data: Audio file bytes (mp3)
-    
+        language: Language code
+
     Returns:
         Transcribed text
     """
     try:
-        logger.info("Transcribing audio with Whisper...")
-        
-        # Save temporarily to pass to Whisper
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(audio_data)
-            temp_path = temp_file.name
-        
-        # Transcribe with Whisper
-        with open(temp_path, "rb") as audio_file:
-            transcript = openai.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language="en"
-            )
-        
-        # Clean up temp file
-        import os
-        os.unlink(temp_path)
-        
-        logger.info(f"Transcription completed: {len(transcript.text)} characters")
-        return transcript.text
-        
+        backend = get_transcription_backend()
+        logger.info(f"Transcribing audio with {backend.name} backend...")
+
+        text = await backend.transcribe(audio_data, language)
+
+        logger.info(f"Transcription completed: {len(text or '')} characters")
+        return text
+
     except Exception as e:
         logger.error(f"Transcription failed: {str(e)}")
         return None
 
 
-async def generate_summary_and_insights(transcript: str) -> Dict[str, any]:
+@traced("transcription.summarize")
+async def generate_summary_and_insights(transcript: str) -> Dict[str, Any]:
     """
-    Generate summary and extract key points using GPT-4
+    Generate summary and extract key points
+
+    Kept for backward compatibility - see summary_service.summarize_call
     
     Args:
         transcript: Call transcript text
     
     Returns:
-        Dict with summary and key_points
+        Dict with summary, key_points and objections
     """
-    try:
-        # ✅ NEW: Check if transcript is too short
-        if len(transcript.strip()) < 50:
-            logger.warning(f"Transcript too short ({len(transcript)} chars), skipping summary generation")
-            return {
-                "summary": "Transcript too short to generate meaningful summary",
-                "key_points": [],
-                "objections": []
-            }
-        
-        # ✅ NEW: Check if it's a Twilio trial message
-        if "trial account" in transcript.lower():
-            logger.warning("Detected Twilio trial account message, skipping summary generation")
-            return {
-                "summary": "Twilio trial account message detected - not a real conversation",
-                "key_points": ["Upgrade Twilio account to remove trial messages"],
-                "objections": []
-            }
-        
-        logger.info("Generating summary and insights...")
-        
-        prompt = f"""Analyze this sales call transcript and provide:
-
-1. A brief summary (2-3 sentences)
-2. Key points discussed (as bullet points)
-3. Any objections raised by the prospect
-4. Next steps or action items
-
-Transcript:
-{transcript}
-
-Format your response as:
-SUMMARY: [summary here]
-KEY_POINTS: [point 1], [point 2], [point 3]
-OBJECTIONS: [objection 1], [objection 2]
-"""
-        
-        response = openai.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are a sales call analyst."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-        
-        result = response.choices[0].message.content
-        
-        # Parse response
-        summary = ""
-        key_points = []
-        objections = []
-        
-        for line in result.split("\n"):
-            line = line.strip()
-            if line.startswith("SUMMARY:"):
-                summary = line.replace("SUMMARY:", "").strip()
-            elif line.startswith("KEY_POINTS:"):
-                points_text = line.replace("KEY_POINTS:", "").strip()
-                key_points = [p.strip() for p in points_text.split(",") if p.strip()]
-            elif line.startswith("OBJECTIONS:"):
-                obj_text = line.replace("OBJECTIONS:", "").strip()
-                objections = [o.strip() for o in obj_text.split(",") if o.strip()]
-        
-        logger.info("Summary and insights generated successfully")
-        
-        return {
-            "summary": summary,
-            "key_points": key_points,
-            "objections": objections
-        }
-        
-    except Exception as e:
-        logger.error(f"Summary generation failed: {str(e)}")
-        return {
-            "summary": None,
-            "key_points": [],
-            "objections": []
-        }
+    return await summarize_call(transcript)
 
 
-async def process_recording(call_sid: str, audio_data: bytes) -> Dict[str, any]:
+@traced("transcription.process_recording")
+async def process_recording(
+    call_sid: str,
+    audio_data: bytes,
+    existing_call: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Complete processing: transcribe + summarize
     
     Args:
         call_sid: Twilio call SID
         audio_data: Audio file bytes
+        existing_call: Call log with the live transcript/summary, if any.
+            When the recording transcript matches it, the live summary
+            is reused instead of summarizing the call a second time.
     
     Returns:
         Dict with transcript, summary, key_points, objections
@@ -336,14 +429,48 @@ async def process_recording(call_sid: str, audio_data: bytes) -> Dict[str, any]:
                 "objections": []
             }
         
-        # Step 2: Generate insights
-        insights = await generate_summary_and_insights(transcript)
+        # Step 2: Reuse the live summary unless the recording differs materially
+        existing_call = existing_call or {}
+        if (
+            existing_call.get("conversation_summary")
+            and existing_call.get("transcript")
+            and transcripts_match(existing_call["transcript"], transcript)
+        ):
+            logger.info(f"Recording matches live transcript for {call_sid}, reusing summary")
+            return {
+                "transcript": transcript,
+                "transcript_hash": transcript_hash(transcript),
+                "summary": existing_call.get("conversation_summary"),
+                "key_points": existing_call.get("key_points", []),
+                "objections": existing_call.get("objections", []),
+                "summary_source": "live"
+            }
+        
+        # Step 3: Generate insights (deferred to the Batch API in batch mode)
+        if settings.OPENAI_BATCH_ENABLED:
+            from app.services.batch_service import enqueue_call_summary
+            await enqueue_call_summary(call_sid, transcript)
+            return {
+                "transcript": transcript,
+                "transcript_hash": transcript_hash(transcript),
+                "summary": None,
+                "key_points": [],
+                "objections": [],
+                "summary_source": "batch",
+                "summary_status": "pending"
+            }
+        
+        insights = await summarize_call(transcript)
         
         return {
             "transcript": transcript,
+            "transcript_hash": insights.get("transcript_hash"),
             "summary": insights.get("summary"),
             "key_points": insights.get("key_points", []),
-            "objections": insights.get("objections", [])
+            "objections": insights.get("objections", []),
+            "interest_level": insights.get("interest_level"),
+            "next_steps": insights.get("next_steps"),
+            "summary_source": "recording"
         }
         
     except Exception as e:
@@ -353,4 +480,4 @@ async def process_recording(call_sid: str, audio_data: bytes) -> Dict[str, any]:
             "summary": None,
             "key_points": [],
             "objections": []
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,182 @@
+"""
+Turn Timer - per-turn latency spans for the Sara voice pipeline
+
+Every Twilio voice/gather webhook is one "turn" (the time the caller
+hears dead air). The webhook decorator starts a TurnTimer, and the
+pipeline marks its stages with `with turn_stage("llm"):`. The timer is
+found through a context variable, so nothing is passed around and
+turn_stage is a no-op outside a timed turn.
+
+Stages: form, lookup, intent, llm, save_transcript, save_outcome, twiml
+("other" is the remainder: dedup, routing, response building).
+
+Finished turns are:
+- pushed to call_logs.turn_latencies (last TURN_LATENCY_STORED turns),
+  after the response is sent
+- kept in a rolling window of TURN_LATENCY_WINDOW turns (per process)
+  for p50/p95/p99 on GET /api/v1/sara/latency
+"""
+import asyncio
+import functools
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Dict, Any, Iterable, List, Optional, Set
+
+from fastapi import Request
+
+from app.config import get_db, settings
+from app.utils import logger
+
+PERCENTILES = (50, 95, 99)
+
+_current: ContextVar[Optional["TurnTimer"]] = ContextVar("sara_turn_timer", default=None)
+_recent: deque = deque(maxlen=settings.TURN_LATENCY_WINDOW)
+_pending_writes: Set[asyncio.Task] = set()
+
+
+class TurnTimer:
+    """Stage spans of one webhook turn (milliseconds from the turn start)"""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.started_at = datetime.utcnow()
+        self.spans: List[Dict[str, Any]] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.spans.append({
+                "stage": name,
+                "start_ms": round((start - self._start) * 1000, 2),
+                "duration_ms": round((end - start) * 1000, 2)
+            })
+
+    def finish(self) -> Dict[str, Any]:
+        """Turn document stored on the call log"""
+        total_ms = round((time.perf_counter() - self._start) * 1000, 2)
+        staged_ms = sum(span["duration_ms"] for span in self.spans)
+
+        return {
+            "turn": self.kind,
+            "started_at": self.started_at,
+            "total_ms": total_ms,
+            "other_ms": round(max(total_ms - staged_ms, 0.0), 2),
+            "spans": self.spans
+        }
+
+
+@contextmanager
+def turn_stage(name: str):
+    """Time a pipeline stage of the current turn (no-op outside a turn)"""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+
+    with timer.stage(name):
+        yield
+
+
+def percentiles(values: Iterable[float]) -> Dict[str, float]:
+    """Nearest-rank p50/p95/p99 (empty input gives an empty dict)"""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+
+    result = {}
+    for p in PERCENTILES:
+        rank = max(math.ceil(p * len(ordered) / 100) - 1, 0)
+        result[f"p{p}"] = ordered[rank]
+    return result
+
+
+def stage_durations(turns: Iterable[Dict[str, Any]]) -> Dict[str, List[float]]:
+    """Durations per stage (plus "total" and "other") across turns"""
+    durations: Dict[str, List[float]] = {"total": [], "other": []}
+
+    for turn in turns:
+        durations["total"].append(turn["total_ms"])
+        durations["other"].append(turn.get("other_ms", 0.0))
+        for span in turn.get("spans", []):
+            durations.setdefault(span["stage"], []).append(span["duration_ms"])
+
+    return durations
+
+
+def latency_summary(turns: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Percentiles of the total and of each stage"""
+    turns = list(turns)
+    durations = stage_durations(turns)
+
+    return {
+        "turns": len(turns),
+        "total": percentiles(durations.pop("total")),
+        "stages": {stage: percentiles(values) for stage, values in durations.items()}
+    }
+
+
+def recent_summary() -> Dict[str, Any]:
+    """Percentiles over this process's rolling window of turns"""
+    return latency_summary(_recent)
+
+
+async def store_turn(call_sid: str, turn: Dict[str, Any]):
+    """Append a finished turn to the call log (capped list)"""
+    try:
+        db = get_db()
+        await db.call_logs.update_one(
+            {"call_sid": call_sid},
+            {"$push": {"turn_latencies": {"$each": [turn], "$slice": -settings.TURN_LATENCY_STORED}}}
+        )
+    except Exception as e:
+        logger.error(f"Storing turn latency failed: {str(e)}")
+
+
+def timed_turn(kind: str):
+    """
+    Decorator for Twilio voice webhooks: time the turn and record it
+
+    Place it above @idempotent_webhook so form parsing and dedup are
+    included in the total.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request: Request):
+            if not settings.TURN_LATENCY_ENABLED:
+                return await func(request)
+
+            timer = TurnTimer(kind)
+            token = _current.set(timer)
+            try:
+                with timer.stage("form"):
+                    form = await request.form()
+                response = await func(request)
+            finally:
+                _current.reset(token)
+
+            call_sid = form.get("CallSid")
+
+            # Only form parsing recorded: a retry answered from the dedup cache
+            if call_sid and len(timer.spans) > 1:
+                turn = timer.finish()
+                _recent.append(turn)
+
+                # Written after the response is returned, off the caller's critical path
+                task = asyncio.create_task(store_turn(call_sid, turn))
+                _pending_writes.add(task)
+                task.add_done_callback(_pending_writes.discard)
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -444,6 +444,8 @@ from twilio.twiml.voice_response import VoiceResponse, Gather
 from typing import Dict, Any, Optional
 from app.config import settings
 from app.utils import logger
+from app.services.metrics import TWILIO_REQUEST_SECONDS, record_fallback, timed
+from app.services.tracing import traced
 
 # Initialize Twilio client
 twilio_client = Client(
@@ -452,6 +454,8 @@ twilio_client = Client(
 )
 
 
+@traced("twilio.make_call")
+@timed(TWILIO_REQUEST_SECONDS, operation="make_call")
 async def make_call(
     to_number: str,
     webhook_url: str,
@@ -485,39 +489,119 @@ async def make_call(
 
     except Exception as e:
         logger.error(f"Failed to make call: {str(e)}")
+        record_fallback("twilio_call", "error")
         return {
             "success": False,
             "error": str(e)
         }
 
 
-def create_voice_response(message: str, gather_input: bool = False) -> str:
+# ------------------------------------------------------------------
+# TWIML TEMPLATES
+# ------------------------------------------------------------------
+# Sara's responses always have the same shape, only the spoken text
+# changes. Each shape is rendered once with the SDK at import time and
+# split around a placeholder, so a turn is two string concatenations
+# plus escaping instead of building and serializing an element tree.
+
+TEMPLATE_SLOT = "__TWIML_TEXT_SLOT__"
+
+
+def escape_text(text: str) -> str:
+    """Escape XML character data exactly like ElementTree (used by the SDK)"""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+class TwiMLTemplate:
+    """Pre-serialized TwiML document with one escaped text slot"""
+    
+    __slots__ = ("prefix", "suffix")
+    
+    def __init__(self, rendered: str):
+        self.prefix, self.suffix = rendered.split(TEMPLATE_SLOT)
+    
+    def render(self, text: str) -> str:
+        return self.prefix + escape_text(text) + self.suffix
+
+
+def build_voice_response(message: str, gather_input: bool = False, audio_url: Optional[str] = None) -> str:
+    """Reference TwiML for create_voice_response, built with the Twilio SDK"""
+    response = VoiceResponse()
+
+    if gather_input:
+        gather = Gather(
+            input="speech",
+            action="/api/v1/webhooks/twilio/gather",
+            method="POST",
+            speechTimeout="auto",
+            language="en-US"
+        )
+        if audio_url:
+            gather.play(audio_url)
+        else:
+            gather.say(message, voice=settings.SARA_VOICE)
+        response.append(gather)
+
+        response.say(
+            "I didn't hear anything. Please call back when you're ready.",
+            voice=settings.SARA_VOICE
+        )
+        response.hangup()
+    elif audio_url:
+        response.play(audio_url)
+    else:
+        response.say(message, voice=settings.SARA_VOICE)
+
+    return str(response)
+
+
+def build_end_call(message: str, audio_url: Optional[str] = None) -> str:
+    """Reference TwiML for end_call, built with the Twilio SDK"""
+    response = VoiceResponse()
+    if audio_url:
+        response.play(audio_url)
+    else:
+        response.say(message, voice=settings.SARA_VOICE)
+    response.hangup()
+    return str(response)
+
+
+GATHER_TEMPLATE = TwiMLTemplate(build_voice_response(TEMPLATE_SLOT, gather_input=True))
+SAY_TEMPLATE = TwiMLTemplate(build_voice_response(TEMPLATE_SLOT))
+END_CALL_TEMPLATE = TwiMLTemplate(build_end_call(TEMPLATE_SLOT))
+
+# Same documents with <Play> of pre-synthesized audio (see audio_cache)
+PLAY_GATHER_TEMPLATE = TwiMLTemplate(build_voice_response("", gather_input=True, audio_url=TEMPLATE_SLOT))
+PLAY_TEMPLATE = TwiMLTemplate(build_voice_response("", audio_url=TEMPLATE_SLOT))
+PLAY_END_CALL_TEMPLATE = TwiMLTemplate(build_end_call("", audio_url=TEMPLATE_SLOT))
+
+
+def create_voice_response(message: str, gather_input: bool = False, audio_url: Optional[str] = None) -> str:
     """
     Create TwiML voice response
+
+    Args:
+        message: Text Sara speaks
+        gather_input: Listen for the caller's reply afterwards
+        audio_url: Pre-synthesized audio of message, played instead of <Say>
     """
     try:
-        response = VoiceResponse()
+        if audio_url:
+            template = PLAY_GATHER_TEMPLATE if gather_input else PLAY_TEMPLATE
+            return template.render(audio_url)
 
-        if gather_input:
-            gather = Gather(
-                input="speech",
-                action="/api/v1/webhooks/twilio/gather",
-                method="POST",
-                speechTimeout="auto",
-                language="en-US"
-            )
-            gather.say(message, voice="Polly.Joanna")
-            response.append(gather)
+        # The SDK writes an empty <Say /> for empty text; leave that case to it
+        if not isinstance(message, str) or not message:
+            return build_voice_response(message, gather_input)
 
-            response.say(
-                "I didn't hear anything. Please call back when you're ready.",
-                voice="Polly.Joanna"
-            )
-            response.hangup()
-        else:
-            response.say(message, voice="Polly.Joanna")
-
-        return str(response)
+        template = GATHER_TEMPLATE if gather_input else SAY_TEMPLATE
+        return template.render(message)
 
     except Exception as e:
         logger.error(f"Failed to create voice response: {str(e)}")
@@ -527,14 +611,17 @@ def create_voice_response(message: str, gather_input: bool = False) -> str:
         return str(response)
 
 
-def end_call(message: str) -> str:
-    """End call with a final message"""
-    response = VoiceResponse()
-    response.say(message, voice="Polly.Joanna")
-    response.hangup()
-    return str(response)
+def end_call(message: str, audio_url: Optional[str] = None) -> str:
+    """End call with a final message (played from audio_url when given)"""
+    if audio_url:
+        return PLAY_END_CALL_TEMPLATE.render(audio_url)
+    if not isinstance(message, str) or not message:
+        return build_end_call(message)
+    return END_CALL_TEMPLATE.render(message)
 
 
+@traced("twilio.get_call_status")
+@timed(TWILIO_REQUEST_SECONDS, operation="call_status")
 async def get_call_status(call_sid: str) -> Dict[str, Any]:
     """Fetch call status from Twilio"""
     try:
@@ -558,6 +645,8 @@ async def get_call_status(call_sid: str) -> Dict[str, Any]:
         }
 
 
+@traced("twilio.get_call_recording")
+@timed(TWILIO_REQUEST_SECONDS, operation="call_recording")
 async def get_call_recording(call_sid: str) -> Dict[str, Any]:
     """Get recording metadata"""
     try:
@@ -583,6 +672,8 @@ async def get_call_recording(call_sid: str) -> Dict[str, Any]:
         }
 
 
+@traced("twilio.download_recording")
+@timed(TWILIO_REQUEST_SECONDS, operation="download_recording")
 async def download_recording(recording_url: str) -> bytes:
     """Download call recording from Twilio"""
     try:
@@ -610,4 +701,5 @@ async def download_recording(recording_url: str) -> bytes:
 
     except Exception as e:
         logger.error(f"Recording download failed: {str(e)}")
+        record_fallback("twilio_recording", "error")
         return b""
@@ -0,0 +1,238 @@
+"""
+Webhook Deduplication - idempotent Twilio webhook handling
+
+Twilio retries a webhook when our response is slow or fails. Without
+dedup, a retried /twilio/gather appends the same speech to the
+conversation twice and runs a second GPT turn.
+
+Each request is keyed by (in order of preference):
+1. The I-Twilio-Idempotency-Token header (identical across retries)
+2. Route-specific form fields, e.g. CallSid + RecordingSid
+3. A hash of the full form and query string
+
+Routes whose form repeats between distinct events (a /gather turn has
+no per-turn field, so two identical answers hash the same) pass
+require_token=True and are only deduplicated by the header.
+
+The first request with a key runs the handler. Retries that arrive
+while it is still running wait for the same result, and later retries
+get the cached response until WEBHOOK_DEDUP_TTL expires. With
+WEBHOOK_DEDUP_BACKEND=mongo, responses are also shared across workers
+through the webhook_responses collection (TTL-indexed).
+"""
+import asyncio
+import functools
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pymongo.errors import DuplicateKeyError
+
+from app.config import get_db, settings
+from app.utils import logger
+from app.services.metrics import record_cache
+
+IDEMPOTENCY_HEADER = "I-Twilio-Idempotency-Token"
+
+# Seconds between checks while another worker processes the same webhook
+MONGO_POLL_INTERVAL = 0.1
+
+# (status_code, body, media_type)
+CachedResponse = Tuple[int, bytes, Optional[str]]
+
+
+def webhook_key(request: Request, form: Dict[str, Any], key_fields: Sequence[str] = ()) -> str:
+    """
+    Identity of a webhook request, stable across Twilio retries
+
+    Args:
+        request: Incoming request
+        form: Parsed form body
+        key_fields: Form fields that identify the event for this route
+    """
+    route = request.url.path
+
+    token = request.headers.get(IDEMPOTENCY_HEADER)
+    if token:
+        return f"{route}:token:{token}"
+
+    if key_fields and all(form.get(field) for field in key_fields):
+        return f"{route}:" + ":".join(str(form.get(field)) for field in key_fields)
+
+    digest = hashlib.sha256()
+    digest.update(str(request.url.query).encode("utf-8"))
+    for name, value in sorted(form.items()):
+        digest.update(f"\x00{name}={value}".encode("utf-8"))
+    return f"{route}:form:{digest.hexdigest()}"
+
+
+def to_cached(result: Any) -> CachedResponse:
+    """Normalize a handler result (Response or JSON-able object)"""
+    if not isinstance(result, Response):
+        result = JSONResponse(content=jsonable_encoder(result))
+    return result.status_code, bytes(result.body), result.media_type
+
+
+def to_response(cached: CachedResponse) -> Response:
+    status_code, body, media_type = cached
+    return Response(content=body, status_code=status_code, media_type=media_type)
+
+
+class WebhookDeduplicator:
+    """In-flight sharing plus a short-TTL response cache"""
+
+    def __init__(self):
+        self._cache: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.duplicates = 0
+
+    def _cached(self, key: str) -> Optional[CachedResponse]:
+        now = time.monotonic()
+
+        # Entries share one TTL, so insertion order is expiry order
+        while self._cache and next(iter(self._cache.values()))[0] <= now:
+            self._cache.popitem(last=False)
+
+        entry = self._cache.get(key)
+        return entry[1] if entry else None
+
+    def _store(self, key: str, cached: CachedResponse):
+        self._cache[key] = (time.monotonic() + settings.WEBHOOK_DEDUP_TTL, cached)
+        self._cache.move_to_end(key)
+
+    async def _wait_shared(self, db, key: str) -> Optional[CachedResponse]:
+        """Wait for another worker's result (None if it never arrives)"""
+        deadline = time.monotonic() + settings.WEBHOOK_DEDUP_WAIT
+
+        while time.monotonic() < deadline:
+            doc = await db.webhook_responses.find_one({"_id": key})
+            if doc is None:
+                # The other worker failed and released the claim
+                return None
+            if doc.get("status") == "done":
+                self.duplicates += 1
+                return doc["status_code"], bytes(doc["body"]), doc.get("media_type")
+            await asyncio.sleep(MONGO_POLL_INTERVAL)
+
+        logger.warning(f"Timed out waiting for duplicate webhook {key}, processing it again")
+        return None
+
+    async def _execute(self, key: str, handler: Callable[[], Awaitable[Any]]) -> CachedResponse:
+        claimed = False
+
+        if settings.WEBHOOK_DEDUP_BACKEND == "mongo":
+            # Claim the key so only one worker runs the handler
+            db = get_db()
+            try:
+                await db.webhook_responses.insert_one({
+                    "_id": key,
+                    "status": "pending",
+                    "created_at": datetime.utcnow()
+                })
+                claimed = True
+            except DuplicateKeyError:
+                cached = await self._wait_shared(db, key)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                logger.error(f"Shared webhook dedup claim failed for {key}: {str(e)}")
+
+        try:
+            cached = to_cached(await handler())
+        except BaseException:
+            if claimed:
+                await db.webhook_responses.delete_one({"_id": key})
+            raise
+
+        if claimed:
+            try:
+                await db.webhook_responses.update_one(
+                    {"_id": key},
+                    {"$set": {
+                        "status": "done",
+                        "status_code": cached[0],
+                        "body": cached[1],
+                        "media_type": cached[2]
+                    }}
+                )
+            except Exception as e:
+                logger.error(f"Storing webhook response {key} failed: {str(e)}")
+
+        return cached
+
+    async def run(self, key: str, handler: Callable[[], Awaitable[Any]]) -> Response:
+        """
+        Run handler once per key and replay its response for duplicates
+
+        Args:
+            key: webhook_key() of the request
+            handler: Coroutine function producing the response
+        """
+        cached = self._cached(key)
+        if cached is not None:
+            record_cache("webhook_dedup", True)
+            self.duplicates += 1
+            logger.info(f"Duplicate webhook {key} answered from cache")
+            return to_response(cached)
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            record_cache("webhook_dedup", True)
+            self.duplicates += 1
+            logger.info(f"Duplicate webhook {key} joined in-flight request")
+            return to_response(await asyncio.shield(in_flight))
+
+        record_cache("webhook_dedup", False)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            cached = await self._execute(key, handler)
+            self._store(key, cached)
+            future.set_result(cached)
+            return to_response(cached)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve it so an unawaited future doesn't log "exception never retrieved"
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+
+webhook_dedup = WebhookDeduplicator()
+
+
+def idempotent_webhook(*key_fields: str, require_token: bool = False):
+    """
+    Decorator for Twilio webhook routes taking `request: Request`
+
+    Args:
+        key_fields: Form fields identifying the event (see webhook_key)
+        require_token: Only deduplicate requests carrying the idempotency header
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request: Request):
+            if not settings.WEBHOOK_DEDUP_ENABLED:
+                return await func(request)
+
+            if require_token and not request.headers.get(IDEMPOTENCY_HEADER):
+                return await func(request)
+
+            # Starlette caches the parsed form, so the handler reuses it
+            form = await request.form()
+            key = webhook_key(request, form, key_fields)
+            return await webhook_dedup.run(key, lambda: func(request))
+
+        return wrapper
+
+    return decorator
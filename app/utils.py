@@ -2,11 +2,33 @@
 """
 Utility Functions and Helpers
 """
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
 import re
+import sys
+import time
 import validators
 from typing import Optional
 from datetime import datetime
 
+from app.services.metrics import LOG_RECORDS_DROPPED
+
+# Longest a warning/error waits for room in a full log queue
+ERROR_PUT_TIMEOUT = 1.0
+
+try:
+    import orjson
+
+    def _json_dumps(entry: dict) -> str:
+        return orjson.dumps(entry, default=str).decode("utf-8")
+except ImportError:
+    def _json_dumps(entry: dict) -> str:
+        return json.dumps(entry, default=str)
+
 
 def validate_url(url: str) -> bool:
     """Validate URL format"""
@@ -91,6 +113,13 @@ def generate_slug(text: str) -> str:
     return text
 
 
+def normalize_industry(industry: Optional[str]) -> Optional[str]:
+    """Canonical industry key for filtering and facets ("Real Estate" -> "real-estate")"""
+    if not industry:
+        return None
+    return generate_slug(industry) or None
+
+
 def format_timestamp(dt: datetime) -> str:
     """Format datetime to ISO string"""
     return dt.isoformat() if dt else None
@@ -104,32 +133,217 @@ def parse_timestamp(timestamp_str: str) -> Optional[datetime]:
         return None
 
 
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line (formatted on the writer thread)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.utcfromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "msg": record.getMessage()
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        
+        return _json_dumps(entry)
+
+
+class TextFormatter(logging.Formatter):
+    """Old print() layout: [LEVEL] timestamp - message {fields}"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = datetime.utcfromtimestamp(record.created).isoformat()
+        line = f"[{record.levelname}] {timestamp} - {record.getMessage()}"
+        fields = getattr(record, "fields", None)
+        if fields:
+            line += f" {fields}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that doesn't format on the caller's thread and only
+    blocks to save warnings and errors
+    
+    The stock prepare() formats the message before enqueueing; here the
+    record goes to the writer thread as-is (lazy %-style args included).
+    Once `limit` entries are queued, INFO/DEBUG records are dropped and
+    counted instead of blocking the event loop. WARNING and above may
+    use the reserved space above `limit`, and when even that is full
+    they wait up to ERROR_PUT_TIMEOUT seconds for the writer thread.
+    """
+    
+    def __init__(self, log_queue: queue.Queue, limit: int):
+        super().__init__(log_queue)
+        self.limit = limit
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, entry):
+        # Logger enqueues (created, level, ...) tuples, stdlib loggers LogRecords
+        level = entry.levelno if isinstance(entry, logging.LogRecord) else entry[1]
+        try:
+            if level >= logging.WARNING:
+                self.queue.put(entry, timeout=ERROR_PUT_TIMEOUT)
+            elif self.queue.qsize() < self.limit:
+                self.queue.put_nowait(entry)
+            else:
+                raise queue.Full
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.labels(level=logging.getLevelName(level).lower()).inc()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler whose flush is left to LogWriter (not one per record)"""
+    
+    def flush(self):
+        pass
+    
+    def flush_buffer(self):
+        try:
+            super().flush()
+        except ValueError:
+            # Stream already closed (interpreter shutdown, captured test output)
+            pass
+
+
+class LogWriter(logging.handlers.QueueListener):
+    """
+    Writer thread: turns queued entries into LogRecords and writes them
+    
+    Logger enqueues plain tuples (creating a LogRecord costs more than
+    the rest of the log call); stdlib records from the same handler are
+    passed through unchanged.
+    """
+    
+    def __init__(self, name: str, log_queue: queue.Queue, *handlers: logging.Handler):
+        super().__init__(log_queue, *handlers)
+        self.name = name
+    
+    def prepare(self, entry) -> logging.LogRecord:
+        if isinstance(entry, logging.LogRecord):
+            return entry
+        
+        created, level, message, args, fields, exc_info = entry
+        record = logging.LogRecord(self.name, level, "", 0, message, args or None, exc_info)
+        record.created = created
+        record.fields = fields
+        return record
+    
+    def handle(self, record: logging.LogRecord):
+        super().handle(record)
+        # Flush once the backlog is written rather than after every line
+        if self.queue.empty():
+            self.flush()
+    
+    def flush(self):
+        for handler in self.handlers:
+            if isinstance(handler, BufferedStreamHandler):
+                handler.flush_buffer()
+    
+    def enqueue_sentinel(self):
+        # Blocking put: the queue may be full when the logger is closed
+        self.queue.put(self._sentinel)
+    
+    def stop(self):
+        super().stop()
+        self.flush()
+
+
 class Logger:
-    """Simple logging utility"""
+    """
+    Structured logger: logger.info("Call started", call_sid=sid)
+    
+    Records are queued and written to stdout by a background thread
+    (QueueHandler/QueueListener), so log calls never block the event
+    loop on I/O. Keyword arguments become JSON fields; %-style args are
+    formatted lazily on the writer thread. INFO/DEBUG can be sampled
+    with LOG_SAMPLE_RATE, warnings and errors are always kept.
+    """
+    
+    def __init__(self, name: str = "trufindai"):
+        self.name = name
+        self._logger = logging.getLogger(name)
+        self._logger.propagate = False
+        self._listener: Optional[LogWriter] = None
+        self._handler: Optional[NonBlockingQueueHandler] = None
+        self._level = logging.INFO
+        self.sample_rate = 1.0
+        self.configure()
+    
+    def configure(
+        self,
+        level: str = "INFO",
+        log_format: str = "json",
+        sample_rate: float = 1.0,
+        queue_size: int = 10000
+    ):
+        """(Re)start the writer thread with new settings"""
+        self.close()
+        
+        # Extra room above queue_size is kept for warnings and errors
+        log_queue = queue.Queue(maxsize=queue_size + max(queue_size // 10, 100))
+        self._handler = NonBlockingQueueHandler(log_queue, limit=queue_size)
+        
+        writer = BufferedStreamHandler(sys.stdout)
+        writer.setFormatter(TextFormatter() if log_format == "text" else JsonFormatter())
+        
+        self._listener = LogWriter(self.name, log_queue, writer)
+        self._listener.start()
+        
+        # Also lets logging.getLogger(name) users share the writer thread
+        self._logger.handlers = [self._handler]
+        self._logger.setLevel(level.upper())
+        self._level = self._logger.level
+        self.sample_rate = sample_rate
+    
+    def close(self):
+        """Flush queued records and stop the writer thread"""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+    
+    @property
+    def dropped(self) -> int:
+        return self._handler.dropped if self._handler else 0
+    
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict, sampled: bool):
+        if level < self._level:
+            return
+        if sampled and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        
+        exc_info = kwargs.pop("exc_info", None)
+        if exc_info is True:
+            # Capture now, the writer thread has no current exception
+            exc_info = sys.exc_info()
+        
+        self._handler.enqueue((time.time(), level, message, args, kwargs, exc_info))
     
-    @staticmethod
-    def info(message: str, **kwargs):
-        timestamp = datetime.utcnow().isoformat()
-        print(f"[INFO] {timestamp} - {message}", kwargs)
+    def info(self, message: str, *args, **kwargs):
+        self._log(logging.INFO, message, args, kwargs, sampled=True)
     
-    @staticmethod
-    def error(message: str, **kwargs):
-        timestamp = datetime.utcnow().isoformat()
-        print(f"[ERROR] {timestamp} - {message}", kwargs)
+    def error(self, message: str, *args, **kwargs):
+        self._log(logging.ERROR, message, args, kwargs, sampled=False)
     
-    @staticmethod
-    def warning(message: str, **kwargs):
-        timestamp = datetime.utcnow().isoformat()
-        print(f"[WARNING] {timestamp} - {message}", kwargs)
+    def warning(self, message: str, *args, **kwargs):
+        self._log(logging.WARNING, message, args, kwargs, sampled=False)
     
-    @staticmethod
-    def debug(message: str, **kwargs):
-        timestamp = datetime.utcnow().isoformat()
-        print(f"[DEBUG] {timestamp} - {message}", kwargs)
+    def debug(self, message: str, *args, **kwargs):
+        self._log(logging.DEBUG, message, args, kwargs, sampled=True)
 
 
-# Initialize logger
+# Initialize logger (app.config applies LOG_* settings once they are loaded)
 logger = Logger()
+atexit.register(logger.close)
 
 
 def serialize_for_mongodb(data: dict) -> dict:
@@ -0,0 +1,27 @@
+"""
+Pytest configuration for the pytest-benchmark suites in benchmarks/
+
+Settings requires credentials at import time; the extractor benchmark
+never reaches the real services, so placeholders are enough when the
+environment doesn't provide them.
+"""
+import os
+
+for name, value in {
+    "MONGODB_URL": "mongodb://localhost:27017",
+    "OPENAI_API_KEY": "sk-benchmark",
+    "TWILIO_ACCOUNT_SID": "ACbenchmark",
+    "TWILIO_AUTH_TOKEN": "benchmark",
+    "TWILIO_PHONE_NUMBER": "+15550000000",
+    "PAGESPEED_API_KEY": "benchmark",
+    "PUBLIC_BASE_URL": "https://benchmark.example",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-digests",
+        action="store_true",
+        help="Rewrite html_corpus/expected_digests.json from the current scraper output"
+    )
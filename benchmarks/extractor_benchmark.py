@@ -0,0 +1,152 @@
+"""
+Extractor Benchmark - HTML parsing cost per scraper extractor (pytest-benchmark)
+
+Times, for every page in benchmarks/html_corpus/:
+- parse:       BeautifulSoup(html, "lxml")
+- each extractor in app.services.scraper, on its own
+- parse_page_html: the full page extraction (parse included)
+
+Extractors that modify the soup (extract_text_content, count_words
+decompose script/style tags) get a freshly parsed soup every round;
+the parse happens outside the timing. The rest share one soup.
+
+Each page's parse_page_html output is hashed and checked against
+expected_digests.json, so a speedup that changes what the scraper
+returns fails as "output changed". After an intended change, refresh
+the file with --update-digests.
+
+Results are grouped per page. --benchmark-compare-fail turns a median
+increase over a saved run into a failing exit status.
+
+Usage:
+    pytest benchmarks/extractor_benchmark.py --benchmark-autosave
+    pytest benchmarks/extractor_benchmark.py --benchmark-compare --benchmark-compare-fail=median:15%
+    pytest benchmarks/extractor_benchmark.py -k wordpress_heavy
+    pytest benchmarks/extractor_benchmark.py --update-digests
+    python -m benchmarks.html_corpus.generate   # rebuild the corpus
+"""
+import hashlib
+import inspect
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from bs4 import BeautifulSoup
+
+from app.services import scraper
+
+CORPUS_DIR = Path(__file__).parent / "html_corpus"
+DIGESTS_FILE = CORPUS_DIR / "expected_digests.json"
+
+PAGE_URL = "https://corpus.example/"
+
+# name -> callable(soup); same order as parse_page_html
+EXTRACTORS: Dict[str, Callable[[BeautifulSoup], Any]] = {
+    "extract_title": scraper.extract_title,
+    "extract_meta_description": scraper.extract_meta_description,
+    "extract_headings": scraper.extract_headings,
+    "extract_schema_markup": scraper.extract_schema_markup,
+    "extract_meta_tags": scraper.extract_meta_tags,
+    "extract_structured_data": scraper.extract_structured_data,
+    "extract_text_content": scraper.extract_text_content,
+    "extract_images": scraper.extract_images,
+    "extract_links": scraper.extract_links,
+    "check_mobile_viewport": scraper.check_mobile_viewport,
+    "analyze_page_structure": scraper.analyze_page_structure,
+    "count_words": scraper.count_words,
+    "count_internal_links": lambda soup: scraper.count_internal_links(soup, PAGE_URL),
+    "count_external_links": scraper.count_external_links,
+    "extract_canonical": scraper.extract_canonical,
+    "extract_og_tags": scraper.extract_og_tags
+}
+
+# Extractors that decompose tags and so need a fresh soup each round
+MUTATING = {"extract_text_content", "count_words"}
+
+# Rounds for MUTATING extractors (each one re-parses the page untimed)
+MUTATING_ROUNDS = 20
+
+EXTRACTOR_PREFIXES = ("extract_", "count_", "check_", "analyze_page_")
+
+PAGES = sorted(path.stem for path in CORPUS_DIR.glob("*.html"))
+
+
+@lru_cache(maxsize=None)
+def load_page(page: str) -> str:
+    return (CORPUS_DIR / f"{page}.html").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def shared_soup(page: str) -> BeautifulSoup:
+    """One soup per page for the extractors that only read it"""
+    return parse(load_page(page))
+
+
+def parse(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "lxml")
+
+
+def output_digest(html: str) -> str:
+    """Stable hash of what parse_page_html returns for a page"""
+    result = scraper.parse_page_html(PAGE_URL, html, 0.0)
+    return hashlib.sha256(json.dumps(result, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def test_corpus_present():
+    assert PAGES, f"No corpus pages in {CORPUS_DIR} (run python -m benchmarks.html_corpus.generate)"
+
+
+def test_every_extractor_is_benchmarked():
+    """Fail if scraper.py grew an extractor this benchmark doesn't time"""
+    missing = [
+        name for name, func in inspect.getmembers(scraper, inspect.isfunction)
+        if name.startswith(EXTRACTOR_PREFIXES)
+        and func.__module__ == scraper.__name__
+        and name not in EXTRACTORS
+    ]
+    assert not missing, f"Extractors not benchmarked: {', '.join(sorted(missing))} (add them to EXTRACTORS)"
+
+
+def test_output_unchanged(request):
+    digests = {page: output_digest(load_page(page)) for page in PAGES}
+
+    if request.config.getoption("--update-digests"):
+        DIGESTS_FILE.write_text(json.dumps(digests, indent=2, sort_keys=True) + "\n")
+        return
+
+    expected = json.loads(DIGESTS_FILE.read_text())
+    changed = {page: f"{expected.get(page)} -> {digest}" for page, digest in digests.items() if expected.get(page) != digest}
+    assert not changed, f"parse_page_html output changed: {changed}"
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_parse(benchmark, page):
+    html = load_page(page)
+    benchmark.group = page
+    benchmark.extra_info["bytes"] = len(html.encode("utf-8"))
+    benchmark(parse, html)
+
+
+@pytest.mark.parametrize("name", list(EXTRACTORS))
+@pytest.mark.parametrize("page", PAGES)
+def test_extractor(benchmark, page, name):
+    extractor = EXTRACTORS[name]
+    benchmark.group = page
+
+    if name in MUTATING:
+        html = load_page(page)
+        benchmark.pedantic(extractor, setup=lambda: ((parse(html),), {}), rounds=MUTATING_ROUNDS)
+    else:
+        benchmark(extractor, shared_soup(page))
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_parse_page_html(benchmark, page):
+    html = load_page(page)
+    benchmark.group = page
+    benchmark(scraper.parse_page_html, PAGE_URL, html, 0.0)
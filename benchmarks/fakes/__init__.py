@@ -0,0 +1,3 @@
+"""
+Local stand-ins for external services (OpenAI, PageSpeed, Twilio media, a website)
+"""
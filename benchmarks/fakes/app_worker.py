@@ -0,0 +1,70 @@
+"""
+Run the app as a single uvicorn worker wired to the fakes
+
+Started as a subprocess by the load test so the app has its own event
+loop and interpreter, like one production worker. External services
+come from the environment (see hot_paths_benchmark.configure_app);
+on top of that this launcher:
+- uses mongomock-motor unless LOAD_WORKER_MONGOMOCK=false
+- mocks S3 with moto and creates AWS_BUCKET_NAME
+- sends Twilio REST calls to the fake Twilio server at --twilio-url
+
+Usage:
+    python -m benchmarks.fakes.app_worker --port 8800 --twilio-url http://127.0.0.1:8790
+"""
+import argparse
+import os
+
+
+def redirect_twilio(twilio_url: str):
+    """Point twilio_service's REST client at the fake Twilio server"""
+    from twilio.http.http_client import TwilioHttpClient
+    from twilio.rest import Client
+
+    from app.config import settings
+    from app.services import twilio_service
+    from benchmarks.fakes.twilio_server import API_BASE_URL
+
+    class FakeTwilioHttpClient(TwilioHttpClient):
+        def request(self, method, url, *args, **kwargs):
+            return super().request(method, url.replace(API_BASE_URL, twilio_url.rstrip("/")), *args, **kwargs)
+
+    twilio_service.twilio_client = Client(
+        settings.TWILIO_ACCOUNT_SID,
+        settings.TWILIO_AUTH_TOKEN,
+        http_client=FakeTwilioHttpClient()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one app worker against the fakes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--twilio-url", required=True, help="Base URL of benchmarks.fakes.twilio_server")
+    args = parser.parse_args()
+
+    import boto3
+    import uvicorn
+    try:
+        from moto import mock_aws
+    except ImportError:
+        from moto import mock_s3 as mock_aws
+
+    from app.config import Database
+
+    if os.getenv("LOAD_WORKER_MONGOMOCK", "true").lower() == "true":
+        from mongomock_motor import AsyncMongoMockClient
+        Database.client = AsyncMongoMockClient()
+
+    with mock_aws():
+        boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1")).create_bucket(
+            Bucket=os.environ["AWS_BUCKET_NAME"]
+        )
+        redirect_twilio(args.twilio_url)
+
+        import main as app_main
+        uvicorn.run(app_main.app, host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Fake OpenAI API - chat, audio, Files + Batch endpoints
+
+Implements just enough of the OpenAI REST API for the app:
+- chat completions that follow the request's response_format (JSON
+  schema, JSON object or plain text), after FAKE_OPENAI_LATENCY seconds
+- Whisper transcriptions and TTS speech (same latency)
+- file upload/download and batch create/retrieve for batch_service;
+  batches complete after FAKE_BATCH_DELAY seconds
+
+Usage:
+    uvicorn benchmarks.fakes.openai_server:app --port 8787
+    OPENAI_BASE_URL=http://localhost:8787/v1 OPENAI_BATCH_ENABLED=true uvicorn main:app
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Dict, Any
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response
+
+app = FastAPI(title="Fake OpenAI")
+
+# Seconds before a submitted batch reports "completed"
+BATCH_DELAY = float(os.getenv("FAKE_BATCH_DELAY", "0"))
+# Seconds each chat/audio request takes (model latency stand-in)
+LATENCY = float(os.getenv("FAKE_OPENAI_LATENCY", "0"))
+
+FAKE_TRANSCRIPT = (
+    "Hi, this is Sara from TruFindAI. Yes, this is the owner. "
+    "We get most customers from Google. How much does it cost? "
+    "Okay, send me more information by email."
+)
+# Not a real MP3, the app only stores and forwards the bytes
+FAKE_SPEECH = b"ID3" + b"\x00" * 4096
+
+files: Dict[str, Dict[str, Any]] = {}
+batches: Dict[str, Dict[str, Any]] = {}
+
+
+def fake_value(schema: Dict[str, Any]) -> Any:
+    """Generate a value matching a JSON schema"""
+    if "enum" in schema:
+        return schema["enum"][0]
+
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return {
+            name: fake_value(prop)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return [fake_value(schema.get("items", {"type": "string"}))]
+    if schema_type in ("integer", "number"):
+        return 70
+    if schema_type == "boolean":
+        return True
+    return "Fake response"
+
+
+def fake_content(body: Dict[str, Any]) -> str:
+    """Assistant message content for a chat completion request"""
+    response_format = body.get("response_format") or {}
+
+    if response_format.get("type") == "json_schema":
+        return json.dumps(fake_value(response_format["json_schema"]["schema"]))
+
+    if response_format.get("type") == "json_object":
+        return json.dumps({
+            "score": 70,
+            "critical_issues": ["Fake critical issue"],
+            "warnings": [],
+            "recommendations": ["Fake recommendation"],
+            "schema_quality": "fair",
+            "ai_readability": "good",
+            "strengths": [],
+            "missing_elements": []
+        })
+
+    return "This is a fake response."
+
+
+def fake_chat_completion(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Chat completion response object"""
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o-mini"),
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": fake_content(body)}
+        }],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}
+    }
+
+
+def file_object(file_id: str) -> Dict[str, Any]:
+    stored = files[file_id]
+    return {
+        "id": file_id,
+        "object": "file",
+        "bytes": len(stored["content"]),
+        "created_at": stored["created_at"],
+        "filename": stored["filename"],
+        "purpose": stored["purpose"],
+        "status": "processed"
+    }
+
+
+def store_file(content: bytes, filename: str, purpose: str) -> str:
+    file_id = f"file-{uuid.uuid4().hex}"
+    files[file_id] = {
+        "content": content,
+        "filename": filename,
+        "purpose": purpose,
+        "created_at": int(time.time())
+    }
+    return file_id
+
+
+def complete_batch(batch: Dict[str, Any]):
+    """Run every request in the input file and attach an output file"""
+    output_lines = []
+
+    for line in files[batch["input_file_id"]]["content"].decode("utf-8").splitlines():
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        output_lines.append(json.dumps({
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": request["custom_id"],
+            "response": {
+                "status_code": 200,
+                "request_id": uuid.uuid4().hex,
+                "body": fake_chat_completion(request["body"])
+            },
+            "error": None
+        }))
+
+    batch["output_file_id"] = store_file(
+        ("\n".join(output_lines) + "\n").encode("utf-8"),
+        "batch_output.jsonl",
+        "batch_output"
+    )
+    batch["status"] = "completed"
+    batch["completed_at"] = int(time.time())
+    batch["request_counts"] = {
+        "total": len(output_lines),
+        "completed": len(output_lines),
+        "failed": 0
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(payload: Dict[str, Any]):
+    await asyncio.sleep(LATENCY)
+    return fake_chat_completion(payload)
+
+
+@app.post("/v1/audio/transcriptions")
+async def transcriptions(file: UploadFile = File(...), model: str = Form(...)):
+    await file.read()
+    await asyncio.sleep(LATENCY)
+    # Unique per call, so summary caches keyed on the transcript miss like in production
+    return {"text": f"{FAKE_TRANSCRIPT} My reference number is {uuid.uuid4().hex[:8]}."}
+
+
+@app.post("/v1/audio/speech")
+async def speech(payload: Dict[str, Any]):
+    await asyncio.sleep(LATENCY)
+    return Response(content=FAKE_SPEECH, media_type="audio/mpeg")
+
+
+@app.post("/v1/files")
+async def create_file(file: UploadFile = File(...), purpose: str = Form(...)):
+    file_id = store_file(await file.read(), file.filename or "upload", purpose)
+    return file_object(file_id)
+
+
+@app.get("/v1/files/{file_id}")
+async def retrieve_file(file_id: str):
+    if file_id not in files:
+        raise HTTPException(status_code=404, detail="No such file")
+    return file_object(file_id)
+
+
+@app.get("/v1/files/{file_id}/content")
+async def file_content(file_id: str):
+    if file_id not in files:
+        raise HTTPException(status_code=404, detail="No such file")
+    return Response(content=files[file_id]["content"], media_type="application/octet-stream")
+
+
+@app.post("/v1/batches")
+async def create_batch(payload: Dict[str, Any]):
+    if payload.get("input_file_id") not in files:
+        raise HTTPException(status_code=400, detail="Unknown input_file_id")
+
+    batch_id = f"batch_{uuid.uuid4().hex}"
+    batches[batch_id] = {
+        "id": batch_id,
+        "object": "batch",
+        "endpoint": payload.get("endpoint"),
+        "input_file_id": payload["input_file_id"],
+        "completion_window": payload.get("completion_window", "24h"),
+        "status": "in_progress",
+        "created_at": int(time.time()),
+        "output_file_id": None,
+        "error_file_id": None,
+        "metadata": payload.get("metadata")
+    }
+    return batches[batch_id]
+
+
+@app.get("/v1/batches/{batch_id}")
+async def retrieve_batch(batch_id: str):
+    batch = batches.get(batch_id)
+    if not batch:
+        raise HTTPException(status_code=404, detail="No such batch")
+
+    if batch["status"] == "in_progress" and time.time() - batch["created_at"] >= BATCH_DELAY:
+        complete_batch(batch)
+
+    return batch
@@ -0,0 +1,39 @@
+"""
+Fake PageSpeed Insights API
+
+Answers GET /pagespeedonline/v5/runPagespeed with the Lighthouse
+category scores scoring.get_pagespeed_data reads, after
+FAKE_PAGESPEED_LATENCY seconds (the real API takes 10-30s).
+
+Usage:
+    uvicorn benchmarks.fakes.pagespeed_server:app --port 8789
+    PAGESPEED_API_URL=http://localhost:8789/pagespeedonline/v5/runPagespeed uvicorn main:app
+"""
+import asyncio
+import os
+
+from fastapi import FastAPI, Query
+
+app = FastAPI(title="Fake PageSpeed")
+
+LATENCY = float(os.getenv("FAKE_PAGESPEED_LATENCY", "0"))
+
+RUN_PAGESPEED_PATH = "/pagespeedonline/v5/runPagespeed"
+
+
+@app.get(RUN_PAGESPEED_PATH)
+async def run_pagespeed(url: str = Query(...), strategy: str = "mobile"):
+    await asyncio.sleep(LATENCY)
+    return {
+        "id": url,
+        "lighthouseResult": {
+            "requestedUrl": url,
+            "configSettings": {"formFactor": strategy},
+            "categories": {
+                "performance": {"id": "performance", "score": 0.62},
+                "seo": {"id": "seo", "score": 0.83},
+                "accessibility": {"id": "accessibility", "score": 0.91},
+                "best-practices": {"id": "best-practices", "score": 0.75}
+            }
+        }
+    }
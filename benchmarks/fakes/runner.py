@@ -0,0 +1,42 @@
+"""
+Run fake services in-process (background threads, ephemeral ports)
+"""
+import threading
+import time
+
+import uvicorn
+
+
+class BackgroundServer:
+    """A uvicorn server on 127.0.0.1 in a daemon thread"""
+
+    def __init__(self, app, name: str):
+        self.name = name
+        self.server = uvicorn.Server(uvicorn.Config(
+            app,
+            host="127.0.0.1",
+            port=0,
+            log_level="warning",
+            access_log=False,
+            lifespan="off"
+        ))
+        self.thread = threading.Thread(target=self.server.run, name=f"fake-{name}", daemon=True)
+        self.base_url = None
+
+    def start(self, timeout: float = 10.0) -> str:
+        """Start and return the base URL"""
+        self.thread.start()
+
+        deadline = time.monotonic() + timeout
+        while not self.server.started:
+            if time.monotonic() > deadline or not self.thread.is_alive():
+                raise RuntimeError(f"Fake {self.name} server did not start")
+            time.sleep(0.01)
+
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    def stop(self):
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
@@ -0,0 +1,117 @@
+"""
+Fake Website - static multi-page business site with a sitemap
+
+Serves FAKE_SITE_PAGES pages (home, services, about, ...) that look like
+a small business site: title, meta description, headings, Open Graph,
+JSON-LD on some pages, images with and without alt text and internal
+links. sitemap.xml lists every page, so scrape_website_deep discovers
+them without crawling. Each response waits FAKE_SITE_LATENCY seconds.
+
+Usage:
+    uvicorn benchmarks.fakes.site_server:app --port 8788
+"""
+import asyncio
+import json
+import os
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
+
+app = FastAPI(title="Fake Website")
+
+PAGES = int(os.getenv("FAKE_SITE_PAGES", "20"))
+LATENCY = float(os.getenv("FAKE_SITE_LATENCY", "0"))
+# Paragraphs of body text per page (page weight)
+PARAGRAPHS = int(os.getenv("FAKE_SITE_PARAGRAPHS", "40"))
+
+SECTIONS = ["services", "about", "pricing", "contact", "blog", "team", "faq", "locations"]
+
+PARAGRAPH = (
+    "We are a family-owned business serving the metro area since 1998. "
+    "Our licensed technicians offer same-day service, upfront pricing and "
+    "a satisfaction guarantee on every job, large or small."
+)
+
+
+def page_paths() -> list:
+    """"/" plus PAGES - 1 section pages"""
+    paths = ["/"]
+    for n in range(1, PAGES):
+        paths.append(f"/{SECTIONS[n % len(SECTIONS)]}/{n}")
+    return paths
+
+
+def render_page(path: str, index: int) -> str:
+    title = "Acme Plumbing | Home" if path == "/" else f"Acme Plumbing | {path.split('/')[1].title()} {index}"
+    links = "".join(f'<li><a href="{link}">{link}</a></li>' for link in page_paths()[:12])
+    body = "".join(f"<p>{PARAGRAPH}</p>" for _ in range(PARAGRAPHS))
+
+    # Mix of good and bad SEO so extraction does real work
+    schema = ""
+    if index % 2 == 0:
+        schema = '<script type="application/ld+json">' + json.dumps({
+            "@context": "https://schema.org",
+            "@type": "LocalBusiness",
+            "name": "Acme Plumbing",
+            "telephone": "+1-555-000-1111",
+            "address": {"@type": "PostalAddress", "addressLocality": "Springfield"}
+        }) + "</script>"
+
+    description = "" if index % 3 == 0 else (
+        f'<meta name="description" content="Acme Plumbing {path} - fast, licensed local plumbers.">'
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+{description}
+<link rel="canonical" href="{path}">
+<meta property="og:title" content="{title}">
+<meta property="og:type" content="website">
+{schema}
+</head>
+<body>
+<header><nav><ul>{links}</ul></nav></header>
+<main>
+<h1>{title}</h1>
+<h2>Why choose us</h2>
+{body}
+<h2>Our work</h2>
+<img src="/img/{index}-1.jpg" alt="Technician at work">
+<img src="/img/{index}-2.jpg">
+<h3>Service area</h3>
+<p>Springfield, Shelbyville and Capital City. <a href="https://example.org/reviews">Read reviews</a></p>
+</main>
+<footer><p>&copy; Acme Plumbing</p></footer>
+</body>
+</html>"""
+
+
+@app.get("/sitemap.xml")
+async def sitemap(request: Request):
+    await asyncio.sleep(LATENCY)
+    base = str(request.base_url).rstrip("/")
+    urls = "".join(f"<url><loc>{base}{path}</loc></url>" for path in page_paths())
+    return Response(
+        content=f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>',
+        media_type="application/xml"
+    )
+
+
+@app.get("/robots.txt")
+async def robots(request: Request):
+    return PlainTextResponse(f"User-agent: *\nAllow: /\nSitemap: {request.base_url}sitemap.xml\n")
+
+
+@app.get("/{path:path}", response_class=HTMLResponse)
+async def page(path: str):
+    await asyncio.sleep(LATENCY)
+    paths = page_paths()
+    full_path = "/" + path
+    if full_path not in paths:
+        raise HTTPException(status_code=404, detail="Not found")
+    return HTMLResponse(render_page(full_path, paths.index(full_path)))
@@ -0,0 +1,77 @@
+"""
+Fake Twilio REST API and recording media
+
+Serves:
+- POST /2010-04-01/Accounts/{sid}/Calls.json (twilio_client.calls.create):
+  answers like Twilio and keeps the call's webhook URLs in created_calls,
+  keyed by the To number, so a load generator can play Twilio's side
+- GET /2010-04-01/Accounts/{sid}/Recordings/{recording_sid}.mp3
+  (what download_recording fetches from a RecordingUrl) with
+  FAKE_RECORDING_BYTES of audio-sized payload
+
+Responses wait FAKE_TWILIO_LATENCY seconds. The recording bytes are not
+real audio: storage uploads them as-is and the fake OpenAI server
+ignores them.
+
+Usage:
+    uvicorn benchmarks.fakes.twilio_server:app --port 8790
+"""
+import asyncio
+import itertools
+import os
+import threading
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+app = FastAPI(title="Fake Twilio")
+
+LATENCY = float(os.getenv("FAKE_TWILIO_LATENCY", "0"))
+# ~2 minutes of 32 kbps mono MP3
+RECORDING_BYTES = int(os.getenv("FAKE_RECORDING_BYTES", str(480 * 1024)))
+
+_recording = b"ID3" + b"\x00" * RECORDING_BYTES
+
+# To number -> call as created (sid, Url, StatusCallback, ...)
+created_calls: Dict[str, Dict[str, Any]] = {}
+_created_lock = threading.Lock()
+_call_numbers = itertools.count(1)
+
+API_BASE_URL = "https://api.twilio.com"
+
+
+def recording_url(base_url: str, recording_sid: str) -> str:
+    """RecordingUrl as Twilio sends it (no extension)"""
+    return f"{base_url.rstrip('/')}/2010-04-01/Accounts/ACfake/Recordings/{recording_sid}"
+
+
+def take_created_call(to_number: str) -> Dict[str, Any]:
+    """Pop the call created for a number (None until calls.create ran)"""
+    with _created_lock:
+        return created_calls.pop(to_number, None)
+
+
+@app.post("/2010-04-01/Accounts/{account_sid}/Calls.json")
+async def create_call(account_sid: str, request: Request):
+    await asyncio.sleep(LATENCY)
+    form = await request.form()
+    call = {
+        "sid": f"CAfake{next(_call_numbers):026d}",
+        "account_sid": account_sid,
+        "to": form.get("To"),
+        "from": form.get("From"),
+        "status": "queued",
+        "url": form.get("Url"),
+        "status_callback": form.get("StatusCallback"),
+        "recording_status_callback": form.get("RecordingStatusCallback")
+    }
+    with _created_lock:
+        created_calls[call["to"]] = call
+    return JSONResponse(call, status_code=201)
+
+
+@app.get("/2010-04-01/Accounts/{account_sid}/Recordings/{recording_file}")
+async def recording_media(account_sid: str, recording_file: str):
+    await asyncio.sleep(LATENCY)
+    return Response(content=_recording, media_type="audio/mpeg")
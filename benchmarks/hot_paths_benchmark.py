@@ -0,0 +1,431 @@
+"""
+Hot Paths Benchmark - throughput and latency against local fakes
+
+Runs the app's hot paths with every external service replaced by a
+local stand-in, so results are repeatable and cost nothing:
+- website:   benchmarks/fakes/site_server.py (multi-page site + sitemap)
+- OpenAI:    benchmarks/fakes/openai_server.py (chat, Whisper, TTS)
+- PageSpeed: benchmarks/fakes/pagespeed_server.py
+- Twilio:    benchmarks/fakes/twilio_server.py (recording media)
+- S3:        moto (in-process)
+- MongoDB:   mongomock-motor, or a local mongod with --mongodb-url
+             (uses the trufindai_benchmark database)
+
+Benchmarks:
+- scrape_website_deep: scraper.scrape_website_deep on the fake site
+- analyze_deep_route:  POST /api/v1/analysis/deep (scrape, GPT, PageSpeed, save)
+- gather_turn:         POST /api/v1/webhooks/twilio/gather (one Sara turn;
+                       the call is answered first, outside the timing)
+- recording_webhook:   POST /api/v1/webhooks/twilio/recording (download,
+                       S3 upload, transcription, summary, save)
+
+Requests go through the ASGI app in-process (httpx.ASGITransport), so
+routing, dedup and serialization are included but no HTTP server is.
+
+Results are saved as JSON; --compare flags regressions against an
+earlier run (p50/p95 up or throughput down by more than --threshold).
+
+Usage:
+    python -m benchmarks.hot_paths_benchmark --output baseline.json
+    python -m benchmarks.hot_paths_benchmark --only gather_turn --iterations 200 --concurrency 20 \
+        --output new.json --compare baseline.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+BENCHMARKS = ("scrape_website_deep", "analyze_deep_route", "gather_turn", "recording_webhook")
+
+BENCHMARK_DB = "trufindai_benchmark"
+BENCHMARK_BUCKET = "trufindai-benchmark"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark hot paths against local fakes")
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help="Comma-separated benchmarks to run")
+    parser.add_argument("--iterations", type=int, default=20, help="Operations per benchmark")
+    parser.add_argument("--deep-iterations", type=int, default=3, help="Operations for the deep-analysis benchmarks")
+    parser.add_argument("--concurrency", type=int, default=1, help="Operations in flight at once")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed operations before each benchmark")
+    parser.add_argument("--max-pages", type=int, default=5, help="Pages per deep analysis")
+    parser.add_argument("--site-pages", type=int, default=20, help="Pages on the fake site")
+    parser.add_argument("--site-latency", type=float, default=0.02, help="Fake site response time (s)")
+    parser.add_argument("--openai-latency", type=float, default=0.3, help="Fake OpenAI response time (s)")
+    parser.add_argument("--pagespeed-latency", type=float, default=1.0, help="Fake PageSpeed response time (s)")
+    parser.add_argument("--twilio-latency", type=float, default=0.05, help="Fake recording download time (s)")
+    parser.add_argument("--mongodb-url", default=None, help="Use a real mongod instead of mongomock")
+    parser.add_argument("--log-level", default="WARNING", help="App LOG_LEVEL during the run")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change counted as a regression")
+    return parser.parse_args()
+
+
+def start_fakes(args) -> Dict[str, Any]:
+    """Configure and start the fake services (before the app is imported)"""
+    os.environ.update({
+        "FAKE_SITE_PAGES": str(args.site_pages),
+        "FAKE_SITE_LATENCY": str(args.site_latency),
+        "FAKE_OPENAI_LATENCY": str(args.openai_latency),
+        "FAKE_PAGESPEED_LATENCY": str(args.pagespeed_latency),
+        "FAKE_TWILIO_LATENCY": str(args.twilio_latency)
+    })
+
+    from benchmarks.fakes import openai_server, pagespeed_server, site_server, twilio_server
+    from benchmarks.fakes.runner import BackgroundServer
+
+    servers = {
+        "site": BackgroundServer(site_server.app, "site"),
+        "openai": BackgroundServer(openai_server.app, "openai"),
+        "pagespeed": BackgroundServer(pagespeed_server.app, "pagespeed"),
+        "twilio": BackgroundServer(twilio_server.app, "twilio")
+    }
+    for server in servers.values():
+        server.start()
+
+    return servers
+
+
+def configure_app(servers: Dict[str, Any], args):
+    """Point every external dependency of the app at the fakes"""
+    from benchmarks.fakes.pagespeed_server import RUN_PAGESPEED_PATH
+
+    os.environ.update({
+        "MONGODB_URL": args.mongodb_url or "mongodb://localhost:27017",
+        "MONGODB_DB_NAME": BENCHMARK_DB,
+        # mongomock can't explain() queries for the startup index report
+        "MONGODB_ENSURE_INDEXES": "true" if args.mongodb_url else "false",
+        "OPENAI_API_KEY": "sk-fake",
+        "OPENAI_BASE_URL": f"{servers['openai'].base_url}/v1",
+        "OPENAI_BATCH_ENABLED": "false",
+        "PAGESPEED_API_KEY": "fake",
+        "PAGESPEED_API_URL": f"{servers['pagespeed'].base_url}{RUN_PAGESPEED_PATH}",
+        "TWILIO_ACCOUNT_SID": "ACfake",
+        "TWILIO_AUTH_TOKEN": "fake",
+        "TWILIO_PHONE_NUMBER": "+15550000000",
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_BUCKET_NAME": BENCHMARK_BUCKET,
+        "AWS_REGION": "us-east-1",
+        "PUBLIC_BASE_URL": "http://bench",
+        "TRANSCRIPTION_BACKEND": "openai",
+        "TTS_CACHE_ENABLED": "false",
+        "TRACING_ENABLED": "false",
+        "STATS_REBUILD_INTERVAL": "0",
+        "LOG_LEVEL": args.log_level
+    })
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    rank = max(math.ceil(pct * len(ordered) / 100) - 1, 0)
+    return ordered[rank]
+
+
+def summarize(latencies: List[float], errors: int, wall_seconds: float, concurrency: int) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    result = {
+        "operations": len(latencies) + errors,
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_ops": round(len(latencies) / wall_seconds, 3) if wall_seconds else 0.0
+    }
+    if ordered:
+        result["latency_ms"] = {
+            "mean": round(statistics.fmean(ordered), 2),
+            "p50": round(percentile(ordered, 50), 2),
+            "p95": round(percentile(ordered, 95), 2),
+            "p99": round(percentile(ordered, 99), 2),
+            "max": round(ordered[-1], 2)
+        }
+    return result
+
+
+async def run_benchmark(
+    operation: Callable[[int], Awaitable[bool]],
+    iterations: int,
+    concurrency: int,
+    warmup: int,
+    prepare: Optional[Callable[[int], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """
+    Run operation(i) for i in range(iterations), `concurrency` at a time
+
+    prepare(i) runs before each operation, outside the timing.
+    """
+    # Warm-up operations use indices past the timed ones
+    for i in range(iterations, iterations + warmup):
+        if prepare:
+            await prepare(i)
+        await operation(i)
+
+    latencies: List[float] = []
+    errors = 0
+    next_index = iter(range(iterations))
+
+    async def worker():
+        nonlocal errors
+        for i in next_index:
+            if prepare:
+                await prepare(i)
+            start = time.perf_counter()
+            try:
+                ok = await operation(i)
+            except Exception as e:
+                print(f"  operation {i} raised: {e}", file=sys.stderr)
+                ok = False
+            if ok:
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(concurrency, 1))))
+    return summarize(latencies, errors, time.perf_counter() - started, concurrency)
+
+
+def build_benchmarks(client, servers: Dict[str, Any], args, lead_id: str) -> Dict[str, Dict[str, Any]]:
+    """Operation (and per-operation setup) of each benchmark"""
+    from app.config import get_db
+    from app.services.scraper import scrape_website_deep
+    from benchmarks.fakes.twilio_server import recording_url
+
+    site_url = f"{servers['site'].base_url}/"
+    run_id = datetime.utcnow().strftime("%H%M%S%f")
+
+    async def scrape(i: int) -> bool:
+        result = await scrape_website_deep(site_url, max_pages=args.max_pages)
+        return bool(result.get("success"))
+
+    async def analyze(i: int) -> bool:
+        response = await client.post(
+            f"/api/v1/analysis/deep?max_pages={args.max_pages}",
+            json={
+                "business_name": "Acme Plumbing",
+                "website_url": site_url,
+                "phone_number": "+15550001111",
+                "city": "Springfield",
+                "industry": "Plumbing"
+            }
+        )
+        return response.status_code == 200
+
+    def call_sid(prefix: str, i: int) -> str:
+        return f"CA{prefix}{run_id}{i:06d}"
+
+    async def answer_call(i: int):
+        # As initiate_sara_call leaves it once Twilio accepted the call
+        await get_db().call_logs.insert_one({
+            "call_sid": call_sid("gather", i),
+            "lead_id": lead_id,
+            "phone_number": "+15550001111",
+            "status": "in_progress",
+            "started_at": datetime.utcnow()
+        })
+        response = await client.post(
+            f"/api/v1/webhooks/twilio/voice?lead_id={lead_id}",
+            data={"CallSid": call_sid("gather", i), "CallStatus": "in-progress"}
+        )
+        response.raise_for_status()
+
+    async def gather(i: int) -> bool:
+        response = await client.post(
+            "/api/v1/webhooks/twilio/gather",
+            data={
+                "CallSid": call_sid("gather", i),
+                # Not a canned intent, so the turn goes through GPT
+                "SpeechResult": "Can you explain what exactly you would change on our website?",
+                "Confidence": "0.92"
+            }
+        )
+        # <Gather>: Sara replied and kept listening (not an error goodbye)
+        return response.status_code == 200 and "<Gather" in response.text
+
+    async def recording(i: int) -> bool:
+        recording_sid = f"RE{run_id}{i:06d}"
+        response = await client.post(
+            "/api/v1/webhooks/twilio/recording",
+            data={
+                "CallSid": call_sid("recording", i),
+                "RecordingSid": recording_sid,
+                "RecordingUrl": recording_url(servers["twilio"].base_url, recording_sid),
+                "RecordingDuration": "120"
+            }
+        )
+        body = response.json()
+        return response.status_code == 200 and body.get("success") and body.get("transcript_generated")
+
+    deep = {"iterations": args.deep_iterations}
+    return {
+        "scrape_website_deep": {"operation": scrape, **deep},
+        "analyze_deep_route": {"operation": analyze, **deep},
+        "gather_turn": {"operation": gather, "prepare": answer_call, "iterations": args.iterations},
+        "recording_webhook": {"operation": recording, "iterations": args.iterations}
+    }
+
+
+async def run_suite(args, servers: Dict[str, Any], selected: List[str]) -> Dict[str, Any]:
+    from app.config import Database
+
+    if not args.mongodb_url:
+        from mongomock_motor import AsyncMongoMockClient
+        Database.client = AsyncMongoMockClient()
+
+    import httpx
+    import main
+    from app.config import get_db
+
+    results = {}
+    async with main.lifespan(main.app):
+        db = get_db()
+        lead = await db.leads.insert_one({
+            "business_name": "Acme Plumbing",
+            "website_url": f"{servers['site'].base_url}/",
+            "phone_number": "+15550001111",
+            "top_issues": ["Missing schema markup", "Missing meta descriptions"],
+            "ai_visibility_score": 42,
+            "seo_score": 61,
+            "overall_score": 51
+        })
+
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+            benchmarks = build_benchmarks(client, servers, args, str(lead.inserted_id))
+
+            for name in selected:
+                spec = benchmarks[name]
+                print(f"Running {name} ({spec['iterations']} ops, concurrency {args.concurrency})...")
+                results[name] = await run_benchmark(
+                    spec["operation"],
+                    spec["iterations"],
+                    args.concurrency,
+                    args.warmup,
+                    prepare=spec.get("prepare")
+                )
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Print changes per benchmark and return the regressions"""
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} ({baseline.get('started_at')}):")
+
+    changed = {
+        key: (baseline.get("config", {}).get(key), value)
+        for key, value in current["config"].items()
+        if key not in ("threshold", "log_level") and baseline.get("config", {}).get(key) != value
+    }
+    for key, (old, new) in changed.items():
+        print(f"  note: {key} changed {old} -> {new}")
+
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or "latency_ms" not in before or "latency_ms" not in result:
+            print(f"  {name}: no baseline")
+            continue
+
+        if before.get("concurrency") != result.get("concurrency"):
+            print(f"  {name}: concurrency {before.get('concurrency')} -> {result.get('concurrency')}, not comparable")
+            continue
+
+        checks = [
+            ("p50", before["latency_ms"]["p50"], result["latency_ms"]["p50"], True),
+            ("p95", before["latency_ms"]["p95"], result["latency_ms"]["p95"], True),
+            ("throughput", before["throughput_ops"], result["throughput_ops"], False)
+        ]
+        for metric, old, new, lower_is_better in checks:
+            change = (new - old) / old if old else 0.0
+            worse = change > threshold if lower_is_better else change < -threshold
+            flag = "  REGRESSION" if worse else ""
+            print(f"  {name:<22} {metric:<10} {old:>10} -> {new:>10} ({change:+.1%}){flag}")
+            if worse:
+                regressions.append(f"{name} {metric} {change:+.1%}")
+
+    return regressions
+
+
+def print_results(results: Dict[str, Any]):
+    print(f"\n{'benchmark':<22} {'ops':>5} {'err':>4} {'ops/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, result in results.items():
+        latency = result.get("latency_ms", {})
+        print(
+            f"{name:<22} {result['operations']:>5} {result['errors']:>4} {result['throughput_ops']:>8} "
+            f"{latency.get('p50', '-'):>9} {latency.get('p95', '-'):>9} "
+            f"{latency.get('p99', '-'):>9} {latency.get('max', '-'):>9}"
+        )
+
+
+def main():
+    args = parse_args()
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        sys.exit(f"Unknown benchmarks: {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+
+    try:
+        from moto import mock_aws
+    except ImportError:
+        from moto import mock_s3 as mock_aws
+    import boto3
+
+    servers = start_fakes(args)
+    configure_app(servers, args)
+
+    started_at = datetime.utcnow().isoformat()
+    try:
+        with mock_aws():
+            boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BENCHMARK_BUCKET)
+            results = asyncio.run(run_suite(args, servers, selected))
+    finally:
+        for server in servers.values():
+            server.stop()
+
+    report = {
+        "started_at": started_at,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "mongodb": "mongod" if args.mongodb_url else "mongomock",
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "compare", "only", "mongodb_url")
+        },
+        "results": results
+    }
+
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\nSaved to {args.output}")
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text()), report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): " + "; ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
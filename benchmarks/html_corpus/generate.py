@@ -0,0 +1,300 @@
+"""
+HTML Corpus Generator - representative pages for the extractor benchmark
+
+Writes the checked-in corpus next to this file. Pages are synthetic but
+follow the markup of the sites the scraper sees in practice:
+- landing_minimal.html:     tiny one-pager, no schema, no meta description
+- small_business.html:      clean semantic site, JSON-LD + microdata
+- ecommerce_category.html:  product grid with Product microdata
+- wordpress_heavy.html:     page-builder markup, inline CSS/JS, mega menu
+- spa_shell.html:           client-rendered app: little markup, huge
+                            inline bundle and state JSON
+
+Output is deterministic (fixed seed), so regenerating only changes
+files when this script changes.
+
+Usage:
+    python -m benchmarks.html_corpus.generate
+"""
+import json
+import random
+from pathlib import Path
+
+CORPUS_DIR = Path(__file__).parent
+
+WORDS = (
+    "plumbing repair emergency service licensed local family owned quality affordable "
+    "water heater drain cleaning leak detection installation estimate customer team "
+    "experience guarantee residential commercial trusted same day appointment "
+    "springfield neighborhood certified professional reliable upfront pricing"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def paragraph(rng: random.Random, sentences: int = 4) -> str:
+    return " ".join(sentence(rng, rng.randint(8, 18)) for _ in range(sentences))
+
+
+def landing_minimal(rng: random.Random) -> str:
+    return f"""<html>
+<head><title>Bob's Roofing</title></head>
+<body>
+<div class="hero"><b>Bob's Roofing</b><br>{sentence(rng)}</div>
+<div>{paragraph(rng, 3)}</div>
+<img src="roof.jpg">
+<a href="tel:5550001111">Call now</a> <a href="https://facebook.com/bobsroofing">Facebook</a>
+</body>
+</html>
+"""
+
+
+def small_business(rng: random.Random) -> str:
+    schema = {
+        "@context": "https://schema.org",
+        "@type": "Plumber",
+        "name": "Acme Plumbing",
+        "telephone": "+1-555-000-1111",
+        "url": "https://acmeplumbing.example",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": "12 Main St",
+            "addressLocality": "Springfield",
+            "addressRegion": "IL",
+            "postalCode": "62701"
+        },
+        "openingHours": "Mo-Fr 08:00-18:00",
+        "aggregateRating": {"@type": "AggregateRating", "ratingValue": "4.8", "reviewCount": "213"}
+    }
+    nav = "".join(
+        f'<li><a href="/{slug}">{slug.title()}</a></li>'
+        for slug in ("services", "about", "pricing", "reviews", "blog", "contact")
+    )
+    services = "".join(
+        f"<section><h2>{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}</h2>"
+        f"<p>{paragraph(rng)}</p><h3>What's included</h3><p>{paragraph(rng, 2)}</p>"
+        f'<img src="/img/service-{i}.jpg" alt="{sentence(rng, 4)}"></section>'
+        for i in range(6)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Acme Plumbing | Licensed Plumbers in Springfield, IL</title>
+<meta name="description" content="Fast, licensed plumbers in Springfield. Same-day repairs, water heaters and drain cleaning.">
+<link rel="canonical" href="https://acmeplumbing.example/">
+<meta property="og:title" content="Acme Plumbing">
+<meta property="og:description" content="Licensed plumbers in Springfield, IL">
+<meta property="og:image" content="https://acmeplumbing.example/og.jpg">
+<meta property="og:type" content="website">
+<meta name="twitter:card" content="summary_large_image">
+<meta name="twitter:title" content="Acme Plumbing">
+<link rel="stylesheet" href="/css/site.css">
+<script type="application/ld+json">{json.dumps(schema)}</script>
+</head>
+<body>
+<header><a href="/"><img src="/img/logo.svg" alt="Acme Plumbing"></a><nav><ul>{nav}</ul></nav></header>
+<main>
+<h1>Springfield's Trusted Plumbers Since 1998</h1>
+<p>{paragraph(rng)}</p>
+{services}
+<article><h2>From our blog</h2><p>{paragraph(rng, 6)}</p><a href="/blog/water-heater-guide">Read more</a></article>
+</main>
+<aside><h3>Service area</h3><p>Springfield, Chatham, Rochester, Sherman</p></aside>
+<footer>
+<div itemscope itemtype="https://schema.org/LocalBusiness">
+<span itemprop="name">Acme Plumbing</span>
+<div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress"><span itemprop="streetAddress">12 Main St</span>, <span itemprop="addressLocality">Springfield</span></div>
+<a itemprop="telephone" href="tel:+15550001111">(555) 000-1111</a>
+</div>
+<a href="https://www.facebook.com/acmeplumbing">Facebook</a> <a href="https://www.yelp.com/biz/acme-plumbing">Yelp</a>
+</footer>
+<script src="/js/site.js" defer></script>
+</body>
+</html>
+"""
+
+
+def ecommerce_category(rng: random.Random) -> str:
+    products = []
+    for i in range(120):
+        name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} Kit {i}"
+        price = f"{rng.randint(9, 499)}.{rng.randint(0, 99):02d}"
+        products.append(f"""<li class="product-card" itemscope itemtype="https://schema.org/Product">
+<a href="/products/{i}" class="product-link"><img src="/img/p/{i}.webp" alt="{name}" loading="lazy" width="300" height="300"></a>
+<h3 itemprop="name"><a href="/products/{i}">{name}</a></h3>
+<div itemprop="offers" itemscope itemtype="https://schema.org/Offer"><span itemprop="priceCurrency" content="USD">$</span><span itemprop="price">{price}</span></div>
+<div class="rating" aria-label="Rated {rng.randint(3, 5)} out of 5"></div>
+<button class="add-to-cart" data-product-id="{i}">Add to cart</button>
+</li>""")
+    filters = "".join(
+        f'<li><input type="checkbox" id="f{i}"><label for="f{i}">{rng.choice(WORDS).title()} ({rng.randint(1, 90)})</label></li>'
+        for i in range(60)
+    )
+    footer_links = "".join(f'<a href="/pages/{i}">{rng.choice(WORDS).title()}</a> ' for i in range(80))
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Plumbing Supplies | Shop 120 Products | PipeMart</title>
+<meta name="description" content="Shop plumbing supplies with free shipping over $50.">
+<link rel="canonical" href="https://pipemart.example/collections/plumbing">
+<meta property="og:title" content="Plumbing Supplies">
+<meta property="og:type" content="product.group">
+<script type="application/ld+json">{json.dumps({"@context": "https://schema.org", "@type": "Organization", "name": "PipeMart", "url": "https://pipemart.example"})}</script>
+<style>{".product-card{display:flex;flex-direction:column}" * 40}</style>
+</head>
+<body>
+<header><nav><a href="/">PipeMart</a> <a href="/collections">Shop</a> <a href="/cart">Cart</a></nav></header>
+<main>
+<h1>Plumbing Supplies</h1>
+<aside><h2>Filter</h2><ul>{filters}</ul></aside>
+<section><ul class="product-grid">{"".join(products)}</ul></section>
+<nav class="pagination"><a href="?page=2">Next</a></nav>
+</main>
+<footer>{footer_links}</footer>
+<script>window.dataLayer=window.dataLayer||[];{"dataLayer.push({event:'view_item_list'});" * 50}</script>
+</body>
+</html>
+"""
+
+
+def wordpress_heavy(rng: random.Random) -> str:
+    menu = "".join(
+        f'<li class="menu-item menu-item-type-post_type menu-item-object-page menu-item-{i}">'
+        f'<a href="https://bigplumbing.example/{rng.choice(WORDS)}-{i}/" class="elementor-item">{rng.choice(WORDS).title()}</a></li>'
+        for i in range(300)
+    )
+    yoast = {
+        "@context": "https://schema.org",
+        "@graph": [
+            {"@type": "WebPage", "@id": "https://bigplumbing.example/#webpage", "name": "Big Plumbing"},
+            {"@type": "Organization", "@id": "https://bigplumbing.example/#org", "name": "Big Plumbing Co"},
+            {"@type": "BreadcrumbList", "itemListElement": [
+                {"@type": "ListItem", "position": i, "name": rng.choice(WORDS)} for i in range(1, 6)
+            ]}
+        ]
+    }
+    inline_styles = "".join(
+        f"<style id='elementor-post-{i}-css'>" + ".elementor-element-%d{margin:0 auto;padding:10px 20px}" % i * 30 + "</style>"
+        for i in range(25)
+    )
+    inline_scripts = "".join(
+        f"<script id='wp-script-{i}'>var wpData{i} = {json.dumps({'nonce': 'abc%d' % i, 'ajaxurl': '/wp-admin/admin-ajax.php', 'strings': [sentence(rng) for _ in range(10)]})};</script>"
+        for i in range(30)
+    )
+    blocks = []
+    for i in range(80):
+        inner = paragraph(rng, rng.randint(2, 5))
+        blocks.append(
+            f'<div class="elementor-section elementor-top-section elementor-element elementor-element-{i}" data-id="{i:x}" data-element_type="section">'
+            f'<div class="elementor-container elementor-column-gap-default"><div class="elementor-column elementor-col-100">'
+            f'<div class="elementor-widget-wrap elementor-element-populated"><div class="elementor-element elementor-widget elementor-widget-text-editor">'
+            f'<div class="elementor-widget-container"><!-- wp:paragraph --><p>{inner}</p><!-- /wp:paragraph -->'
+            + (f"<h2 class='elementor-heading-title'>{sentence(rng, 5)}</h2>" if i % 4 == 0 else "")
+            + (f"<h3>{sentence(rng, 4)}</h3>" if i % 6 == 0 else "")
+            + f'<img width="1024" height="683" src="/wp-content/uploads/2023/0{i % 9 + 1}/img-{i}.jpg" '
+            f'srcset="/wp-content/uploads/img-{i}-300x200.jpg 300w, /wp-content/uploads/img-{i}-768x512.jpg 768w, /wp-content/uploads/img-{i}.jpg 1024w" '
+            f'sizes="(max-width: 1024px) 100vw, 1024px"' + (f' alt="{sentence(rng, 3)}"' if i % 3 else "") + ">"
+            f"</div></div></div></div></div></div>"
+        )
+    sidebar = "".join(
+        f'<section class="widget widget_recent_entries"><h2 class="widget-title">{sentence(rng, 3)}</h2><ul>'
+        + "".join(f'<li><a href="https://bigplumbing.example/blog/{j}/">{sentence(rng, 6)}</a></li>' for j in range(15))
+        + "</ul></section>"
+        for _ in range(6)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en-US">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Emergency Plumbing Services | Big Plumbing Co</title>
+<meta name="description" content="Big Plumbing Co offers 24/7 emergency plumbing across the metro area.">
+<meta name="robots" content="index, follow, max-image-preview:large">
+<link rel="canonical" href="https://bigplumbing.example/emergency-plumbing/">
+<meta property="og:locale" content="en_US">
+<meta property="og:type" content="article">
+<meta property="og:title" content="Emergency Plumbing Services">
+<meta property="og:url" content="https://bigplumbing.example/emergency-plumbing/">
+<meta name="twitter:card" content="summary_large_image">
+<script type="application/ld+json" class="yoast-schema-graph">{json.dumps(yoast)}</script>
+<script>window._wpemojiSettings = {json.dumps({"baseUrl": "https://s.w.org/images/core/emoji/14.0.0/72x72/", "ext": ".png"})};{"/*! wp-emoji-release */" + "!function(e,a,t){var n,r,o,i=a.createElement('canvas');}(window,document,window._wpemojiSettings);" * 20}</script>
+{inline_styles}
+</head>
+<body class="page-template-default page page-id-42 wp-custom-logo elementor-default elementor-kit-7 elementor-page elementor-page-42">
+<div id="page" class="site"><a class="skip-link screen-reader-text" href="#content">Skip to content</a>
+<header id="masthead" class="site-header" role="banner"><div class="site-branding"><a href="https://bigplumbing.example/" class="custom-logo-link"><img src="/wp-content/uploads/logo.png" class="custom-logo" alt="Big Plumbing Co"></a></div>
+<nav id="site-navigation" class="main-navigation"><ul id="primary-menu" class="menu">{menu}</ul></nav></header>
+<div id="content" class="site-content"><div id="primary" class="content-area"><main id="main" class="site-main">
+<article id="post-42" class="post-42 page type-page status-publish hentry"><div class="entry-content">
+<h1 class="entry-title">Emergency Plumbing Services</h1>
+<div data-elementor-type="wp-page" data-elementor-id="42" class="elementor elementor-42">{"".join(blocks)}</div>
+</div></article></main></div>
+<aside id="secondary" class="widget-area">{sidebar}</aside></div>
+<footer id="colophon" class="site-footer"><div class="site-info">&copy; Big Plumbing Co. <a href="https://wordpress.org/">Proudly powered by WordPress</a></div></footer></div>
+{inline_scripts}
+<script src="/wp-includes/js/jquery/jquery.min.js?ver=3.7.1" id="jquery-core-js"></script>
+<noscript><img height="1" width="1" style="display:none" src="https://www.facebook.com/tr?id=1&ev=PageView&noscript=1"></noscript>
+</body>
+</html>
+"""
+
+
+def spa_shell(rng: random.Random) -> str:
+    # Redux-style state blob and a minified bundle, both inlined
+    state = {
+        "catalog": [
+            {"id": i, "title": sentence(rng, 5), "body": paragraph(rng, 2), "tags": [rng.choice(WORDS) for _ in range(6)]}
+            for i in range(1200)
+        ],
+        "user": None,
+        "flags": {f"flag_{i}": bool(i % 2) for i in range(200)}
+    }
+    bundle = "".join(
+        f"function m{i}(e,t,n){{\"use strict\";var r=n({i % 97}),o=n.n(r);e.exports=function(){{return o()({json.dumps(sentence(rng, 6))})}}}}"
+        for i in range(6000)
+    )
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>FixIt - Book a Plumber in Minutes</title>
+<link rel="manifest" href="/manifest.json">
+<link href="/static/css/main.4f2a1c.css" rel="stylesheet">
+</head>
+<body>
+<noscript>You need to enable JavaScript to run this app.</noscript>
+<div id="root"><div class="app-shell"><header class="app-header"><span class="logo">FixIt</span></header><div class="skeleton"></div></div></div>
+<script>window.__INITIAL_STATE__ = {json.dumps(state)};</script>
+<script>!function(){{var modules={{}};{bundle}}}();</script>
+<script src="/static/js/main.9c3e7b.js"></script>
+</body>
+</html>
+"""
+
+
+PAGES = {
+    "landing_minimal.html": landing_minimal,
+    "small_business.html": small_business,
+    "ecommerce_category.html": ecommerce_category,
+    "wordpress_heavy.html": wordpress_heavy,
+    "spa_shell.html": spa_shell
+}
+
+
+def main():
+    for filename, render in PAGES.items():
+        html = render(random.Random(filename))
+        (CORPUS_DIR / filename).write_text(html, encoding="utf-8")
+        print(f"{filename}: {len(html.encode('utf-8')) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
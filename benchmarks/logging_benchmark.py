@@ -0,0 +1,198 @@
+"""
+Logging Benchmark - event-loop time spent logging per request
+
+Compares the old print()-based utils.Logger with the queue-backed
+structured logger. Each simulated request logs the same lines as a
+Twilio gather turn; the time the event loop spends inside log calls is
+measured (the writer thread's I/O is not on the loop).
+
+Sinks:
+- file: stdout redirected to a file (typical container log driver)
+- pipe: stdout is a pipe drained by a slow reader, like a log shipper
+  that falls behind; print() blocks once the pipe buffer is full
+
+The queued logger's queue is sized to hold every line of the run by
+default, so no INFO lines are dropped and the comparison is like for
+like; pass a smaller --queue-size to see drop behaviour. The "time
+saved" figure is only printed for runs without drops.
+
+Usage:
+    python -m benchmarks.logging_benchmark --requests 5000 --sink pipe
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, List
+
+from app.utils import Logger
+
+CALL_SID = "CA" + "0" * 32
+SPEECH = "Yeah I guess, how much does it cost for a small restaurant like ours?"
+
+# Log calls per simulated request (legacy_turn / structured_turn)
+LINES_PER_TURN = 5
+
+
+class LegacyLogger:
+    """utils.Logger before the queue-backed rewrite"""
+
+    @staticmethod
+    def info(message: str, **kwargs):
+        timestamp = datetime.utcnow().isoformat()
+        print(f"[INFO] {timestamp} - {message}", kwargs)
+
+    @staticmethod
+    def error(message: str, **kwargs):
+        timestamp = datetime.utcnow().isoformat()
+        print(f"[ERROR] {timestamp} - {message}", kwargs)
+
+
+def legacy_turn(log):
+    """The lines a gather turn logged before (f-strings)"""
+    log.info("Twilio gather webhook received")
+    log.info(f"User said: {SPEECH[:100]}")
+    log.info("Generating GPT-4 response...")
+    log.info(f"Generated response: {SPEECH[:100]}...")
+    log.info(f"Call {CALL_SID} status in-progress (seq 2) buffered")
+
+
+def structured_turn(log):
+    """The same lines through the structured API"""
+    log.info("Twilio gather webhook received", call_sid=CALL_SID)
+    log.info("User said", call_sid=CALL_SID, speech=SPEECH[:100])
+    log.info("Generating GPT-4 response...")
+    log.info("Generated response: %s...", SPEECH[:100])
+    log.info("Call status buffered", call_sid=CALL_SID, status="in-progress", sequence="2")
+
+
+def open_sink(kind: str, read_delay: float):
+    """Stream to log into (and a stop callback)"""
+    if kind == "file":
+        handle = tempfile.TemporaryFile("w+")
+        return handle, handle.close
+
+    read_fd, write_fd = os.pipe()
+    stop = threading.Event()
+
+    def drain():
+        # Slow consumer: 64 KiB per read_delay
+        while not stop.is_set():
+            try:
+                if not os.read(read_fd, 65536):
+                    return
+            except OSError:
+                return
+            time.sleep(read_delay)
+
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    stream = os.fdopen(write_fd, "w", buffering=1)
+
+    def close():
+        stop.set()
+        # Drain what is left so the writer can finish
+        os.set_blocking(read_fd, False)
+        try:
+            while os.read(read_fd, 65536):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        try:
+            stream.close()
+        except OSError:
+            pass
+        os.close(read_fd)
+
+    return stream, close
+
+
+async def measure(turn: Callable[[], None], requests: int) -> List[float]:
+    """Event-loop microseconds per request"""
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        turn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+        await asyncio.sleep(0)
+    return samples
+
+
+def summarize(name: str, samples: List[float]) -> Dict[str, Any]:
+    ordered = sorted(samples)
+    return {
+        "logger": name,
+        "mean_us": round(statistics.fmean(ordered), 2),
+        "p50_us": round(ordered[len(ordered) // 2], 2),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1], 2),
+        "max_us": round(ordered[-1], 2)
+    }
+
+
+def run_case(name: str, sink: str, read_delay: float, requests: int, queue_size: int) -> Dict[str, Any]:
+    stream, close = open_sink(sink, read_delay)
+    real_stdout = sys.stdout
+    sys.stdout = stream
+
+    try:
+        if name == "legacy":
+            log = LegacyLogger()
+            samples = asyncio.run(measure(lambda: legacy_turn(log), requests))
+            dropped = 0
+        else:
+            # Binds the current (redirected) stdout to its writer thread
+            log = Logger(f"benchmark-{sink}")
+            log.configure(queue_size=queue_size)
+            samples = asyncio.run(measure(lambda: structured_turn(log), requests))
+            dropped = log.dropped
+            log.close()
+    finally:
+        sys.stdout = real_stdout
+        close()
+
+    result = summarize(name, samples)
+    result["dropped_lines"] = dropped
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-loop cost of logging per request")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--sink", choices=["file", "pipe"], default="file")
+    parser.add_argument("--read-delay", type=float, default=0.05, help="Pipe reader delay per 64 KiB")
+    parser.add_argument("--queue-size", type=int, default=None, help="Queued logger's LOG_QUEUE_SIZE (default: every line fits)")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    queue_size = args.queue_size or args.requests * LINES_PER_TURN
+    results = [
+        run_case(name, args.sink, args.read_delay, args.requests, queue_size)
+        for name in ("legacy", "queued")
+    ]
+
+    legacy, queued = results
+
+    print(f"sink={args.sink} requests={args.requests} queue_size={queue_size}")
+    for result in results:
+        print(
+            f"{result['logger']:>7}  mean={result['mean_us']}us  p50={result['p50_us']}us  "
+            f"p99={result['p99_us']}us  max={result['max_us']}us  dropped={result['dropped_lines']}"
+        )
+    if queued["dropped_lines"]:
+        print("queued logger dropped lines, so it did less work: no time-saved figure (raise --queue-size)")
+    else:
+        print(f"event-loop time saved per request: {legacy['mean_us'] - queued['mean_us']:.2f}us (mean)")
+
+    if args.output:
+        args.output.write_text(json.dumps({"sink": args.sink, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+"""
+Sara Load Test - concurrent call flows against one app worker
+
+Plays Twilio's side of N simultaneous Sara calls against a single
+uvicorn worker (benchmarks/fakes/app_worker.py, its own process) whose
+OpenAI, Twilio, PageSpeed, S3 and MongoDB are the local fakes used by
+hot_paths_benchmark.
+
+Each simulated call follows the real flow:
+1. POST /api/v1/sara/call; the app's calls.create reaches the fake
+   Twilio API, which hands back the webhook URLs the app registered
+2. status callbacks: initiated, ringing
+3. voice webhook (answer, Sara's opening line)
+4. --turns gather turns with synthetic caller speech, --think-time
+   seconds apart (caller speaking + Sara's audio playing); the last one
+   says goodbye, so the call ends through save_call_outcome
+5. status callback: completed
+6. recording callback (download, S3 upload, transcription, summary)
+
+Concurrency is ramped through --concurrency levels. At each level that
+many callers run calls back to back for --duration seconds. A level is
+sustainable when gather-turn p95 stays under --slo-p95-ms and fewer than
+--max-error-rate of the calls fail; the ramp stops at the first level
+that is not (unless --keep-going).
+
+Usage:
+    python -m benchmarks.sara_load_test --concurrency 5,10,20,40 --duration 30
+    python -m benchmarks.sara_load_test --concurrency 50 --turns 6 --openai-latency 0.8 --output load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from benchmarks.hot_paths_benchmark import configure_app, git_commit, percentile, start_fakes
+
+# Free-form questions go through GPT; the price question takes the intent fast path
+CALLER_SPEECH = [
+    "Can you explain what exactly you would change on our website?",
+    "We already have someone who does our marketing, why would we need this?",
+    "How much does it cost?",
+    "What does AI visibility even mean for a plumbing company like mine?",
+    "Would this help us show up when people ask ChatGPT for a plumber?",
+    "How long does it usually take before we see any results?",
+    "Do you work with other businesses in Springfield?",
+    "Can you send me an example of a report you did for someone else?"
+]
+GOODBYE_SPEECH = "No thank you, I'm not interested. Goodbye."
+
+IDEMPOTENCY_HEADER = "I-Twilio-Idempotency-Token"
+
+STAGES = ("setup", "answer", "turn", "status", "recording")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test concurrent Sara calls against one app worker")
+    parser.add_argument("--concurrency", default="5,10,20,40", help="Comma-separated concurrent-call levels to ramp through")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per concurrency level")
+    parser.add_argument("--turns", type=int, default=4, help="Gather turns per call (the last one says goodbye)")
+    parser.add_argument("--think-time", type=float, default=2.0, help="Mean seconds between turns (+/-50%% jitter)")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls before the first level")
+    parser.add_argument("--slo-p95-ms", type=float, default=1500.0, help="Gather-turn p95 a sustainable level must stay under")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Failed-call fraction a sustainable level may have")
+    parser.add_argument("--keep-going", action="store_true", help="Run every level even after one is not sustainable")
+    parser.add_argument("--openai-latency", type=float, default=0.3, help="Fake OpenAI response time (s)")
+    parser.add_argument("--twilio-latency", type=float, default=0.0, help="Fake Twilio API/recording response time (s)")
+    parser.add_argument("--mongodb-url", default=None, help="Use a real mongod instead of mongomock")
+    parser.add_argument("--log-level", default="WARNING", help="App LOG_LEVEL in the worker")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for speech choice and think-time jitter")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    # Fakes hot_paths_benchmark starts that only the setup analysis touches
+    args.site_pages = 3
+    args.site_latency = 0.0
+    args.pagespeed_latency = 0.0
+    return args
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_worker(servers: Dict[str, Any], args) -> subprocess.Popen:
+    """Start the app worker process (environment already set by configure_app)"""
+    port = free_port()
+    env = {**os.environ, "LOAD_WORKER_MONGOMOCK": "false" if args.mongodb_url else "true"}
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.fakes.app_worker",
+            "--port", str(port),
+            "--twilio-url", servers["twilio"].base_url
+        ],
+        env=env
+    )
+    process.base_url = f"http://127.0.0.1:{port}"
+    return process
+
+
+async def wait_for_worker(client, process: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App worker exited with status {process.returncode}")
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("App worker did not become healthy")
+
+
+class LoadStats:
+    """Latencies (ms) per stage, call outcomes and concurrent calls"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self.errors: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.calls_completed = 0
+        self.calls_failed = 0
+        self.active = 0
+        self.peak_active = 0
+
+    def call_started(self):
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+
+    def call_finished(self, ok: bool):
+        self.active -= 1
+        if ok:
+            self.calls_completed += 1
+        else:
+            self.calls_failed += 1
+
+
+class CallFailed(Exception):
+    pass
+
+
+class CallSimulator:
+    """Plays Twilio's side of one Sara call at a time"""
+
+    def __init__(self, client, servers: Dict[str, Any], lead_id: str, args):
+        self.client = client
+        self.servers = servers
+        self.lead_id = lead_id
+        self.args = args
+        self.numbers = iter(range(10 ** 8))
+
+    async def post(self, stats: LoadStats, stage: str, url: str, data: Dict[str, Any], expect: Optional[str] = None):
+        """POST a webhook like Twilio does, timing it under stage"""
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        start = time.perf_counter()
+        try:
+            response = await self.client.post(path, data=data, headers={IDEMPOTENCY_HEADER: uuid.uuid4().hex})
+        except Exception as e:
+            stats.errors[stage] += 1
+            raise CallFailed(f"{stage}: {e}")
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if response.status_code != 200 or (expect and expect not in response.text):
+            stats.errors[stage] += 1
+            raise CallFailed(f"{stage}: HTTP {response.status_code} {response.text[:200]!r}")
+
+        stats.latencies[stage].append(elapsed)
+        return response
+
+    async def wait_for_twilio(self, to_number: str, timeout: float = 30.0) -> Dict[str, Any]:
+        """The call the app created through the fake Twilio API"""
+        from benchmarks.fakes.twilio_server import take_created_call
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            call = take_created_call(to_number)
+            if call:
+                return call
+            await asyncio.sleep(0.005)
+        raise CallFailed("setup: calls.create never reached Twilio")
+
+    async def think(self, rng: random.Random):
+        await asyncio.sleep(self.args.think_time * rng.uniform(0.5, 1.5))
+
+    async def run_call(self, stats: LoadStats, rng: random.Random) -> bool:
+        from benchmarks.fakes.twilio_server import recording_url
+
+        to_number = f"+8801{next(self.numbers):09d}"
+        stats.call_started()
+        try:
+            start = time.perf_counter()
+            response = await self.client.post("/api/v1/sara/call", json={"lead_id": self.lead_id, "phone_number": to_number})
+            if response.status_code != 200:
+                stats.errors["setup"] += 1
+                raise CallFailed(f"setup: HTTP {response.status_code}")
+            try:
+                call = await self.wait_for_twilio(to_number)
+            except CallFailed:
+                stats.errors["setup"] += 1
+                raise
+            stats.latencies["setup"].append((time.perf_counter() - start) * 1000)
+
+            call_sid = call["sid"]
+            sequence = iter(range(100))
+            for status in ("initiated", "ringing"):
+                await self.post(stats, "status", call["status_callback"], {
+                    "CallSid": call_sid, "CallStatus": status, "SequenceNumber": next(sequence)
+                })
+
+            await self.post(stats, "answer", call["url"], {"CallSid": call_sid, "CallStatus": "in-progress"}, expect="<Gather")
+
+            for turn in range(self.args.turns):
+                await self.think(rng)
+                last = turn == self.args.turns - 1
+                response = await self.post(stats, "turn", "/api/v1/webhooks/twilio/gather", {
+                    "CallSid": call_sid,
+                    "SpeechResult": GOODBYE_SPEECH if last else rng.choice(CALLER_SPEECH),
+                    "Confidence": "0.92"
+                }, expect=None if last else "<Gather")
+                if last and "<Gather" in response.text:
+                    stats.errors["turn"] += 1
+                    raise CallFailed("turn: goodbye did not end the call")
+
+            duration = int(self.args.turns * self.args.think_time) + 10
+            await self.post(stats, "status", call["status_callback"], {
+                "CallSid": call_sid, "CallStatus": "completed",
+                "CallDuration": duration, "SequenceNumber": next(sequence)
+            })
+
+            recording_sid = f"RE{uuid.uuid4().hex}"
+            response = await self.post(stats, "recording", call["recording_status_callback"], {
+                "CallSid": call_sid,
+                "RecordingSid": recording_sid,
+                "RecordingUrl": recording_url(self.servers["twilio"].base_url, recording_sid),
+                "RecordingDuration": duration,
+                "RecordingStatus": "completed"
+            })
+            if not response.json().get("success"):
+                stats.errors["recording"] += 1
+                raise CallFailed(f"recording: {response.json().get('error')}")
+
+            stats.call_finished(True)
+            return True
+
+        except CallFailed as e:
+            print(f"  call {to_number} failed at {e}", file=sys.stderr)
+            stats.call_finished(False)
+            return False
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, Any]:
+    if not latencies:
+        return {}
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "mean": round(statistics.fmean(ordered), 2),
+        "p50": round(percentile(ordered, 50), 2),
+        "p95": round(percentile(ordered, 95), 2),
+        "p99": round(percentile(ordered, 99), 2),
+        "max": round(ordered[-1], 2)
+    }
+
+
+async def run_level(simulator: CallSimulator, concurrency: int, args) -> Dict[str, Any]:
+    """`concurrency` callers placing calls back to back for --duration seconds"""
+    stats = LoadStats()
+    deadline = time.monotonic() + args.duration
+
+    async def caller(index: int):
+        rng = random.Random(f"{args.seed}-{concurrency}-{index}")
+        # Spread call starts so turns don't arrive in lockstep
+        await asyncio.sleep(rng.uniform(0, args.think_time))
+        while time.monotonic() < deadline:
+            await simulator.run_call(stats, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller(index) for index in range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+
+    calls = stats.calls_completed + stats.calls_failed
+    turn = latency_summary(stats.latencies["turn"])
+    error_rate = stats.calls_failed / calls if calls else 1.0
+
+    return {
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "calls_completed": stats.calls_completed,
+        "calls_failed": stats.calls_failed,
+        "error_rate": round(error_rate, 4),
+        "errors_by_stage": {stage: count for stage, count in stats.errors.items() if count},
+        "peak_active_calls": stats.peak_active,
+        "turns_per_second": round(len(stats.latencies["turn"]) / wall_seconds, 3) if wall_seconds else 0.0,
+        "latency_ms": {stage: latency_summary(values) for stage, values in stats.latencies.items()},
+        "sustainable": bool(turn) and turn["p95"] <= args.slo_p95_ms and error_rate <= args.max_error_rate
+    }
+
+
+async def run_load_test(args, servers: Dict[str, Any], levels: List[int]) -> Dict[str, Any]:
+    import httpx
+
+    worker = start_worker(servers, args)
+    limits = httpx.Limits(max_connections=max(levels) * 2, max_keepalive_connections=max(levels) * 2)
+    try:
+        async with httpx.AsyncClient(base_url=worker.base_url, timeout=120, limits=limits) as client:
+            await wait_for_worker(client, worker)
+
+            # The lead every simulated call is about, created through the API
+            response = await client.post("/api/v1/analysis/", json={
+                "business_name": "Acme Plumbing",
+                "website_url": f"{servers['site'].base_url}/",
+                "phone_number": "+8801700000000",
+                "city": "Springfield",
+                "industry": "Plumbing"
+            })
+            response.raise_for_status()
+            lead_id = response.json()["lead_id"]
+
+            simulator = CallSimulator(client, servers, lead_id, args)
+
+            print(f"Warming up ({args.warmup} calls)...")
+            warmup_stats = LoadStats()
+            for index in range(args.warmup):
+                await simulator.run_call(warmup_stats, random.Random(f"warmup-{index}"))
+
+            results = []
+            for concurrency in levels:
+                print(f"Running {concurrency} concurrent calls for {args.duration:g}s...")
+                result = await run_level(simulator, concurrency, args)
+                results.append(result)
+                print_level(result)
+                if not result["sustainable"] and not args.keep_going:
+                    break
+
+            return {"worker_pid": worker.pid, "levels": results}
+    finally:
+        worker.terminate()
+        try:
+            worker.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            worker.kill()
+
+
+def print_level(result: Dict[str, Any]):
+    turn = result["latency_ms"]["turn"]
+    verdict = "ok" if result["sustainable"] else "NOT SUSTAINABLE"
+    print(
+        f"  calls={result['calls_completed']}+{result['calls_failed']} failed  "
+        f"peak={result['peak_active_calls']}  turns/s={result['turns_per_second']}  "
+        f"turn p50={turn.get('p50', '-')} p95={turn.get('p95', '-')} "
+        f"p99={turn.get('p99', '-')} max={turn.get('max', '-')} ms  {verdict}"
+    )
+
+
+def print_results(levels: List[Dict[str, Any]], max_sustainable: Optional[int], args):
+    print(f"\n{'calls':>6} {'peak':>5} {'done':>5} {'fail':>5} {'turns/s':>8} "
+          f"{'turn p50':>9} {'turn p95':>9} {'turn p99':>9} {'answer p95':>11} {'rec p95':>9}")
+    for level in levels:
+        latency = level["latency_ms"]
+        print(
+            f"{level['concurrency']:>6} {level['peak_active_calls']:>5} {level['calls_completed']:>5} "
+            f"{level['calls_failed']:>5} {level['turns_per_second']:>8} "
+            f"{latency['turn'].get('p50', '-'):>9} {latency['turn'].get('p95', '-'):>9} "
+            f"{latency['turn'].get('p99', '-'):>9} {latency['answer'].get('p95', '-'):>11} "
+            f"{latency['recording'].get('p95', '-'):>9}"
+        )
+
+    if max_sustainable:
+        print(f"\nMax sustainable concurrent calls per worker: {max_sustainable} "
+              f"(turn p95 <= {args.slo_p95_ms:g} ms, errors <= {args.max_error_rate:.1%})")
+    else:
+        print(f"\nNo level met turn p95 <= {args.slo_p95_ms:g} ms with errors <= {args.max_error_rate:.1%}")
+
+
+def main():
+    args = parse_args()
+    try:
+        levels = sorted({int(level) for level in args.concurrency.split(",") if level.strip()})
+    except ValueError:
+        sys.exit(f"Invalid --concurrency: {args.concurrency}")
+    if not levels or levels[0] < 1:
+        sys.exit("--concurrency needs positive levels")
+
+    servers = start_fakes(args)
+    configure_app(servers, args)
+
+    started_at = datetime.utcnow().isoformat()
+    try:
+        outcome = asyncio.run(run_load_test(args, servers, levels))
+    finally:
+        for server in servers.values():
+            server.stop()
+
+    levels_run = outcome["levels"]
+    # Highest level that passed with every lower level passing too
+    max_sustainable = None
+    for level in levels_run:
+        if not level["sustainable"]:
+            break
+        max_sustainable = level["concurrency"]
+
+    report = {
+        "started_at": started_at,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "mongodb": "mongod" if args.mongodb_url else "mongomock",
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "mongodb_url")
+        },
+        "levels": levels_run,
+        "max_sustainable_concurrency": max_sustainable
+    }
+
+    print_results(levels_run, max_sustainable, args)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, default=str))
+        print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
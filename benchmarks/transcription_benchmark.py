@@ -0,0 +1,137 @@
+"""
+Transcription Backend Benchmark
+
+Compares throughput and real-time factor (RTF) of the speech-to-text
+backends in app.services.transcription_service.
+
+Usage:
+    python -m benchmarks.transcription_benchmark call1.wav call2.mp3 \
+        --backends openai,local --repeat 3 --concurrency 2
+
+RTF = processing time / audio duration (lower is better, < 1.0 is faster
+than real time). Audio duration is read from WAV headers, taken from the
+local engine's decoder, or can be forced with --duration.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import wave
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from app.services.transcription_service import (
+    create_transcription_backend,
+    LocalWhisperBackend,
+    TranscriptionBackend
+)
+
+
+def wav_duration(path: Path) -> Optional[float]:
+    """Read duration from a WAV header (None for other formats)"""
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
+    except (wave.Error, EOFError):
+        return None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def measure_duration(audio_data: bytes, path: Path) -> Optional[float]:
+    """Best-effort audio duration lookup"""
+    duration = wav_duration(path)
+    if duration is None and LocalWhisperBackend.is_available():
+        probe = LocalWhisperBackend(model_size="tiny.en")
+        try:
+            duration = (await probe.transcribe_with_info(audio_data))["duration"]
+        finally:
+            probe.shutdown()
+    return duration
+
+
+async def run_backend(
+    backend: TranscriptionBackend,
+    samples: List[Dict[str, Any]],
+    repeat: int,
+    concurrency: int
+) -> Dict[str, Any]:
+    """Time all samples `repeat` times with bounded concurrency"""
+    # Warm up (model load / connection setup is not part of steady state)
+    await backend.transcribe(samples[0]["audio"])
+
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[float] = []
+
+    async def one(sample: Dict[str, Any]):
+        async with semaphore:
+            started = time.perf_counter()
+            await backend.transcribe(sample["audio"])
+            timings.append(time.perf_counter() - started)
+
+    jobs = [sample for _ in range(repeat) for sample in samples]
+    wall_started = time.perf_counter()
+    await asyncio.gather(*(one(sample) for sample in jobs))
+    wall_time = time.perf_counter() - wall_started
+
+    audio_seconds = sum(sample["duration"] or 0 for sample in jobs)
+
+    return {
+        "backend": backend.name,
+        "runs": len(jobs),
+        "concurrency": concurrency,
+        "wall_time_s": round(wall_time, 3),
+        "mean_latency_s": round(statistics.mean(timings), 3),
+        "p95_latency_s": round(percentile(timings, 95), 3),
+        "audio_seconds": round(audio_seconds, 2),
+        "throughput_audio_s_per_s": round(audio_seconds / wall_time, 2) if audio_seconds else None,
+        "rtf": round(sum(timings) / audio_seconds, 3) if audio_seconds else None
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark transcription backends")
+    parser.add_argument("files", nargs="+", type=Path, help="Audio files (wav/mp3)")
+    parser.add_argument("--backends", default="openai,local")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=None, help="Override audio duration (seconds)")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    samples = []
+    for path in args.files:
+        audio = path.read_bytes()
+        duration = args.duration or await measure_duration(audio, path)
+        samples.append({"path": str(path), "audio": audio, "duration": duration})
+
+    results = []
+    for name in args.backends.split(","):
+        backend = create_transcription_backend(name.strip())
+        if backend.name != name.strip():
+            print(f"Skipping {name}: backend unavailable")
+            continue
+        try:
+            results.append(await run_backend(backend, samples, args.repeat, args.concurrency))
+        finally:
+            backend.shutdown()
+
+    for result in results:
+        print(
+            f"{result['backend']:>8}  runs={result['runs']}  "
+            f"mean={result['mean_latency_s']}s  p95={result['p95_latency_s']}s  "
+            f"RTF={result['rtf']}  throughput={result['throughput_audio_s_per_s']} audio-s/s"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
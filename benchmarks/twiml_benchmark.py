@@ -0,0 +1,134 @@
+"""
+TwiML Rendering Benchmark
+
+Checks that the pre-serialized TwiML templates in
+app.services.twilio_service produce byte-for-byte the same XML as the
+Twilio SDK, then times both renderers.
+
+Usage:
+    python -m benchmarks.twiml_benchmark --iterations 20000
+
+Exits with status 1 if any template output differs from the SDK (the
+same equality is asserted in tests/test_twiml_templates.py).
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Tuple
+
+from app.services.twilio_service import (
+    build_end_call,
+    build_voice_response,
+    create_voice_response,
+    end_call
+)
+
+# Text that exercises escaping: markup characters, quotes, entities,
+# whitespace, non-ASCII and things that look like the template slot
+SAMPLES = [
+    "Hi, this is Sara from TruFindAI. Do you have a moment?",
+    "Our plans start at $199 setup & $39/month - no contracts.",
+    "Is 5 < 10 and 10 > 5? <Say>not a tag</Say> &amp; already escaped",
+    'She said "great" and it\'s fine',
+    "Line one\nLine two\r\n\ttabbed",
+    "Café, naïve, 日本語, emoji 🙂",
+    "   leading and trailing spaces   ",
+    "__TWIML_TEXT_SLOT__ in the middle of __TWIML_TEXT_SLOT__",
+    "]]> <![CDATA[ x ]]>",
+    "a",
+    "Sara: " + "This is a long response sentence. " * 40,
+]
+
+# (name, template renderer, SDK renderer)
+RENDERERS: List[Tuple[str, Callable[[str], str], Callable[[str], str]]] = [
+    (
+        "gather",
+        lambda text: create_voice_response(text, gather_input=True),
+        lambda text: build_voice_response(text, gather_input=True)
+    ),
+    (
+        "say",
+        lambda text: create_voice_response(text),
+        lambda text: build_voice_response(text)
+    ),
+    ("end_call", end_call, build_end_call),
+    # <Play> variants; the sample text stands in for the audio URL
+    (
+        "play_gather",
+        lambda url: create_voice_response("", gather_input=True, audio_url=url),
+        lambda url: build_voice_response("", gather_input=True, audio_url=url)
+    ),
+    (
+        "play_end",
+        lambda url: end_call("", audio_url=url),
+        lambda url: build_end_call("", audio_url=url)
+    ),
+]
+
+
+def verify() -> List[Dict[str, Any]]:
+    """Compare template output with the SDK (returns mismatches)"""
+    mismatches = []
+
+    for name, template, sdk in RENDERERS:
+        for text in SAMPLES:
+            expected = sdk(text).encode("utf-8")
+            actual = template(text).encode("utf-8")
+            if actual != expected:
+                mismatches.append({"renderer": name, "text": text, "expected": expected, "actual": actual})
+
+    return mismatches
+
+
+def time_renderer(render: Callable[[str], str], iterations: int) -> float:
+    """Mean microseconds per render over the sample set"""
+    def run():
+        for text in SAMPLES:
+            render(text)
+
+    seconds = min(timeit.repeat(run, number=iterations // len(SAMPLES) or 1, repeat=3))
+    renders = (iterations // len(SAMPLES) or 1) * len(SAMPLES)
+    return seconds / renders * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify and benchmark TwiML templates")
+    parser.add_argument("--iterations", type=int, default=20000, help="Renders per renderer")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON")
+    args = parser.parse_args()
+
+    mismatches = verify()
+    checked = len(RENDERERS) * len(SAMPLES)
+    if mismatches:
+        for mismatch in mismatches:
+            print(f"MISMATCH {mismatch['renderer']} {mismatch['text']!r}")
+            print(f"   sdk:      {mismatch['expected']!r}")
+            print(f"   template: {mismatch['actual']!r}")
+        sys.exit(1)
+    print(f"Byte-for-byte match with the Twilio SDK: {checked}/{checked}")
+
+    results = []
+    for name, template, sdk in RENDERERS:
+        template_us = time_renderer(template, args.iterations)
+        sdk_us = time_renderer(sdk, args.iterations)
+        results.append({
+            "renderer": name,
+            "template_us": round(template_us, 3),
+            "sdk_us": round(sdk_us, 3),
+            "speedup": round(sdk_us / template_us, 1)
+        })
+
+    for result in results:
+        print(
+            f"{result['renderer']:>11}  template={result['template_us']}us  "
+            f"sdk={result['sdk_us']}us  speedup={result['speedup']}x"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
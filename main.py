@@ -4,74 +4,145 @@ TruFindAI Backend - Debug Version
 
 import asyncio
 import sys
+from contextlib import asynccontextmanager
 
 if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-print("=" * 50)
-print("STARTING TRUFINDAI BACKEND")
-print("=" * 50)
 
-print("\n1. Importing FastAPI...")
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-print("✅ FastAPI imported")
 
-print("\n2. Importing config...")
 try:
-    from app.config import settings
-    print(f"✅ Config imported - Environment: {settings.ENVIRONMENT}")
-except Exception as e:
-    print(f"❌ Config import failed: {e}")
-    exit(1)
+    from app.config import settings, Database
+except Exception:
+    # app.config has already logged the configuration error
+    sys.exit(1)
+
+from app.utils import logger
+from app.services.tracing import TracingMiddleware, setup_tracing, shutdown_tracing
+from app.services.profiler import ProfilerMiddleware
 
-print("\n3. Importing routes...")
+logger.info("Starting TruFindAI backend", environment=settings.ENVIRONMENT)
 
 try:
     from app.routes.analysis import router as analysis_router
-    print("✅ Analysis route imported")
+    logger.info("Analysis route imported")
 except Exception as e:
-    print(f"❌ Analysis route failed: {e}")
+    logger.error("Analysis route failed", error=str(e))
     analysis_router = None
 
 try:
     from app.routes.sara import router as sara_router
-    print("✅ Sara route imported")
+    logger.info("Sara route imported")
 except Exception as e:
-    print(f"❌ Sara route failed: {e}")
+    logger.error("Sara route failed", error=str(e))
     sara_router = None
 
 try:
     from app.routes.history import router as history_router
-    print("✅ History route imported")
+    logger.info("History route imported")
 except Exception as e:
-    print(f"❌ History route failed: {e}")
+    logger.error("History route failed", error=str(e))
     history_router = None
 
 try:
     from app.routes.recordings import router as recordings_router
-    print("✅ Recordings route imported")
+    logger.info("Recordings route imported")
 except Exception as e:
-    print(f"❌ Recordings route failed: {e}")
+    logger.error("Recordings route failed", error=str(e))
     recordings_router = None
 
 try:
     from app.routes.webhooks import router as webhooks_router
-    print("✅ Webhooks route imported")
+    logger.info("Webhooks route imported")
 except Exception as e:
-    print(f"❌ Webhooks route failed: {e}")
+    logger.error("Webhooks route failed", error=str(e))
     webhooks_router = None
 
-print("\n4. Creating FastAPI app...")
+try:
+    from app.routes.audio import router as audio_router
+    logger.info("Audio route imported")
+except Exception as e:
+    logger.error("Audio route failed", error=str(e))
+    audio_router = None
+
+try:
+    from app.routes.admin import router as admin_router
+    logger.info("Admin route imported")
+except Exception as e:
+    logger.error("Admin route failed", error=str(e))
+    admin_router = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Connect MongoDB, apply indexes and start background workers; stop and close on shutdown"""
+    workers = []
+
+    setup_tracing()
+
+    try:
+        await Database.connect()
+        logger.info("MongoDB connected")
+    except Exception as e:
+        logger.error("MongoDB connection failed", error=str(e))
+
+    if settings.MONGODB_ENSURE_INDEXES:
+        from app.services.index_manager import ensure_indexes, index_report
+        try:
+            await ensure_indexes()
+            await index_report()
+        except Exception as e:
+            logger.error("Index setup failed", error=str(e))
+
+    from app.services.call_status_buffer import call_status_buffer
+    call_status_buffer.start()
+
+    if settings.TTS_CACHE_ENABLED:
+        from app.services.audio_cache import synthesize_all
+        from app.services.sara_agent import STATIC_PHRASES
+        workers.append(asyncio.create_task(synthesize_all(STATIC_PHRASES)))
+
+    if settings.STATS_REBUILD_ON_STARTUP:
+        # Before serving: the first live $inc would otherwise create a partial global bucket
+        from app.services.stats_service import rebuild_stats
+        try:
+            await rebuild_stats()
+        except Exception as e:
+            logger.error("Stats rebuild failed", error=str(e))
+
+    if settings.STATS_REBUILD_INTERVAL:
+        from app.services.stats_service import stats_worker
+        workers.append(asyncio.create_task(stats_worker()))
+
+    if settings.OPENAI_BATCH_ENABLED:
+        from app.services.batch_service import batch_worker
+        workers.append(asyncio.create_task(batch_worker()))
+
+    yield
+
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    await call_status_buffer.stop()
+
+    from app.services.transcription_service import shutdown_transcription_backend
+    shutdown_transcription_backend()
+
+    Database.close()
+    shutdown_tracing()
+
+
 app = FastAPI(
     title="TruFindAI API",
     description="AI-powered website analysis and sales automation",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
-print("✅ App created")
 
-print("\n5. Adding middleware...")
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -79,9 +150,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-print("✅ Middleware added")
 
-print("\n6. Creating base routes...")
+# Server span per request (pass-through until setup_tracing runs)
+app.add_middleware(TracingMiddleware)
+# Per-request profiles (X-Profile + X-Admin-Key) and route tags while sampling
+app.add_middleware(ProfilerMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -97,12 +171,22 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "environment": settings.ENVIRONMENT
+        "environment": settings.ENVIRONMENT,
+        "mongodb_pool": Database.pool_listener.snapshot(),
+        "log_records_dropped": logger.dropped
     }
 
-print("✅ Base routes created")
+if settings.METRICS_ENABLED:
+    from fastapi import Response
+    from app.services.metrics import PROMETHEUS_AVAILABLE, render_metrics
 
-print("\n7. Including routers...")
+    if PROMETHEUS_AVAILABLE:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            body, content_type = render_metrics()
+            return Response(content=body, headers={"Content-Type": content_type})
+    else:
+        logger.warning("prometheus_client not installed, /metrics disabled")
 
 if analysis_router:
     app.include_router(
@@ -110,7 +194,6 @@ if analysis_router:
         prefix=f"{settings.API_V1_PREFIX}/analysis",
         tags=["Analysis"]
     )
-    print("✅ Analysis router included")
 
 if sara_router:
     app.include_router(
@@ -118,7 +201,6 @@ if sara_router:
         prefix=f"{settings.API_V1_PREFIX}/sara",
         tags=["Sara Agent"]
     )
-    print("✅ Sara router included")
 
 if history_router:
     app.include_router(
@@ -126,7 +208,6 @@ if history_router:
         prefix=f"{settings.API_V1_PREFIX}/history",
         tags=["History"]
     )
-    print("✅ History router included")
 
 if recordings_router:
     app.include_router(
@@ -134,7 +215,6 @@ if recordings_router:
         prefix=f"{settings.API_V1_PREFIX}/recordings",
         tags=["Recordings"]
     )
-    print("✅ Recordings router included")
 
 if webhooks_router:
     app.include_router(
@@ -142,11 +222,22 @@ if webhooks_router:
         prefix=f"{settings.API_V1_PREFIX}/webhooks",
         tags=["Webhooks"]
     )
-    print("✅ Webhooks router included")
 
-print("\n" + "=" * 50)
-print("✅ BACKEND INITIALIZATION COMPLETE!")
-print("=" * 50)
+if audio_router:
+    app.include_router(
+        audio_router,
+        prefix=f"{settings.API_V1_PREFIX}/audio",
+        tags=["Audio"]
+    )
+
+if admin_router:
+    app.include_router(
+        admin_router,
+        prefix=f"{settings.API_V1_PREFIX}/admin",
+        tags=["Admin"]
+    )
+
+logger.info("Backend initialization complete")
 
 if __name__ == "__main__":
     import uvicorn
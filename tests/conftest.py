@@ -0,0 +1,18 @@
+"""
+Test configuration
+
+Settings requires credentials at import time; the tests never reach
+the real services, so placeholders are enough.
+"""
+import os
+
+for name, value in {
+    "MONGODB_URL": "mongodb://localhost:27017",
+    "OPENAI_API_KEY": "sk-test",
+    "TWILIO_ACCOUNT_SID": "ACtest",
+    "TWILIO_AUTH_TOKEN": "test",
+    "TWILIO_PHONE_NUMBER": "+15550000000",
+    "PAGESPEED_API_KEY": "test",
+    "PUBLIC_BASE_URL": "https://test.example",
+}.items():
+    os.environ.setdefault(name, value)
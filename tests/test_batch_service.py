@@ -0,0 +1,108 @@
+"""
+Failed batch requests are retried a bounded number of times, then the call is marked
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.config import Database, get_db, settings
+from app.services import batch_service
+
+
+@pytest.fixture
+def db():
+    Database.client = mongomock_motor.AsyncMongoMockClient()
+    yield get_db()
+    Database.client = None
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def error_line(custom_id: str) -> str:
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": 500, "body": {}},
+        "error": {"message": "server error"}
+    })
+
+
+async def submitted_summary(db) -> str:
+    await db.call_logs.insert_one({"call_sid": "CA1", "summary_status": "pending"})
+    custom_id = await batch_service.enqueue_call_summary("CA1", "Caller: hi")
+    await db.openai_batch_requests.update_one(
+        {"custom_id": custom_id},
+        {"$set": {"status": "submitted", "batch_id": "batch_1"}}
+    )
+    return custom_id
+
+
+async def resubmit(db, custom_id: str):
+    await db.openai_batch_requests.update_one(
+        {"custom_id": custom_id, "status": "queued"},
+        {"$set": {"status": "submitted", "batch_id": "batch_2"}}
+    )
+
+
+def test_failed_line_is_retried_then_marks_summary_failed(db, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_BATCH_MAX_ATTEMPTS", 2)
+
+    async def scenario():
+        custom_id = await submitted_summary(db)
+        first = await batch_service.process_batch_output(db, error_line(custom_id))
+        call_after_first = await db.call_logs.find_one({"call_sid": "CA1"})
+
+        await resubmit(db, custom_id)
+        second = await batch_service.process_batch_output(db, error_line(custom_id))
+        request = await db.openai_batch_requests.find_one({"custom_id": custom_id})
+        return first, call_after_first, second, request, await db.call_logs.find_one({"call_sid": "CA1"})
+
+    first, call_after_first, second, request, call_log = run(scenario())
+    assert first == {"completed": 0, "retried": 1, "failed": 0}
+    assert call_after_first["summary_status"] == "pending"
+    assert second == {"completed": 0, "retried": 0, "failed": 1}
+    assert (request["status"], request["attempts"]) == ("failed", 2)
+    assert call_log["summary_status"] == "failed"
+
+
+def test_failed_batch_marks_summary_failed_on_last_attempt(db, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_BATCH_MAX_ATTEMPTS", 1)
+
+    async def scenario():
+        await submitted_summary(db)
+        counts = await batch_service.retry_or_fail_batch(db, "batch_1", "batch failed")
+        return counts, await db.call_logs.find_one({"call_sid": "CA1"})
+
+    counts, call_log = run(scenario())
+    assert counts == {"retried": 0, "failed": 1}
+    assert call_log["summary_status"] == "failed"
+
+
+def test_stale_submission_claim_is_requeued(db, monkeypatch):
+    async def fail_upload(**kwargs):
+        raise RuntimeError("upload unavailable")
+
+    monkeypatch.setattr(batch_service.client.files, "create", fail_upload)
+
+    async def scenario():
+        custom_id = await batch_service.enqueue_call_summary("CA1", "Caller: hi")
+        await db.openai_batch_requests.update_one(
+            {"custom_id": custom_id},
+            {"$set": {
+                "status": "submitting",
+                "claim": "dead-worker",
+                "claimed_at": datetime.utcnow() - timedelta(seconds=settings.OPENAI_BATCH_CLAIM_TIMEOUT + 1)
+            }}
+        )
+        await batch_service.submit_pending_batches()
+        return await db.openai_batch_requests.find_one({"custom_id": custom_id})
+
+    request = run(scenario())
+    # Re-claimed by this submission, then released again when the upload failed
+    assert request["status"] == "queued"
+    assert "claim" not in request
@@ -0,0 +1,77 @@
+"""
+Tests for the canned-response intent fast path
+"""
+import pytest
+
+from app.models import CallOutcome
+from app.services.intent_service import classify_intent
+
+LEAD = {"business_name": "Acme Plumbing", "ai_visibility_score": 42, "top_issues": ["Missing schema markup"]}
+
+
+def classify(speech, user_turns=2):
+    conversation = [{"role": "assistant", "content": "Hi, this is Sara."}]
+    conversation += [{"role": "user", "content": speech}] * user_turns
+    return classify_intent(speech, conversation, LEAD)
+
+
+@pytest.mark.parametrize("speech,intent", [
+    ("Who is this?", "identity"),
+    ("What company are you with?", "identity"),
+    ("How much is it?", "pricing"),
+    ("How much does it cost?", "pricing"),
+    ("How much do you charge?", "pricing"),
+    ("What's the price?", "pricing"),
+    ("What are your fees?", "pricing"),
+    ("Price?", "pricing"),
+    ("Can you call me back later?", "callback"),
+    ("Call me tomorrow please", "callback"),
+    ("It's not a good time right now", "callback"),
+    ("Sorry, I'm busy", "callback"),
+    ("We're driving right now", "callback"),
+])
+def test_matches_questions_and_requests(speech, intent):
+    result = classify(speech)
+    assert result is not None
+    assert result["intent"] == intent
+
+
+def test_callback_ends_call():
+    result = classify("I'm in a meeting")
+    assert result["end_call"] is True
+    assert result["outcome"] == CallOutcome.CALLBACK_NEEDED
+
+
+@pytest.mark.parametrize("speech", [
+    # Keywords inside statements, objections and negations go to GPT
+    "We are driving plenty of traffic already",
+    "I'm busy running a business, what is this about",
+    "How much longer is this going to take?",
+    "I do not care about the price",
+    "We already pay fees to an agency",
+    "The cost isn't the problem",
+    "Don't call me back",
+    "It's a bad time for the industry",
+    "We are busy enough",
+])
+def test_ignores_statements_and_objections(speech):
+    assert classify(speech) is None
+
+
+def test_affirmative_only_on_first_turn():
+    assert classify("Yes, speaking", user_turns=1)["intent"] == "affirmative"
+    assert classify("Yes, speaking", user_turns=2) is None
+
+
+def test_several_intents_fall_back_to_gpt():
+    assert classify("Who is this and how much is it?") is None
+
+
+def test_repeated_answer_falls_back_to_gpt():
+    first = classify("How much is it?")
+    conversation = [
+        {"role": "user", "content": "How much is it?"},
+        {"role": "assistant", "content": first["response"]},
+        {"role": "user", "content": "How much is it?"},
+    ]
+    assert classify_intent("How much is it?", conversation, LEAD) is None
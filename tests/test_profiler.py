@@ -0,0 +1,62 @@
+"""
+Per-request profiles must attribute CPU burned between awaits to the request
+"""
+import asyncio
+import signal
+import time
+
+import pytest
+
+from app.config import settings
+from app.services import profiler
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, "SIGPROF"), reason="needs SIGPROF")
+
+
+def burn(ms: float) -> int:
+    """Pure-Python CPU work for about ms milliseconds"""
+    deadline = time.process_time() + ms / 1000
+    total = 0
+    while time.process_time() < deadline:
+        total += sum(range(200))
+    return total
+
+
+async def cpu_bound_handler(scope, receive, send):
+    # CPU in short chunks between awaits, like the page parsing of /analysis/deep
+    for chunk_ms in (1, 6) * 30:
+        burn(chunk_ms)
+        await asyncio.sleep(0)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def test_profiled_request_gets_its_cpu_samples(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", "admin-key")
+    monkeypatch.setattr(settings, "PROFILER_INTERVAL_MS", 1.0)
+
+    sent = []
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": f"{settings.API_V1_PREFIX}/analysis/deep",
+        "headers": [(b"x-profile", b"1"), (b"x-admin-key", b"admin-key")]
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(profiler.ProfilerMiddleware(cpu_bound_handler)(scope, receive, send))
+
+    profile_id = int(dict(sent[0]["headers"])[b"x-profile-id"])
+    profile = profiler.get_profile(profile_id)
+
+    assert profile["samples"] > 50
+    stacks = [line for line in profile["folded"].splitlines() if line.startswith("analysis;")]
+    assert stacks
+    assert any(f"{__name__}.burn" in line for line in stacks)
+    assert not profiler.sampler.active
+    assert signal.getitimer(signal.ITIMER_PROF) == (0.0, 0.0)
@@ -0,0 +1,91 @@
+"""
+rebuild_stats writes absolute totals, so repeated or concurrent runs never drift
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from app.config import Database, get_db
+from app.services import stats_service
+
+
+@pytest.fixture
+def db():
+    Database.client = mongomock_motor.AsyncMongoMockClient()
+    yield get_db()
+    Database.client = None
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def seed(db):
+    old = datetime.utcnow() - timedelta(days=3)
+    await db.leads.insert_many([
+        {"created_at": old, "ai_visibility_score": 50, "industry_slug": "dentist", "industry": "Dentist"},
+        {"created_at": datetime.utcnow(), "seo_score": 70},
+        {"name": "legacy lead without created_at"}
+    ])
+    await db.call_logs.insert_many([
+        {"call_sid": "CA1", "created_at": old, "ended_at": old + timedelta(days=1), "status": "completed"},
+        {"call_sid": "CA2", "created_at": datetime.utcnow(), "status": "in-progress"}
+    ])
+
+
+def test_rebuild_is_idempotent_and_counts_live_increments_once(db):
+    async def scenario():
+        await seed(db)
+        await stats_service.rebuild_stats()
+        await stats_service.rebuild_stats()
+
+        lead = {"created_at": datetime.utcnow(), "ai_visibility_score": 30}
+        await db.leads.insert_one(lead)
+        await stats_service.record_lead(lead)
+        await stats_service.rebuild_stats()
+
+        return await db.stats.find_one({"_id": stats_service.GLOBAL_ID})
+
+    overall = run(scenario())
+    assert (overall["leads"], overall["ai_score_sum"], overall["ai_score_count"]) == (4, 80, 2)
+    assert (overall["calls"], overall["completed_calls"]) == (2, 1)
+
+
+def test_rebuild_buckets_completed_calls_by_ended_at_and_drops_stale_buckets(db):
+    async def scenario():
+        await seed(db)
+        await db.stats.insert_one({"_id": "daily:1999-01-01", "kind": "daily", "leads": 4})
+        await stats_service.rebuild_stats()
+        return {bucket["_id"]: bucket for bucket in await db.stats.find({}).to_list(length=None)}
+
+    buckets = run(scenario())
+    ended_day = stats_service.day_key(datetime.utcnow() - timedelta(days=2))
+    assert buckets[f"daily:{ended_day}"]["completed_calls"] == 1
+    assert "daily:1999-01-01" not in buckets
+    assert stats_service.REBUILD_LOCK_ID not in buckets
+
+
+def test_rebuild_skips_while_another_worker_holds_the_claim(db):
+    async def scenario():
+        await seed(db)
+        await db.stats.insert_one({
+            "_id": stats_service.REBUILD_LOCK_ID,
+            "token": "other-worker",
+            "expires_at": datetime.utcnow() + timedelta(minutes=5)
+        })
+        await stats_service.rebuild_stats()
+        skipped = await db.stats.find_one({"_id": stats_service.GLOBAL_ID})
+
+        await db.stats.update_one(
+            {"_id": stats_service.REBUILD_LOCK_ID},
+            {"$set": {"expires_at": datetime.utcnow() - timedelta(seconds=1)}}
+        )
+        await stats_service.rebuild_stats()
+        return skipped, await db.stats.find_one({"_id": stats_service.GLOBAL_ID})
+
+    skipped, overall = run(scenario())
+    assert skipped is None
+    assert overall["leads"] == 3
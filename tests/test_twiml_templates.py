@@ -0,0 +1,53 @@
+"""
+Pre-serialized TwiML templates must match the Twilio SDK byte for byte
+"""
+import pytest
+
+from app.services.twilio_service import (
+    build_end_call,
+    build_voice_response,
+    create_voice_response,
+    end_call
+)
+
+TEXTS = [
+    "Hi, this is Sara from TruFindAI. Do you have a moment?",
+    "Our plans start at $199 setup & $39/month - no contracts.",
+    "Is 5 < 10 and 10 > 5? <Say>not a tag</Say> &amp; already escaped",
+    'She said "great" and it\'s fine',
+    "Line one\nLine two\r\n\ttabbed",
+    "Café, naïve, 日本語, emoji 🙂",
+    "   leading and trailing spaces   ",
+    "__TWIML_TEXT_SLOT__ in the middle of __TWIML_TEXT_SLOT__",
+    "]]> <![CDATA[ x ]]>",
+    "a",
+    "",
+]
+
+AUDIO_URLS = [
+    "https://app.example/api/v1/audio/08dccc71427de32f02f098b3f972e820.mp3",
+    "https://bucket.s3.amazonaws.com/tts/a.mp3?X-Amz-Signature=a&b=\"c\"&d='e'<f>",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("gather_input", [True, False])
+def test_voice_response_matches_sdk(text, gather_input):
+    assert create_voice_response(text, gather_input=gather_input) == build_voice_response(text, gather_input=gather_input)
+
+
+@pytest.mark.parametrize("url", AUDIO_URLS)
+@pytest.mark.parametrize("gather_input", [True, False])
+def test_voice_response_with_audio_matches_sdk(url, gather_input):
+    expected = build_voice_response("", gather_input=gather_input, audio_url=url)
+    assert create_voice_response("", gather_input=gather_input, audio_url=url) == expected
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_end_call_matches_sdk(text):
+    assert end_call(text) == build_end_call(text)
+
+
+@pytest.mark.parametrize("url", AUDIO_URLS)
+def test_end_call_with_audio_matches_sdk(url):
+    assert end_call("Goodbye", audio_url=url) == build_end_call("Goodbye", audio_url=url)
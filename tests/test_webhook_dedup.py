@@ -0,0 +1,53 @@
+"""
+Webhook dedup must merge Twilio retries but never two distinct gather turns
+"""
+import itertools
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.services.webhook_dedup import IDEMPOTENCY_HEADER, idempotent_webhook, webhook_dedup
+
+GATHER_FORM = {"CallSid": "CAtest", "SpeechResult": "yes", "Confidence": "0.9", "CallStatus": "in-progress"}
+
+
+def make_client():
+    webhook_dedup._cache.clear()
+    turns = itertools.count(1)
+    app = FastAPI()
+
+    @app.post("/gather")
+    @idempotent_webhook(require_token=True)
+    async def gather(request: Request):
+        await request.form()
+        return {"turn": next(turns)}
+
+    @app.post("/recording")
+    @idempotent_webhook("CallSid", "RecordingSid")
+    async def recording(request: Request):
+        await request.form()
+        return {"turn": next(turns)}
+
+    return TestClient(app)
+
+
+def test_repeated_answer_without_token_runs_every_turn():
+    client = make_client()
+    first = client.post("/gather", data=GATHER_FORM).json()
+    second = client.post("/gather", data=GATHER_FORM).json()
+    assert (first["turn"], second["turn"]) == (1, 2)
+
+
+def test_retry_with_same_token_is_deduplicated():
+    client = make_client()
+    headers = {IDEMPOTENCY_HEADER: "token-1"}
+    first = client.post("/gather", data=GATHER_FORM, headers=headers).json()
+    retry = client.post("/gather", data=GATHER_FORM, headers=headers).json()
+    other = client.post("/gather", data=GATHER_FORM, headers={IDEMPOTENCY_HEADER: "token-2"}).json()
+    assert (first["turn"], retry["turn"], other["turn"]) == (1, 1, 2)
+
+
+def test_key_fields_still_deduplicate_without_token():
+    client = make_client()
+    form = {"CallSid": "CAtest", "RecordingSid": "REtest"}
+    assert client.post("/recording", data=form).json() == client.post("/recording", data=form).json()